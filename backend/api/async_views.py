@@ -0,0 +1,114 @@
+"""
+Async views for running simulate/compare under ASGI
+
+The request body is parsed and validated on the event loop; the simulation
+itself runs on a bounded executor lane (see api.executor), so the loop stays
+free and oversized workloads are rejected with 429 when their lane is full,
+or 503 when a queued job does not finish within the lane timeout.
+
+DRF's @api_view is synchronous, so these are plain Django async views that
+reuse the spec parsing and runners of api.views and answer with the same
+documents.
+"""
+
+import asyncio
+import json
+
+from django.http import JsonResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from .executor import ExecutorSaturated, get_lanes, lane_for
+from .streaming import streaming_response
+from .timing import metrics, timed
+from .views import (
+    _attach_timings, _include_seek_operations, _parse_compare_spec, _parse_simulation_spec,
+    _run_comparison, _run_simulation, _stream_format,
+)
+
+
+def _json_response(data: dict, status: int = 200, headers: dict = None) -> JsonResponse:
+    return JsonResponse(data, status=status, encoder=JSONEncoder, headers=headers,
+                        json_dumps_params={"separators": (",", ":")})
+
+
+def _parse_body(request):
+    """Decode a JSON request body"""
+    if not request.body:
+        return {}
+    try:
+        return json.loads(request.body)
+    except ValueError as e:
+        raise ValueError(f"JSON parse error - {e}")
+
+
+def _options(request, data) -> dict:
+    """Options from the query string, overridden by fields of a JSON object body"""
+    options = dict(request.GET.items())
+    if isinstance(data, dict):
+        options.update(data)
+    return options
+
+
+def _respond(request, options: dict, response_data: dict):
+    stream_format = _stream_format(request, options)
+    if stream_format:
+        return streaming_response(response_data, stream_format)
+    return _json_response(response_data)
+
+
+def _error_response(error: Exception) -> JsonResponse:
+    """Map an exception to an error response, including executor backpressure"""
+    if isinstance(error, ExecutorSaturated):
+        return _json_response({"detail": str(error)}, status=429,
+                              headers={"Retry-After": str(error.retry_after)})
+    if isinstance(error, asyncio.TimeoutError):
+        return _json_response({"detail": "Simulation did not finish in time, the server is saturated"},
+                              status=503, headers={"Retry-After": "5"})
+    if isinstance(error, ValueError):
+        return _json_response({"detail": str(error)}, status=400)
+    return _json_response({"detail": f"Internal server error: {str(error)}"}, status=500)
+
+
+def _method_not_allowed(request) -> JsonResponse:
+    return _json_response({"detail": f'Method "{request.method}" not allowed.'}, status=405,
+                          headers={"Allow": "POST"})
+
+
+async def _run(request, endpoint: str, parse_spec, run):
+    try:
+        with timed("parse"):
+            data = _parse_body(request)
+        with timed("validate"):
+            spec = parse_spec(data)
+        request_count = len(spec["requests"])
+        metrics.observe_input_size(endpoint, request_count)
+        options = _options(request, data)
+        response_data = await lane_for(request_count).run(run, spec, _include_seek_operations(options))
+        return _respond(request, options, _attach_timings(response_data, options))
+    except Exception as e:
+        return _error_response(e)
+
+
+async def simulate(request):
+    """Async /api/simulate/: same payload and response, computed off the event loop"""
+    if request.method != 'POST':
+        return _method_not_allowed(request)
+    return await _run(request, "async-simulate", _parse_simulation_spec, _run_simulation)
+
+
+async def compare_algorithms(request):
+    """Async /api/compare/: same payload and response, computed off the event loop"""
+    if request.method != 'POST':
+        return _method_not_allowed(request)
+    return await _run(request, "async-compare", _parse_compare_spec, _run_comparison)
+
+
+async def executor_status(request):
+    """Occupancy and rejection counters of the executor lanes"""
+    return _json_response({name: lane.stats() for name, lane in get_lanes().items()})
+
+
+# JSON API like the DRF views: no CSRF token (csrf_exempt cannot wrap async
+# views before Django 5.0, so the flag is set directly)
+simulate.csrf_exempt = True
+compare_algorithms.csrf_exempt = True
@@ -0,0 +1,84 @@
+"""
+Result cache used by the simulate/compare views.
+
+The backend is chosen by DISK_SCHEDULER['RESULT_CACHE'] in settings: an
+in-process LRU (``'local'``), a configured Django cache alias (``'django'``),
+or ``None`` to disable caching.
+"""
+
+from threading import Lock
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from app.algorithms.cache import ResultCache
+
+
+class DjangoResultCache:
+    """Result cache stored in a Django cache backend (shared between processes)"""
+
+    key_prefix = "disk-scheduler:result:"
+
+    def __init__(self, alias: str = "default", ttl: Optional[float] = 300):
+        self.alias = alias
+        self.ttl = ttl
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[dict]:
+        value = self.backend.get(self.key_prefix + key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: dict):
+        self.backend.set(self.key_prefix + key, value, timeout=self.ttl)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "django",
+                "alias": self.alias,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_result_cache = None
+_result_cache_lock = Lock()
+
+
+def get_result_cache():
+    """Return the configured result cache, or None when caching is disabled"""
+    global _result_cache
+    config = getattr(settings, 'DISK_SCHEDULER', {}).get('RESULT_CACHE') or {}
+    backend = config.get('BACKEND')
+    if not backend:
+        return None
+    with _result_cache_lock:
+        if _result_cache is None:
+            if backend == 'django':
+                _result_cache = DjangoResultCache(
+                    alias=config.get('ALIAS', 'default'),
+                    ttl=config.get('TTL', 300)
+                )
+            elif backend == 'local':
+                _result_cache = ResultCache(
+                    max_entries=config.get('MAX_ENTRIES', 256),
+                    ttl=config.get('TTL', 300)
+                )
+            else:
+                raise ValueError(f"Unknown result cache backend '{backend}'")
+        return _result_cache
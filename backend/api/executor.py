@@ -0,0 +1,129 @@
+"""
+Bounded executors for the async API views.
+
+Simulations are CPU-bound, so the async views run them off the event loop.
+Work is split into two lanes by input size, each a thread pool with a
+limited number of queued jobs: huge traces can only occupy the "large" lane,
+so small interactive requests keep flowing through the "small" one. When a
+lane is full, submissions are rejected right away (the view answers 429)
+instead of piling up behind the running work.
+
+Configured by DISK_SCHEDULER['ASYNC'] in settings.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
+
+from django.conf import settings
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a lane has no free worker or queue slot"""
+
+    def __init__(self, lane: str, retry_after: int = 1):
+        super().__init__(f"The {lane} simulation queue is full, retry later")
+        self.lane = lane
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """Thread pool that accepts at most workers + max_queue outstanding jobs"""
+
+    def __init__(self, name: str, workers: int, max_queue: int, timeout: Optional[float] = None):
+        """
+        Args:
+            name: Lane name used in errors and stats
+            workers: Jobs that run concurrently
+            max_queue: Jobs that may wait for a worker before submissions are rejected
+            timeout: Seconds a caller waits for its result (None waits forever)
+        """
+        self.name = name
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"disk-scheduler-{name}")
+        self._lock = Lock()
+        self.outstanding = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _release(self, future):
+        with self._lock:
+            self.outstanding -= 1
+            self.completed += 1
+
+    async def run(self, fn, *args):
+        """
+        Run fn(*args) on the lane and await its result
+
+        The caller's context variables (e.g. the request's phase timer) are
+        visible to fn.
+
+        Raises:
+            ExecutorSaturated: If the lane is full
+            asyncio.TimeoutError: If the result is not ready within timeout
+        """
+        with self._lock:
+            if self.outstanding >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorSaturated(self.name)
+            self.outstanding += 1
+        try:
+            future = self._executor.submit(contextvars.copy_context().run, fn, *args)
+        except BaseException:
+            with self._lock:
+                self.outstanding -= 1
+            raise
+        # The slot is freed when the job actually ends, even if the caller gave up
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "timeout": self.timeout,
+                "outstanding": self.outstanding,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+            }
+
+
+_lanes = None
+_lanes_lock = Lock()
+
+
+def _config() -> dict:
+    return getattr(settings, 'DISK_SCHEDULER', {}).get('ASYNC') or {}
+
+
+def get_lanes() -> dict:
+    """The small and large lanes, created from settings on first use"""
+    global _lanes
+    with _lanes_lock:
+        if _lanes is None:
+            config = _config()
+            timeout = config.get('TIMEOUT', 60)
+            _lanes = {
+                "small": BoundedExecutor("small", config.get('SMALL_WORKERS', 4), config.get('SMALL_QUEUE', 64), timeout),
+                "large": BoundedExecutor("large", config.get('LARGE_WORKERS', 1), config.get('LARGE_QUEUE', 2), timeout),
+            }
+        return _lanes
+
+
+def lane_for(request_count: int) -> BoundedExecutor:
+    """Lane for a workload of request_count track requests"""
+    threshold = _config().get('LARGE_REQUEST_THRESHOLD', 100000)
+    return get_lanes()["large" if request_count >= threshold else "small"]
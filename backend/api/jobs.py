@@ -0,0 +1,304 @@
+"""
+Background jobs for simulations too large to compute within one HTTP request.
+
+A job is submitted with a validated simulate/compare spec and runs on a local
+thread pool. Its metadata (status, timestamps, error) and its result document
+are written to DISK_SCHEDULER['JOBS']['DIRECTORY'] as JSON files, so finished
+jobs survive a restart; live progress is kept in memory and reported by the
+algorithms through DiskScheduler's progress callback. Jobs and their results
+are deleted TTL seconds after they finish.
+
+Several worker processes may share the directory. Each job records its owner
+(host, pid and a per-process token) and the owner rewrites the metadata of its
+unfinished jobs every HEARTBEAT seconds, with their progress. Any process can
+then answer a status poll; a job is only reported as interrupted when its
+owner's heartbeat has gone stale or its pid is no longer running on this host.
+"""
+
+import json
+import os
+import re
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Callable, Optional
+
+from django.conf import settings
+
+from .streaming import iter_json
+
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+# Heartbeats an owner may miss before its unfinished jobs count as interrupted
+HEARTBEAT_MISSES = 6
+
+
+def _pid_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        # Exists but belongs to someone else, or cannot be checked
+        return True
+    return True
+
+
+class JobQueueFull(Exception):
+    """Raised when too many jobs are queued or running"""
+
+
+class JobStore:
+    """File-backed job registry with a worker pool"""
+
+    def __init__(self, directory, workers: int = 2, max_pending: int = 100, ttl: Optional[float] = 86400,
+                 heartbeat: float = 5.0):
+        """
+        Args:
+            directory: Where job metadata and results are stored
+            workers: Jobs that run concurrently
+            max_pending: Maximum number of queued plus running jobs
+            ttl: Seconds a finished job is kept (None keeps it until deleted)
+            heartbeat: Seconds between metadata refreshes of unfinished jobs;
+                other processes treat a job as interrupted after
+                HEARTBEAT_MISSES refreshes are missed
+        """
+        if heartbeat <= 0:
+            raise ValueError("heartbeat must be positive")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.heartbeat = heartbeat
+        self.owner = {"host": socket.gethostname(), "pid": os.getpid(), "token": uuid.uuid4().hex}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="disk-scheduler-job")
+        self._lock = Lock()
+        # Serializes metadata writes, so a heartbeat never replaces a newer state
+        self._write_lock = Lock()
+        # Jobs of this process that have not finished: id -> (metadata, future)
+        self._active = {}
+        self._heartbeat_thread = None
+        self._stopped = Event()
+
+    def _metadata_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def result_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.result.json"
+
+    def _write_metadata(self, job: dict):
+        path = self._metadata_path(job["id"])
+        temporary = path.with_suffix(".tmp")
+        with self._write_lock:
+            if job["status"] not in TERMINAL_STATUSES:
+                job["heartbeat_at"] = time.time()
+            with open(temporary, "w") as f:
+                json.dump(job, f)
+            os.replace(temporary, path)
+
+    def _beat(self):
+        """Refresh the metadata of this process's unfinished jobs until close()"""
+        while not self._stopped.wait(self.heartbeat):
+            with self._lock:
+                jobs = [job for job, _ in self._active.values()]
+            for job in jobs:
+                if job["status"] not in TERMINAL_STATUSES:
+                    self._write_metadata(job)
+
+    def _owner_alive(self, job: dict) -> bool:
+        """Whether the process that owns an unfinished job (read from disk) is still running it"""
+        owner = job.get("owner") or {}
+        if owner.get("token") == self.owner["token"]:
+            # Ours, but no longer active here
+            return False
+        heartbeat_at = job.get("heartbeat_at")
+        if heartbeat_at is None or time.time() - heartbeat_at > HEARTBEAT_MISSES * self.heartbeat:
+            return False
+        if owner.get("host") == self.owner["host"] and isinstance(owner.get("pid"), int):
+            return _pid_running(owner["pid"])
+        return True
+
+    def _write_result(self, job_id: str, document: dict):
+        path = self.result_path(job_id)
+        temporary = path.with_suffix(".tmp")
+        with open(temporary, "w") as f:
+            for chunk in iter_json(document):
+                f.write(chunk)
+        os.replace(temporary, path)
+
+    def submit(self, mode: str, run: Callable[[Callable[[float], None]], dict]) -> dict:
+        """
+        Queue a job
+
+        Args:
+            mode: Job kind reported in the status ("simulate" or "compare")
+            run: Callable taking a progress callback (fraction 0-1) and
+                returning the response document
+
+        Returns:
+            Job status dict
+
+        Raises:
+            JobQueueFull: When max_pending jobs are already queued or running
+        """
+        self.purge_expired()
+        job = {
+            "id": uuid.uuid4().hex,
+            "mode": mode,
+            "status": "queued",
+            "progress": 0.0,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "expires_at": None,
+            "error": None,
+            "owner": self.owner,
+            "heartbeat_at": None,
+        }
+        with self._lock:
+            if len(self._active) >= self.max_pending:
+                raise JobQueueFull(f"Too many pending jobs (limit {self.max_pending}), retry later")
+            self._write_metadata(job)
+            future = self._executor.submit(self._execute, job, run)
+            self._active[job["id"]] = (job, future)
+            if self._heartbeat_thread is None:
+                self._heartbeat_thread = Thread(target=self._beat, name="disk-scheduler-job-heartbeat", daemon=True)
+                self._heartbeat_thread.start()
+        return dict(job)
+
+    def _execute(self, job: dict, run):
+        def progress(fraction: float):
+            job["progress"] = round(min(max(fraction, 0.0), 1.0), 4)
+
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        self._write_metadata(job)
+        try:
+            self._write_result(job["id"], run(progress))
+            job["status"] = "succeeded"
+            job["progress"] = 1.0
+        except Exception as e:
+            job["status"] = "failed"
+            job["error"] = str(e)
+        self._finish(job)
+
+    def _finish(self, job: dict):
+        job["finished_at"] = time.time()
+        job["expires_at"] = job["finished_at"] + self.ttl if self.ttl is not None else None
+        self._write_metadata(job)
+        with self._lock:
+            self._active.pop(job["id"], None)
+
+    def _read_metadata(self, job_id: str) -> Optional[dict]:
+        try:
+            with open(self._metadata_path(job_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Status of a job, or None if it does not exist or has expired"""
+        if not _JOB_ID.match(job_id):
+            return None
+        with self._lock:
+            active = self._active.get(job_id)
+            if active is not None:
+                return dict(active[0])
+        job = self._read_metadata(job_id)
+        if job is None:
+            return None
+        if job.get("expires_at") is not None and job["expires_at"] <= time.time():
+            self.delete(job_id)
+            return None
+        if job["status"] not in TERMINAL_STATUSES:
+            if self._owner_alive(job):
+                # Queued or running in another worker process
+                return job
+            job.update(status="failed", error="Job was interrupted: the process running it stopped")
+            self._finish(job)
+        job["progress"] = 1.0 if job["status"] == "succeeded" else 0.0
+        return job
+
+    def delete(self, job_id: str) -> bool:
+        """
+        Cancel a queued job or forget a finished one (running jobs, and jobs
+        owned by another live process, cannot be stopped)
+        """
+        if not _JOB_ID.match(job_id):
+            return False
+        with self._lock:
+            active = self._active.get(job_id)
+            if active is not None:
+                job, future = active
+                if not future.cancel():
+                    return False
+                del self._active[job_id]
+        if active is None:
+            job = self._read_metadata(job_id)
+            if job is not None and job["status"] not in TERMINAL_STATUSES and self._owner_alive(job):
+                return False
+        existed = False
+        for path in (self._metadata_path(job_id), self.result_path(job_id)):
+            try:
+                path.unlink()
+                existed = True
+            except FileNotFoundError:
+                pass
+        return existed
+
+    def purge_expired(self):
+        """Delete finished jobs whose TTL has passed"""
+        now = time.time()
+        for path in self.directory.glob("*.json"):
+            job_id = path.name.split(".", 1)[0]
+            if path.name != f"{job_id}.json":
+                continue
+            try:
+                with open(path) as f:
+                    expires_at = json.load(f).get("expires_at")
+            except (OSError, ValueError):
+                continue
+            if expires_at is not None and expires_at <= now:
+                self.delete(job_id)
+
+    def close(self):
+        """Stop the heartbeat and the worker pool, waiting for running jobs"""
+        self._stopped.set()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            statuses = [job["status"] for job, _ in self._active.values()]
+        return {
+            "queued": statuses.count("queued"),
+            "running": statuses.count("running"),
+            "max_pending": self.max_pending,
+            "ttl": self.ttl,
+        }
+
+
+_job_store = None
+_job_store_lock = Lock()
+
+
+def get_job_store() -> JobStore:
+    """Return the job store configured by DISK_SCHEDULER['JOBS']"""
+    global _job_store
+    with _job_store_lock:
+        # A forked worker gets its own store (and owner), not its parent's
+        if _job_store is None or _job_store.owner["pid"] != os.getpid():
+            config = getattr(settings, 'DISK_SCHEDULER', {}).get('JOBS') or {}
+            _job_store = JobStore(
+                directory=config.get('DIRECTORY', Path(settings.BASE_DIR) / 'job_store'),
+                workers=config.get('WORKERS', 2),
+                max_pending=config.get('MAX_PENDING', 100),
+                ttl=config.get('TTL', 86400),
+                heartbeat=config.get('HEARTBEAT', 5.0),
+            )
+        return _job_store
@@ -0,0 +1,71 @@
+"""
+Middleware for the API
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .timing import metrics, start_timer, stop_timer
+
+
+class TimingMiddleware:
+    """
+    Times every request and reports its phases in a Server-Timing header
+
+    Views record their own phases through api.timing.timed(); rendering is
+    measured from process_template_response (called right before DRF renders
+    the response) to the end of the request. The request count and latency are
+    recorded per URL name in the /api/metrics/ registry.
+
+    Disable the header with DISK_SCHEDULER['SERVER_TIMING'] = False.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self._acall(request)
+        timer, token = start_timer()
+        request._phase_timer = timer
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_timer(token)
+        return self._finish(request, response, timer)
+
+    async def _acall(self, request):
+        timer, token = start_timer()
+        request._phase_timer = timer
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_timer(token)
+        return self._finish(request, response, timer)
+
+    def process_template_response(self, request, response):
+        request._render_started = time.perf_counter()
+        return response
+
+    def _finish(self, request, response, timer):
+        render_started = getattr(request, "_render_started", None)
+        if render_started is not None:
+            timer.add("render", time.perf_counter() - render_started)
+        total = timer.elapsed()
+        timer.add("total", total)
+
+        match = getattr(request, "resolver_match", None)
+        endpoint = match.url_name if match is not None and match.url_name else "unmatched"
+        metrics.observe_request(endpoint, response.status_code, total)
+
+        if getattr(settings, 'DISK_SCHEDULER', {}).get('SERVER_TIMING', True):
+            response["Server-Timing"] = timer.server_timing()
+        return response
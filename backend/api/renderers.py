@@ -0,0 +1,31 @@
+"""
+Additional response renderers for the API
+"""
+
+from rest_framework.renderers import BaseRenderer
+
+from .streaming import iter_ndjson, ndjson_line
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renders a response document as newline-delimited JSON records
+
+    Streaming views answer Accept: application/x-ndjson with a
+    StreamingHttpResponse themselves; this renderer lets DRF's content
+    negotiation accept that header and covers the responses that still go
+    through Response (errors), using the same record layout.
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, dict):
+            records = iter_ndjson(data)
+        else:
+            records = (ndjson_line(record) for record in data)
+        return ''.join(records).encode(self.charset)
@@ -0,0 +1,192 @@
+"""
+Streaming serialization for large simulate/compare responses.
+
+Rendering a multi-million entry result with DRF's JSONRenderer builds the whole
+document as one string. These generators emit the same data incrementally so a
+StreamingHttpResponse can send it without that extra copy. The document itself
+is computed before the first byte is sent (the header record carries fields
+such as best_algorithm that depend on every result), so streaming bounds
+serialization memory, not time to first byte; /api/batch streams one record
+per item as each finishes.
+"""
+
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# Number of array elements serialized per chunk
+CHUNK_SIZE = 8192
+
+# Approximate number of characters buffered before a chunk is handed to the server
+FLUSH_SIZE = 64 * 1024
+
+STREAM_FORMATS = ("json", "ndjson")
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, cls=JSONEncoder, separators=(",", ":"))
+
+
+def ndjson_line(record) -> str:
+    """One NDJSON record, newline included"""
+    return _dumps(record) + "\n"
+
+
+def _is_array(value) -> bool:
+    """Arrays are any non-string, non-mapping iterables (lists, SeekOperations, NumPy arrays)"""
+    return not isinstance(value, (str, bytes, dict)) and hasattr(value, "__iter__")
+
+
+def _encode_item(item) -> str:
+    if type(item) is int:
+        return str(item)
+    if isinstance(item, dict) or _is_array(item):
+        return "".join(iter_json(item))
+    return _dumps(item)
+
+
+def _iter_json_array(values):
+    yield "["
+    buffer = []
+    separator = ""
+    for item in values:
+        buffer.append(_encode_item(item))
+        if len(buffer) >= CHUNK_SIZE:
+            yield separator + ",".join(buffer)
+            separator = ","
+            buffer = []
+    if buffer:
+        yield separator + ",".join(buffer)
+    yield "]"
+
+
+def iter_json(value):
+    """
+    Serialize a response document as a stream of JSON text fragments
+
+    Args:
+        value: Document to serialize; arrays are emitted CHUNK_SIZE elements at a time
+
+    Yields:
+        JSON text fragments whose concatenation is the full document
+    """
+    if isinstance(value, dict):
+        yield "{"
+        for index, (key, item) in enumerate(value.items()):
+            yield ("," if index else "") + _dumps(str(key)) + ":"
+            yield from iter_json(item)
+        yield "}"
+    elif _is_array(value):
+        yield from _iter_json_array(value)
+    else:
+        yield _dumps(value)
+
+
+def _partition(document: dict, prefix: str = ""):
+    """Split a document into its scalar fields and a list of (path, array) pairs"""
+    scalars = {}
+    arrays = []
+    for key, value in document.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            nested_scalars, nested_arrays = _partition(value, path + ".")
+            scalars[key] = nested_scalars
+            arrays.extend(nested_arrays)
+        elif _is_array(value):
+            arrays.append((path, value))
+        else:
+            scalars[key] = value
+    return scalars, arrays
+
+
+def _iter_ndjson_array(path: str, values):
+    chunk = []
+    offset = 0
+    for index, item in enumerate(values):
+        if isinstance(item, dict):
+            # Arrays of objects (e.g. compare results) become one record per object
+            if chunk:
+                yield _dumps({"type": "chunk", "field": path, "offset": offset, "values": chunk}) + "\n"
+                chunk = []
+            scalars, arrays = _partition(item)
+            yield _dumps({"type": "item", "field": path, "index": index, **scalars}) + "\n"
+            for nested_path, nested_values in arrays:
+                yield from _iter_ndjson_array(f"{path}[{index}].{nested_path}", nested_values)
+            offset = index + 1
+            continue
+        chunk.append(item)
+        if len(chunk) >= CHUNK_SIZE:
+            yield _dumps({"type": "chunk", "field": path, "offset": offset, "values": chunk}) + "\n"
+            offset = index + 1
+            chunk = []
+    if chunk:
+        yield _dumps({"type": "chunk", "field": path, "offset": offset, "values": chunk}) + "\n"
+
+
+def iter_ndjson(document: dict):
+    """
+    Serialize a response document as newline-delimited JSON records
+
+    The first record ({"type": "header"}) carries every scalar field. Each array
+    follows as {"type": "chunk", "field": <dotted path>, "offset": n, "values": [...]}
+    records; arrays of objects produce one {"type": "item"} record per object.
+    A final {"type": "end"} record marks a complete response.
+    """
+    scalars, arrays = _partition(document)
+    yield _dumps({"type": "header", **scalars}) + "\n"
+    for path, values in arrays:
+        yield from _iter_ndjson_array(path, values)
+    yield _dumps({"type": "end"}) + "\n"
+
+
+def _coalesce(fragments):
+    """Group small fragments into larger writes"""
+    buffer = []
+    size = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= FLUSH_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def streaming_response(document: dict, stream_format: str, status: int = 200) -> StreamingHttpResponse:
+    """
+    Build a StreamingHttpResponse for a response document
+
+    Args:
+        document: Response document (same shape as the non-streaming response)
+        stream_format: "json" for a chunked JSON document, "ndjson" for records
+        status: HTTP status code
+    """
+    if stream_format == "ndjson":
+        return StreamingHttpResponse(
+            _coalesce(iter_ndjson(document)),
+            content_type="application/x-ndjson",
+            status=status,
+        )
+    return StreamingHttpResponse(
+        _coalesce(iter_json(document)),
+        content_type="application/json",
+        status=status,
+    )
+
+
+def ndjson_response(records, status: int = 200) -> StreamingHttpResponse:
+    """
+    Stream an iterable of records as NDJSON, one line per record
+
+    Records are serialized as they are produced, without coalescing, so each
+    one reaches the client as soon as it is ready.
+    """
+    return StreamingHttpResponse(
+        (ndjson_line(record) for record in records),
+        content_type="application/x-ndjson",
+        status=status,
+    )
@@ -0,0 +1,40 @@
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from app.algorithms.registry import AlgorithmSpec, registry
+
+
+def reverse(scheduler, direction, n_step):
+    sequence = sorted(scheduler.request_list(), reverse=True)
+    return (sequence, *scheduler.calculate_seek_time(sequence))
+
+
+class AlgorithmsAPITest(SimpleTestCase):
+    def simulate(self, **body):
+        body = {"requests": [98, 183, 37], "initial_position": 53, **body}
+        return self.client.post("/api/simulate/", data=json.dumps(body), content_type="application/json")
+
+    def test_lists_the_registry(self):
+        algorithms = self.client.get("/api/algorithms/").json()["algorithms"]
+        self.assertEqual([a["name"] for a in algorithms], list(registry.names()))
+        n_step = next(a for a in algorithms if a["name"] == "N-STEP SCAN")
+        self.assertTrue(n_step["requires_n_step"])
+        self.assertIn("batch_scan", n_step["capabilities"])
+
+    def test_registered_algorithm_is_served(self):
+        with mock.patch.multiple(registry, _specs=dict(registry._specs), _lookup=dict(registry._lookup)):
+            registry.register(AlgorithmSpec("REV", reverse, description="Highest track first"))
+            names = [a["name"] for a in self.client.get("/api/algorithms/").json()["algorithms"]]
+            self.assertIn("REV", names)
+            response = self.simulate(algorithm="rev")
+            self.assertEqual(response.status_code, 200, response.content)
+            self.assertEqual(response.json()["result"]["sequence"], [183, 98, 37])
+
+    def test_unknown_algorithm_and_engine(self):
+        response = self.simulate(algorithm="NOPE")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Unknown algorithm 'NOPE'", response.json()["detail"])
+        self.assertEqual(self.simulate(algorithm="SSTF", engine="nope").status_code, 400)
+        self.assertEqual(self.simulate(algorithm="N-STEP SCAN").status_code, 400)
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import time
+from threading import Event
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api import async_views, executor
+from api.executor import BoundedExecutor, ExecutorSaturated, lane_for
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class BoundedExecutorTest(SimpleTestCase):
+    def lane(self, **kwargs) -> BoundedExecutor:
+        lane = BoundedExecutor("test", **kwargs)
+        release = Event()
+        self.addCleanup(lane._executor.shutdown)
+        self.addCleanup(release.set)
+        self.release = release
+        return lane
+
+    async def test_full_lane_rejects(self):
+        lane = self.lane(workers=1, max_queue=1)
+        running = [asyncio.ensure_future(lane.run(self.release.wait, 10)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with self.assertRaises(ExecutorSaturated):
+            await lane.run(time.sleep, 0)
+        self.release.set()
+        await asyncio.gather(*running)
+        self.assertEqual(await lane.run(sum, [1, 2]), 3)
+        stats = lane.stats()
+        self.assertEqual((stats["outstanding"], stats["completed"], stats["rejected"]), (0, 3, 1))
+
+    async def test_timeout(self):
+        lane = self.lane(workers=1, max_queue=0, timeout=0.05)
+        with self.assertRaises(asyncio.TimeoutError):
+            await lane.run(self.release.wait, 10)
+        self.assertEqual(lane.stats()["timeouts"], 1)
+        # The slot stays taken until the job really ends
+        self.assertEqual(lane.stats()["outstanding"], 1)
+
+    @override_settings(DISK_SCHEDULER={"ASYNC": {"LARGE_REQUEST_THRESHOLD": 5}})
+    def test_lane_by_size(self):
+        self.assertEqual(lane_for(4).name, "small")
+        self.assertEqual(lane_for(5).name, "large")
+
+
+class AsyncAPITest(SimpleTestCase):
+    async def post(self, url, **body):
+        return await self.async_client.post(url, data=json.dumps(body), content_type="application/json")
+
+    async def test_simulate_matches_sync_view(self):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF"}
+        response = await self.post("/api/async/simulate/", **body)
+        self.assertEqual(response.status_code, 200, response.content)
+        expected = self.client.post("/api/simulate/", data=json.dumps(body), content_type="application/json")
+        self.assertEqual(response.json()["result"], expected.json()["result"])
+
+    async def test_compare(self):
+        response = await self.post("/api/async/compare/", requests=REQUESTS, initial_position=53)
+        self.assertEqual(response.status_code, 200, response.content)
+        results = {r["algorithm"]: r for r in response.json()["results"]}
+        self.assertEqual(results["SSTF"]["total_seek_time"], 236)
+
+    async def test_errors(self):
+        response = await self.async_client.get("/api/async/simulate/")
+        self.assertEqual((response.status_code, response["Allow"]), (405, "POST"))
+        self.assertEqual((await self.post("/api/async/simulate/", requests=[1])).status_code, 400)
+        response = await self.async_client.post("/api/async/compare/", data="{", content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+    async def test_saturated_lane_answers_429(self):
+        lane = BoundedExecutor("small", workers=1, max_queue=0)
+        self.addCleanup(lane._executor.shutdown)
+        lane.outstanding = 1
+        with mock.patch.object(async_views, "lane_for", return_value=lane):
+            response = await self.post("/api/async/simulate/", requests=REQUESTS, initial_position=53,
+                                       algorithm="SSTF")
+        self.assertEqual((response.status_code, response["Retry-After"]), (429, "1"))
+
+    async def test_timeout_answers_503(self):
+        lane = mock.Mock()
+        lane.run = mock.AsyncMock(side_effect=asyncio.TimeoutError)
+        with mock.patch.object(async_views, "lane_for", return_value=lane):
+            response = await self.post("/api/async/compare/", requests=REQUESTS, initial_position=53)
+        self.assertEqual(response.status_code, 503)
+
+    async def test_status(self):
+        response = await self.async_client.get("/api/async/")
+        self.assertEqual(set(response.json()), set(executor.get_lanes()))
@@ -0,0 +1,65 @@
+import json
+
+from django.test import SimpleTestCase, override_settings
+
+from api.parsers import NDJSONParser
+from rest_framework.exceptions import ParseError
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+SIMULATE = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF"}
+COMPARE = {"requests": REQUESTS, "initial_position": 53}
+
+
+class BatchTest(SimpleTestCase):
+    def post(self, body, content_type="application/json", **extra):
+        data = body if isinstance(body, str) else json.dumps(body)
+        return self.client.post("/api/batch/", data=data, content_type=content_type, **extra)
+
+    def test_mixed_items_in_order(self):
+        response = self.post([SIMULATE, COMPARE, {**COMPARE, "mode": "optimize"}])
+        self.assertEqual(response.status_code, 200)
+        document = response.json()
+        self.assertEqual((document["count"], document["succeeded"]), (3, 3))
+        self.assertEqual([item["mode"] for item in document["results"]], ["simulate", "compare", "optimize"])
+        self.assertEqual(document["results"][0]["response"]["result"]["total_seek_time"], 236)
+
+    def test_bad_items_do_not_fail_the_batch(self):
+        document = self.post({"items": [SIMULATE, {"requests": []}, 7, {**SIMULATE, "mode": "nope"}]}).json()
+        self.assertEqual(document["succeeded"], 1)
+        self.assertEqual([item["status"] for item in document["results"]], [200, 400, 400, 400])
+        self.assertEqual([item["index"] for item in document["results"]], [0, 1, 2, 3])
+
+    def test_top_level_options_apply_to_every_item(self):
+        document = self.post({"items": [SIMULATE, {**SIMULATE, "response_format": "full"}],
+                              "response_format": "compact"}).json()
+        results = [item["response"]["result"] for item in document["results"]]
+        self.assertNotIn("seek_operations", results[0])
+        self.assertIn("seek_operations", results[1])
+
+    def test_ndjson_body(self):
+        body = "\n".join(json.dumps(item) for item in (SIMULATE, COMPARE)) + "\n\n"
+        document = self.post(body, content_type="application/x-ndjson").json()
+        self.assertEqual(document["succeeded"], 2)
+
+    def test_stream_option(self):
+        response = self.post({"items": [SIMULATE, COMPARE], "stream": "ndjson"})
+        records = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([record["index"] for record in records], [0, 1])
+
+    def test_empty_and_oversized_batches(self):
+        self.assertEqual(self.post([]).status_code, 400)
+        with override_settings(DISK_SCHEDULER={"BATCH_MAX_ITEMS": 2}):
+            self.assertEqual(self.post([SIMULATE] * 3).status_code, 400)
+
+
+class NDJSONParserTest(SimpleTestCase):
+    def parse(self, text: str):
+        return NDJSONParser().parse(iter(text.encode().splitlines(keepends=True)))
+
+    def test_one_item_per_non_empty_line(self):
+        self.assertEqual(self.parse('{"a": 1}\n\n  \n[2]\n'), [{"a": 1}, [2]])
+
+    def test_reports_the_bad_line(self):
+        with self.assertRaisesRegex(ParseError, "line 2"):
+            self.parse('{"a": 1}\n{oops\n')
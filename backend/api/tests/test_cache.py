@@ -0,0 +1,46 @@
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api import cache
+from app.algorithms.cache import ResultCache
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class ResultCacheAPITest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(cache, "_result_cache", ResultCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, url, **body):
+        body = {"requests": REQUESTS, "initial_position": 53, **body}
+        response = self.client.post(url, data=json.dumps(body), content_type="application/json")
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def stats(self):
+        return self.client.get("/api/cache/").json()["stats"]
+
+    def test_repeated_simulation_is_a_hit(self):
+        first = self.post("/api/simulate/", algorithm="SSTF", include_seek_operations=False)
+        second = self.post("/api/simulate/", algorithm="SSTF")
+        self.assertEqual((self.stats()["hits"], self.stats()["misses"]), (1, 1))
+        self.assertEqual(second["result"]["sequence"], first["result"]["sequence"])
+        # A compact response earlier does not strip the cached seek operations
+        self.assertEqual(len(second["result"]["seek_operations"]), len(REQUESTS))
+
+    def test_compare_reuses_simulate_results(self):
+        self.post("/api/simulate/", algorithm="FCFS", direction="left")
+        document = self.post("/api/compare/")
+        self.assertEqual(self.stats()["hits"], 1)
+        self.assertEqual(self.post("/api/compare/")["results"], document["results"])
+        self.assertEqual(self.stats()["hits"], 1 + len(document["results"]))
+
+    def test_different_inputs_miss(self):
+        self.post("/api/simulate/", algorithm="LOOK", direction="left")
+        self.post("/api/simulate/", algorithm="LOOK", direction="right")
+        self.assertEqual(self.stats()["hits"], 0)
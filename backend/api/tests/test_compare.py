@@ -0,0 +1,45 @@
+import json
+
+from django.test import SimpleTestCase, override_settings
+
+from app.algorithms.parallel import shutdown_executor
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class CompareTestCase(SimpleTestCase):
+    def compare(self, **body):
+        body = {"requests": REQUESTS, "initial_position": 53, **body}
+        response = self.client.post("/api/compare/", data=json.dumps(body), content_type="application/json")
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+
+class OptimalBoundTest(CompareTestCase):
+    def test_small_inputs_get_the_exact_wait(self):
+        document = self.compare()
+        self.assertEqual(document["optimal"]["wait_bound"], "exact")
+        self.assertEqual(document["optimal"]["total_seek_time"], 208)
+        for result in document["results"]:
+            self.assertGreaterEqual(result["gap_to_optimal"]["wait_pct"], 0)
+
+    @override_settings(DISK_SCHEDULER={"COMPARE_OPTIMAL_WAIT_TRACKS": 4, "RESULT_CACHE": None})
+    def test_exact_wait_is_opt_in_above_the_automatic_limit(self):
+        self.assertEqual(self.compare()["optimal"]["wait_bound"], "lower_bound")
+        self.assertEqual(self.compare(optimal_wait=True)["optimal"]["wait_bound"], "exact")
+
+
+class ParallelCompareTest(CompareTestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+        super().tearDownClass()
+
+    def test_pool_matches_serial(self):
+        with override_settings(DISK_SCHEDULER={"COMPARE_PARALLEL_THRESHOLD": None}):
+            serial = self.compare(latency=True)
+        with override_settings(DISK_SCHEDULER={"COMPARE_PARALLEL_THRESHOLD": 1, "COMPARE_POOL_SIZE": 2}):
+            pooled = self.compare(latency=True)
+        self.assertEqual(pooled["results"], serial["results"])
+        self.assertEqual(pooled["best_algorithm"], serial["best_algorithm"])
@@ -0,0 +1,149 @@
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from threading import Event
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api import jobs
+from api.jobs import JobQueueFull, JobStore
+
+
+def wait_for(store, job_id, statuses=jobs.TERMINAL_STATUSES, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        if job["status"] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not reach {statuses}")
+
+
+class JobStoreTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.release = Event()
+
+    def store(self, **kwargs) -> JobStore:
+        store = JobStore(self.directory, **kwargs)
+        self.addCleanup(store.close)
+        # Cleanups run last-in first-out: unblock jobs before closing the pool
+        self.addCleanup(self.release.set)
+        return store
+
+    def blocking_job(self, progress):
+        progress(0.5)
+        self.release.wait(10)
+        return {"done": True}
+
+    def rewrite(self, job_id, **fields):
+        path = f"{self.directory}/{job_id}.json"
+        with open(path) as f:
+            job = json.load(f)
+        job.update(fields)
+        with open(path, "w") as f:
+            json.dump(job, f)
+
+
+class JobStoreTest(JobStoreTestCase):
+    def test_result_and_progress(self):
+        store = self.store()
+        job = store.submit("simulate", self.blocking_job)
+        self.assertEqual(wait_for(store, job["id"], ("running",))["progress"], 0.5)
+        self.release.set()
+        job = wait_for(store, job["id"])
+        self.assertEqual((job["status"], job["progress"]), ("succeeded", 1.0))
+        with open(store.result_path(job["id"])) as f:
+            self.assertEqual(json.load(f), {"done": True})
+
+    def test_failure_is_recorded(self):
+        store = self.store()
+
+        def fail(progress):
+            raise ValueError("boom")
+
+        job = wait_for(store, store.submit("simulate", fail)["id"])
+        self.assertEqual((job["status"], job["error"]), ("failed", "boom"))
+
+    def test_queue_limit(self):
+        store = self.store(workers=1, max_pending=1)
+        store.submit("simulate", self.blocking_job)
+        with self.assertRaises(JobQueueFull):
+            store.submit("simulate", self.blocking_job)
+
+    def test_expired_jobs_are_deleted(self):
+        store = self.store(ttl=0.2)
+        job = wait_for(store, store.submit("simulate", lambda progress: {})["id"])
+        self.assertEqual(job["status"], "succeeded")
+        time.sleep(0.3)
+        self.assertIsNone(store.get(job["id"]))
+        self.assertFalse(store.result_path(job["id"]).exists())
+
+
+class WorkerProcessTest(JobStoreTestCase):
+    """A second JobStore on the same directory stands in for another worker process"""
+
+    def test_poll_from_another_worker_sees_a_live_job(self):
+        owner = self.store(heartbeat=0.05)
+        job = owner.submit("simulate", self.blocking_job)
+        wait_for(owner, job["id"], ("running",))
+        other = self.store(heartbeat=0.05)
+        time.sleep(0.2)  # several heartbeats
+        polled = other.get(job["id"])
+        self.assertEqual(polled["status"], "running")
+        self.assertEqual(polled["progress"], 0.5)
+        self.assertFalse(other.delete(job["id"]))
+        self.release.set()
+        self.assertEqual(wait_for(other, job["id"])["status"], "succeeded")
+
+    def test_stale_heartbeat_means_interrupted(self):
+        owner = self.store()
+        job = owner.submit("simulate", self.blocking_job)
+        wait_for(owner, job["id"], ("running",))
+        self.rewrite(job["id"], heartbeat_at=time.time() - 60)
+        polled = self.store().get(job["id"])
+        self.assertEqual(polled["status"], "failed")
+        self.assertIn("interrupted", polled["error"])
+
+    def test_dead_owner_on_this_host_means_interrupted(self):
+        owner = self.store()
+        job = owner.submit("simulate", self.blocking_job)
+        wait_for(owner, job["id"], ("running",))
+        process = subprocess.Popen([sys.executable, "-c", ""])
+        process.wait()
+        self.rewrite(job["id"], owner={**owner.owner, "pid": process.pid, "token": "restarted"})
+        self.assertEqual(self.store().get(job["id"])["status"], "failed")
+
+    def test_record_without_owner_means_interrupted(self):
+        owner = self.store()
+        job = owner.submit("simulate", self.blocking_job)
+        wait_for(owner, job["id"], ("running",))
+        self.rewrite(job["id"], owner=None, heartbeat_at=None)
+        self.assertEqual(self.store().get(job["id"])["status"], "failed")
+
+
+class JobAPITest(JobStoreTestCase):
+    def test_submit_poll_and_fetch(self):
+        with mock.patch.object(jobs, "_job_store", self.store()):
+            response = self.client.post("/api/jobs/", data=json.dumps({
+                "requests": [98, 183, 37, 122, 14, 124, 65, 67], "initial_position": 53, "algorithm": "SSTF"
+            }), content_type="application/json")
+            self.assertEqual(response.status_code, 202)
+            document = response.json()
+            self.assertNotIn("owner", document)
+            deadline = time.monotonic() + 10
+            while document["status"] not in jobs.TERMINAL_STATUSES and time.monotonic() < deadline:
+                time.sleep(0.01)
+                document = self.client.get(f"/api/jobs/{document['id']}/").json()
+            self.assertEqual(document["status"], "succeeded")
+            result = self.client.get(f"/api/jobs/{document['id']}/result/")
+            self.assertEqual(json.loads(b"".join(result.streaming_content))["result"]["total_seek_time"], 236)
+
+    def test_unknown_job(self):
+        with mock.patch.object(jobs, "_job_store", self.store()):
+            self.assertEqual(self.client.get(f"/api/jobs/{'0' * 32}/").status_code, 404)
@@ -0,0 +1,40 @@
+import json
+
+from django.test import SimpleTestCase
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class OptimizeAPITest(SimpleTestCase):
+    def optimize(self, query="", **body):
+        body = {"requests": REQUESTS, "initial_position": 53, **body}
+        return self.client.post("/api/optimize/" + query, data=json.dumps(body), content_type="application/json")
+
+    def test_pareto_front(self):
+        response = self.optimize(n_steps=[2, 4, 8])
+        self.assertEqual(response.status_code, 200, response.content)
+        document = response.json()
+        self.assertEqual(document["request"]["n_steps"], [2, 4, 8])
+        front = document["pareto_front"]
+        self.assertEqual(document["best"], front[0])
+        self.assertEqual(front[0]["total_seek_time"], 208)
+        totals = [c["total_seek_time"] for c in front]
+        distances = [c["max_seek_distance"] for c in front]
+        self.assertEqual(totals, sorted(totals))
+        self.assertEqual(distances, sorted(distances, reverse=True))
+        self.assertEqual(len(document["candidates"]), document["search"]["evaluated"])
+
+    def test_search_restrictions(self):
+        document = self.optimize(algorithms=["N-STEP SCAN"], directions=["left"], objective="fairness").json()
+        self.assertEqual({(c["algorithm"], c["direction"]) for c in document["candidates"]}, {("N-STEP SCAN", "left")})
+        self.assertEqual(document["objective"], "fairness")
+
+    def test_candidates_can_be_omitted(self):
+        self.assertNotIn("candidates", self.optimize("?include_candidates=false").json())
+
+    def test_invalid_payloads(self):
+        for body in ({"requests": []}, {"n_steps": "4"}, {"n_steps": ["x"]}, {"objective": "latency"},
+                     {"algorithms": ["NOPE"]}, {"requests": [500]}):
+            with self.subTest(body=body):
+                self.assertEqual(self.optimize(**body).status_code, 400)
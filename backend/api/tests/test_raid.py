@@ -0,0 +1,31 @@
+import json
+
+from django.test import SimpleTestCase
+
+
+class RaidAPITest(SimpleTestCase):
+    def post(self, query="", **body):
+        body = {"requests": [0, 1, 2, 3, 4, 5, 6, 7], "initial_position": 0, "algorithm": "SSTF",
+                "disks": 4, "disk_size": 100, **body}
+        return self.client.post("/api/raid/simulate/" + query, data=json.dumps(body),
+                                content_type="application/json")
+
+    def test_raid10_read(self):
+        response = self.post(layout="RAID10")
+        self.assertEqual(response.status_code, 200, response.content)
+        document = response.json()
+        self.assertEqual((document["layout"], document["capacity"]), ("RAID10", 200))
+        self.assertEqual([disk["sequence"] for disk in document["disks"]], [[0, 2], [1, 3], [0, 2], [1, 3]])
+        self.assertEqual(document["request_imbalance"], 1.0)
+
+    def test_write_reaches_every_mirror(self):
+        document = self.post("?response_format=compact", layout="RAID1", disks=2, operation="write").json()
+        self.assertEqual([disk["total_requests"] for disk in document["disks"]], [8, 8])
+        self.assertTrue(all("seek_operations" not in disk for disk in document["disks"]))
+
+    def test_invalid_payloads(self):
+        for body in ({"disks": None}, {"layout": "RAID5"}, {"layout": "RAID10", "disks": 3},
+                     {"requests": [400]}, {"stripe_size": "x"}, {"algorithm": "NOPE"},
+                     {"initial_position": [0, 0]}):
+            with self.subTest(body=body):
+                self.assertEqual(self.post(**body).status_code, 400)
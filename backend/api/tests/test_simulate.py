@@ -0,0 +1,77 @@
+import json
+
+from django.test import SimpleTestCase
+
+from app.algorithms.cost_model import CostModel
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class SimulateTestCase(SimpleTestCase):
+    def post(self, url, body, query=""):
+        return self.client.post(url + query, data=json.dumps(body), content_type="application/json")
+
+    def simulate(self, query="", **body):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF", **body}
+        response = self.post("/api/simulate/", body, query)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+
+class CompactResponseTest(SimulateTestCase):
+    def test_full_response_has_seek_operations(self):
+        result = self.simulate()["result"]
+        self.assertEqual(result["seek_operations"][:2], [[53, 65], [65, 67]])
+        self.assertEqual(len(result["seek_operations"]), len(REQUESTS))
+
+    def test_compact_options(self):
+        for query, body in (("", {"include_seek_operations": False}),
+                            ("", {"response_format": "compact"}),
+                            ("", {"format": "compact"}),
+                            ("?response_format=compact", {}),
+                            ("?include_seek_operations=false", {})):
+            with self.subTest(query=query, body=body):
+                result = self.simulate(query, **body)["result"]
+                self.assertNotIn("seek_operations", result)
+                self.assertEqual(result["sequence"], [65, 67, 37, 14, 98, 122, 124, 183])
+                self.assertEqual(result["total_seek_time"], 236)
+
+    def test_compact_compare(self):
+        body = {"requests": REQUESTS, "initial_position": 53}
+        response = self.post("/api/compare/", body, "?response_format=compact")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all("seek_operations" not in result for result in response.json()["results"]))
+
+
+class ArrivalTimesTest(SimulateTestCase):
+    def test_online_simulation(self):
+        document = self.simulate(requests=[10, 90, 50], initial_position=0, disk_size=100,
+                                 arrival_times=[0, 0, 5])
+        self.assertEqual(document["result"]["sequence"], [10, 50, 90])
+        self.assertEqual(document["result"]["wait_times"], [10.0, 90.0, 45.0])
+        self.assertEqual(document["timing_metrics"]["max_wait_time"], 90.0)
+        self.assertEqual(document["timing_metrics"]["makespan"], 90.0)
+
+    def test_arrival_times_must_match_requests(self):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF", "arrival_times": [0]}
+        self.assertEqual(self.post("/api/simulate/", body).status_code, 400)
+
+    def test_deadline_schedulers_need_static_input(self):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "EDF", "arrival_times": [0] * 8}
+        self.assertEqual(self.post("/api/simulate/", body).status_code, 400)
+
+
+class CostModelTest(SimulateTestCase):
+    def test_cost_model_parameters(self):
+        metrics = self.simulate(requests=[98, 183, 37], algorithm="FCFS",
+                                cost_model={"rpm": 15000})["performance_metrics"]
+        cost = CostModel(cylinders=200, rpm=15000).service_cost([98, 183, 37], 53, 3)
+        self.assertEqual(metrics["total_service_time_ms"], cost["total_ms"])
+        self.assertEqual(metrics["iops"], cost["iops"])
+
+    def test_invalid_cost_model(self):
+        for cost_model in ({"bogus": 1}, {"rpm": 0}, [1]):
+            with self.subTest(cost_model=cost_model):
+                body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF", "cost_model": cost_model}
+                self.assertEqual(self.post("/api/simulate/", body).status_code, 400)
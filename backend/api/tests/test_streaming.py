@@ -0,0 +1,98 @@
+import json
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from api import streaming
+from api.streaming import iter_json, iter_ndjson
+from app.algorithms.disk_scheduling import SeekOperations
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+def read_ndjson(response):
+    body = b"".join(response.streaming_content) if response.streaming else response.content
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+class SerializerTest(SimpleTestCase):
+    def test_iter_json_matches_json_dumps(self):
+        document = {"a": [1, 2, {"b": [3, None]}], "c": "x", "d": {"e": 1.5, "f": []}}
+        self.assertEqual(json.loads("".join(iter_json(document))), document)
+
+    def test_iter_json_expands_lazy_seek_operations(self):
+        document = {"seek_operations": SeekOperations([60, 40], 50)}
+        self.assertEqual(json.loads("".join(iter_json(document))), {"seek_operations": [[50, 60], [60, 40]]})
+
+    def test_ndjson_records(self):
+        records = [json.loads(line) for line in "".join(iter_ndjson({
+            "request": {"disk_size": 200, "requests": [1, 2]},
+            "results": [{"algorithm": "FCFS", "sequence": [1, 2]}],
+        })).splitlines()]
+        self.assertEqual(records, [
+            {"type": "header", "request": {"disk_size": 200}},
+            {"type": "chunk", "field": "request.requests", "offset": 0, "values": [1, 2]},
+            {"type": "item", "field": "results", "index": 0, "algorithm": "FCFS"},
+            {"type": "chunk", "field": "results[0].sequence", "offset": 0, "values": [1, 2]},
+            {"type": "end"},
+        ])
+
+    def test_large_arrays_are_split_into_chunks(self):
+        values = list(range(10))
+        with mock.patch.object(streaming, "CHUNK_SIZE", 4):
+            fragments = list(iter_json({"values": values}))
+            records = [json.loads(line) for line in "".join(iter_ndjson({"values": values})).splitlines()]
+        self.assertEqual(json.loads("".join(fragments)), {"values": values})
+        chunks = [record for record in records if record["type"] == "chunk"]
+        self.assertEqual([(chunk["offset"], chunk["values"]) for chunk in chunks],
+                         [(0, [0, 1, 2, 3]), (4, [4, 5, 6, 7]), (8, [8, 9])])
+
+
+class AcceptHeaderTest(SimpleTestCase):
+    def post(self, url, body, **headers):
+        return self.client.post(url, data=json.dumps(body), content_type="application/json", **headers)
+
+    def test_simulate_streams_ndjson(self):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF"}
+        response = self.post("/api/simulate/", body, HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = read_ndjson(response)
+        self.assertEqual(records[0]["result"]["algorithm"], "SSTF")
+        self.assertEqual(records[-1], {"type": "end"})
+        sequence = [record for record in records if record.get("field") == "result.sequence"]
+        self.assertEqual(sequence[0]["values"], [65, 67, 37, 14, 98, 122, 124, 183])
+
+    def test_compare_streams_ndjson(self):
+        body = {"requests": REQUESTS, "initial_position": 53}
+        response = self.post("/api/compare/", body, HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = read_ndjson(response)
+        self.assertEqual(records[0]["type"], "header")
+        self.assertIn("FCFS", [record.get("algorithm") for record in records if record["type"] == "item"])
+
+    def test_batch_streams_one_record_per_item(self):
+        body = [{"requests": REQUESTS, "initial_position": 53, "algorithm": "SCAN"}, {"requests": []}]
+        response = self.post("/api/batch/", body, HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual([record["status"] for record in read_ndjson(response)], [200, 400])
+
+    def test_errors_are_rendered_as_ndjson(self):
+        response = self.post("/api/simulate/", {"requests": []}, HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(read_ndjson(response)[0]["type"], "header")
+
+    def test_json_preferred_over_ndjson(self):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF"}
+        response = self.post("/api/simulate/", body, HTTP_ACCEPT="application/json, application/x-ndjson")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["result"]["total_seek_time"], 236)
+
+    def test_stream_option(self):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF", "stream": "json"}
+        response = self.post("/api/simulate/", body)
+        self.assertTrue(response.streaming)
+        self.assertEqual(json.loads(b"".join(response.streaming_content))["result"]["total_seek_time"], 236)
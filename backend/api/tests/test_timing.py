@@ -0,0 +1,91 @@
+import json
+import re
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from api import cache
+from api.timing import Histogram, Metrics, PhaseTimer, start_timer, stop_timer, timed
+from app.algorithms.cache import ResultCache
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class PhaseTimerTest(SimpleTestCase):
+    def test_timed_adds_to_the_current_timer(self):
+        with timed("parse"):
+            pass  # no timer: a no-op
+        timer, token = start_timer()
+        try:
+            with timed("parse"):
+                pass
+            with timed("parse"):
+                pass
+        finally:
+            stop_timer(token)
+        self.assertEqual(list(timer.phases), ["parse"])
+
+    def test_server_timing_format(self):
+        timer = PhaseTimer()
+        timer.add("parse", 0.00021)
+        timer.add("algorithm", 0.0035)
+        self.assertEqual(timer.server_timing(), "parse;dur=0.210, algorithm;dur=3.500")
+        self.assertEqual(timer.as_milliseconds(), {"parse": 0.21, "algorithm": 3.5})
+
+
+class MetricsTest(SimpleTestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("size", "Input size", ("endpoint",), (10, 100))
+        for value in (5, 10, 50, 500):
+            histogram.observe(("simulate",), value)
+        self.assertEqual(histogram.render()[2:], [
+            'size_bucket{endpoint="simulate",le="10"} 2',
+            'size_bucket{endpoint="simulate",le="100"} 3',
+            'size_bucket{endpoint="simulate",le="+Inf"} 4',
+            'size_sum{endpoint="simulate"} 565.0',
+            'size_count{endpoint="simulate"} 4',
+        ])
+
+    def test_label_values_are_escaped(self):
+        metrics = Metrics()
+        metrics.observe_algorithm('N"STEP', 0.001)
+        self.assertIn('algorithm="N\\"STEP"', metrics.render())
+
+
+class TimingAPITest(SimpleTestCase):
+    def setUp(self):
+        # A cached result would skip the algorithm phase
+        patcher = mock.patch.object(cache, "_result_cache", ResultCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def simulate(self, query=""):
+        body = {"requests": REQUESTS, "initial_position": 53, "algorithm": "SSTF"}
+        return self.client.post("/api/simulate/" + query, data=json.dumps(body), content_type="application/json")
+
+    def test_server_timing_header(self):
+        response = self.simulate()
+        phases = dict(re.findall(r"(\w+);dur=([\d.]+)", response["Server-Timing"]))
+        for phase in ("parse", "validate", "algorithm", "render", "total"):
+            self.assertIn(phase, phases)
+        self.assertNotIn("timings", response.json())
+
+    def test_timings_block(self):
+        timings = self.simulate("?timings=true").json()["timings"]
+        self.assertEqual(timings["unit"], "ms")
+        self.assertGreaterEqual(timings["algorithm"], 0)
+
+    @override_settings(DISK_SCHEDULER={"SERVER_TIMING": False})
+    def test_header_can_be_disabled(self):
+        self.assertFalse(self.simulate().has_header("Server-Timing"))
+
+    def test_prometheus_endpoint(self):
+        self.simulate()
+        response = self.client.get("/api/metrics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        text = response.content.decode()
+        self.assertRegex(text, r'disk_scheduler_http_requests_total\{endpoint="simulate",status="200"\} \d+')
+        self.assertIn('disk_scheduler_algorithm_duration_seconds_bucket{algorithm="SSTF",le="+Inf"}', text)
+        self.assertIn('disk_scheduler_input_requests_count{endpoint="simulate"}', text)
@@ -0,0 +1,48 @@
+import struct
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+
+
+CSV = b"lba,time\n98,0\n183,1\n37,2\n122,3\n14,4\n124,5\n65,6\n67,7\n"
+
+
+class TraceUploadTest(SimpleTestCase):
+    def upload(self, name="trace.csv", content=CSV, **form):
+        return self.client.post("/api/traces/simulate/", {"trace": SimpleUploadedFile(name, content), **form})
+
+    def test_simulate_trace(self):
+        response = self.upload(algorithm="SSTF", initial_position=53)
+        self.assertEqual(response.status_code, 200, response.content)
+        document = response.json()
+        self.assertEqual(document["result"]["total_seek_time"], 236)
+        self.assertNotIn("requests", document["request"])
+        self.assertEqual(document["request"]["trace"], {
+            "source": "trace.csv", "format": "csv", "count": 8,
+            "min_track": 14, "max_track": 183, "has_arrival_times": False,
+        })
+
+    def test_compare_binary_trace(self):
+        content = struct.pack("<8q", 98, 183, 37, 122, 14, 124, 65, 67)
+        response = self.upload("trace.bin", content, initial_position=53, response_format="compact")
+        self.assertEqual(response.status_code, 200, response.content)
+        results = {r["algorithm"]: r for r in response.json()["results"]}
+        self.assertEqual(results["SSTF"]["total_seek_time"], 236)
+        self.assertNotIn("seek_operations", results["SSTF"])
+
+    def test_sectors_per_track(self):
+        response = self.upload(content=b"lba\n6400\n640\n", algorithm="FCFS", initial_position=0,
+                               sectors_per_track=64)
+        self.assertEqual(response.json()["result"]["sequence"], [100, 10])
+
+    def test_arrival_times(self):
+        response = self.upload(algorithm="FCFS", initial_position=53, time_column="time", use_arrival_times="true")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertIn("makespan", response.json()["timing_metrics"])
+        response = self.upload(algorithm="FCFS", initial_position=53, use_arrival_times="true")
+        self.assertEqual(response.status_code, 400)
+
+    def test_errors(self):
+        self.assertEqual(self.client.post("/api/traces/simulate/", {"algorithm": "SSTF"}).status_code, 400)
+        self.assertEqual(self.upload("trace.parquet", algorithm="SSTF").status_code, 400)
+        self.assertEqual(self.upload(content=b"lba\nx\n", algorithm="SSTF").status_code, 400)
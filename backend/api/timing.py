@@ -0,0 +1,185 @@
+"""
+Request phase timers and Prometheus metrics for the API.
+
+TimingMiddleware starts a PhaseTimer for every request; views wrap their
+phases (parse, validate, algorithm, metrics) in ``timed(name)``, and the
+middleware adds rendering and the total. Phases are reported in a
+Server-Timing header, and views can copy them into the response body.
+
+The module-level ``metrics`` registry collects per-algorithm latency and
+input-size histograms, served in Prometheus text format by /api/metrics/.
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Optional, Sequence, Tuple
+
+
+class PhaseTimer:
+    """Accumulated wall time per named phase of one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+
+    def add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_milliseconds(self) -> Dict[str, float]:
+        return {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()}
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. 'parse;dur=0.21, algorithm;dur=3.5'"""
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.phases.items())
+
+
+_current_timer: ContextVar[Optional[PhaseTimer]] = ContextVar("disk_scheduler_timer", default=None)
+
+
+def current_timer() -> Optional[PhaseTimer]:
+    """Timer of the request being handled, or None outside TimingMiddleware"""
+    return _current_timer.get()
+
+
+def start_timer() -> Tuple[PhaseTimer, object]:
+    """Start a timer for the current request; returns it with the token for stop_timer"""
+    timer = PhaseTimer()
+    return timer, _current_timer.set(timer)
+
+
+def stop_timer(token):
+    _current_timer.reset(token)
+
+
+@contextmanager
+def timed(phase: str):
+    """Add the duration of the block to the current request's phase (no-op without a timer)"""
+    timer = _current_timer.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timer is not None:
+            timer.add(phase, time.perf_counter() - start)
+
+
+# Latency buckets in seconds and input-size buckets in requests
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (10, 100, 1000, 10000, 100000, 1000000, 10000000)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values"""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}
+
+    def observe(self, label_values: tuple, value: float):
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        counts, _, _ = series
+        counts[bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label_values, (counts, total, count) in sorted(self._series.items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labels, label_values))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{self.name}_bucket{{{labels}{"," if labels else ""}le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.name}_count{{{labels}}} {count}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values"""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._series = {}
+
+    def inc(self, label_values: tuple, amount: float = 1):
+        self._series[label_values] = self._series.get(label_values, 0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label_values, value in sorted(self._series.items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labels, label_values))
+            lines.append(f"{self.name}{{{labels}}} {value}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Process-wide API metrics"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.requests = Counter(
+            "disk_scheduler_http_requests_total", "HTTP requests by endpoint and status", ("endpoint", "status")
+        )
+        self.request_seconds = Histogram(
+            "disk_scheduler_http_request_duration_seconds", "End-to-end request latency", ("endpoint",),
+            LATENCY_BUCKETS
+        )
+        self.algorithm_seconds = Histogram(
+            "disk_scheduler_algorithm_duration_seconds", "Time spent running one scheduling algorithm",
+            ("algorithm",), LATENCY_BUCKETS
+        )
+        self.input_size = Histogram(
+            "disk_scheduler_input_requests", "Number of track requests per workload", ("endpoint",), SIZE_BUCKETS
+        )
+
+    def observe_request(self, endpoint: str, status: int, seconds: float):
+        with self._lock:
+            self.requests.inc((endpoint, str(status)))
+            self.request_seconds.observe((endpoint,), seconds)
+
+    def observe_algorithm(self, algorithm: str, seconds: float):
+        with self._lock:
+            self.algorithm_seconds.observe((algorithm,), seconds)
+
+    def observe_input_size(self, endpoint: str, size: int):
+        with self._lock:
+            self.input_size.observe((endpoint,), size)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            lines = []
+            for metric in (self.requests, self.request_seconds, self.algorithm_seconds, self.input_size):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+@contextmanager
+def timed_algorithm(algorithm: str):
+    """Time an algorithm run into the 'algorithm' phase and the per-algorithm histogram"""
+    start = time.perf_counter()
+    with timed("algorithm"):
+        yield
+    metrics.observe_algorithm(algorithm, time.perf_counter() - start)
@@ -1,9 +1,21 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     path('', views.root, name='root'),
     path('algorithms/', views.get_algorithms, name='algorithms'),
     path('simulate/', views.simulate, name='simulate'),
     path('compare/', views.compare_algorithms, name='compare'),
+    path('optimize/', views.optimize_parameters, name='optimize'),
+    path('batch/', views.batch, name='batch'),
+    path('raid/simulate/', views.simulate_array, name='raid-simulate'),
+    path('traces/simulate/', views.simulate_trace, name='simulate-trace'),
+    path('async/', async_views.executor_status, name='async-status'),
+    path('async/simulate/', async_views.simulate, name='async-simulate'),
+    path('async/compare/', async_views.compare_algorithms, name='async-compare'),
+    path('jobs/', views.submit_job, name='jobs'),
+    path('jobs/<str:job_id>/', views.job_status, name='job'),
+    path('jobs/<str:job_id>/result/', views.job_result, name='job-result'),
+    path('cache/', views.cache_stats, name='cache'),
+    path('metrics/', views.prometheus_metrics, name='metrics'),
 ]
@@ -2,33 +2,723 @@
 Django REST Framework views for Disk Scheduling Algorithm Simulator API
 """
 
-from rest_framework.decorators import api_view
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, QueryDict
+from rest_framework.decorators import api_view, parser_classes, renderer_classes
+from rest_framework.exceptions import APIException
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework import status
-from app.algorithms.disk_scheduling import DiskScheduler
-from typing import List
+from app.algorithms.disk_scheduling import DiskScheduler, normalize_algorithm_name
+from app.algorithms.cache import fingerprint
+from app.algorithms.cost_model import CostModel
+from app.algorithms.online import OnlineScheduler
+from app.algorithms.optimal import OPTIMAL_WAIT_MAX_TRACKS, gap_percent, optimal_bounds, schedule_wait
+from app.algorithms.optimize import optimize
+from app.algorithms.parallel import simulate_many
+from app.algorithms.raid import DiskArray
+from app.algorithms.registry import registry
+from app.algorithms.seek import fairness_index
+from app.algorithms.trace import detect_format, load_trace
+from .cache import get_result_cache
+from .jobs import JobQueueFull, get_job_store
+from .parsers import NDJSONParser
+from .renderers import NDJSONRenderer
+from .streaming import STREAM_FORMATS, ndjson_response, streaming_response
+from .timing import current_timer, metrics, timed, timed_algorithm
 
 
-def _calculate_fairness_index(seek_operations: List[tuple]) -> float:
+def _calculate_fairness_index(seek_statistics: dict) -> float:
     """Calculate fairness index based on variance of seek distances"""
-    if not seek_operations:
-        return 0.0
+    # Lower variance = higher fairness, normalized to a 0-1 scale
+    return fairness_index(seek_statistics)
+
+
+def _engine_setting(name: str, default=None):
+    """Read a key from the DISK_SCHEDULER settings dict"""
+    return getattr(settings, 'DISK_SCHEDULER', {}).get(name, default)
+
+
+def _request_options(request) -> dict:
+    """Options from the query string, overridden by fields of a JSON object or form body"""
+    options = request.query_params.dict()
+    if isinstance(request.data, QueryDict):
+        # Multipart/form bodies: last value of each field, not the list of values
+        options.update(request.data.dict())
+    elif isinstance(request.data, dict):
+        options.update(request.data)
+    return options
+
+
+def _option_flag(options: dict, name: str, default: bool) -> bool:
+    """Boolean option that may arrive as a JSON bool or a query-string value"""
+    value = options.get(name, default)
+    if isinstance(value, str):
+        return value.strip().lower() not in ('', 'false', '0', 'no')
+    return bool(value)
+
+
+def _include_seek_operations(options: dict) -> bool:
+    """
+    Whether the response should carry the (from, to) seek operations.
+    They are derivable from sequence + initial_position, so clients can opt out
+    with include_seek_operations=false or response_format=compact. A "format"
+    field in the body is accepted too; DRF reserves ?format= in the query
+    string for renderer selection.
+    """
+    response_format = options.get('response_format', options.get('format', 'full'))
+    if str(response_format).strip().lower() == 'compact':
+        return False
+    return _option_flag(options, 'include_seek_operations', True)
+
+
+def _stream_format(request, options: dict = None):
+    """
+    Streaming mode requested by the client: "json", "ndjson" or None.
+    Enabled with stream=json|ndjson|true, or an Accept: application/x-ndjson header
+    (views taking the header list NDJSONRenderer so content negotiation accepts it).
+    """
+    if options is None:
+        options = _request_options(request)
+    stream = options.get('stream')
+    if stream is None or stream is False:
+        accepted_renderer = getattr(request, 'accepted_renderer', None)
+        if accepted_renderer is not None:
+            # DRF views: the Accept header has already been negotiated
+            return "ndjson" if isinstance(accepted_renderer, NDJSONRenderer) else None
+        return "ndjson" if "application/x-ndjson" in request.headers.get("Accept", "") else None
+    stream = str(stream).strip().lower()
+    if stream in ('', 'false', '0', 'no'):
+        return None
+    if stream in ('true', '1', 'yes'):
+        return "json"
+    if stream not in STREAM_FORMATS:
+        raise ValueError(f"Unknown stream format '{stream}'. Available: {', '.join(STREAM_FORMATS)}")
+    return stream
+
+
+# Renderers of the views that can stream: the defaults, plus NDJSON records for
+# Accept: application/x-ndjson
+STREAMING_RENDERERS = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+
+
+def _respond(request, response_data: dict):
+    """Return response_data as a regular DRF response or a streaming one"""
+    stream_format = _stream_format(request)
+    if stream_format:
+        return streaming_response(response_data, stream_format)
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+def _error_response(error: Exception):
+    """Map an exception raised while handling a request to an error response"""
+    if isinstance(error, APIException):
+        # e.g. ParseError for a malformed body
+        return Response({"detail": str(error.detail)}, status=error.status_code)
+    if isinstance(error, ValueError):
+        return Response(
+            {"detail": str(error)},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(
+        {"detail": f"Internal server error: {str(error)}"},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
+
+
+def _parse_cost_model(data: dict, disk_size):
+    """Optional cost_model parameters -> CostModel (None keeps the engine default)"""
+    config = data.get('cost_model')
+    if config is None:
+        return None
+    if not isinstance(config, dict):
+        raise ValueError("cost_model must be a JSON object")
+    return CostModel.from_dict(config, cylinders=disk_size)
+
+
+def _cost_model_key(cost_model):
+    return cost_model.to_dict() if cost_model is not None else None
+
+
+def _parse_qos(data: dict, request_count: int):
+    """
+    Optional per-request deadlines (ms), priorities and writes flags, as
+    DiskScheduler keyword arguments (None when none are given)
+
+    Raises:
+        ValueError: If a field is not a list with one entry per request
+    """
+    qos = {}
+    for name in ('deadlines', 'priorities', 'writes'):
+        values = data.get(name)
+        if values is None:
+            continue
+        if not isinstance(values, list) or len(values) != request_count:
+            raise ValueError(f"{name} must be a list with one entry per request")
+        qos[name] = values
+    return qos or None
+
+
+def _validate_algorithm(algorithm: str, n_step, engine=None):
+    """
+    Check that a single-algorithm spec names a registered algorithm and engine
+
+    Raises:
+        ValueError: If the algorithm or engine is unknown, or a required
+            parameter (n_step for N-Step SCAN) is missing
+    """
+    spec = registry.get(str(algorithm))
+    if "n_step" in spec.required and (n_step is None or n_step < 1):
+        raise ValueError(f"n_step (positive integer) is required for {spec.full_name}")
+    spec.engine(engine)
+
+
+def _parse_simulation_spec(data) -> dict:
+    """
+    Validate a simulate payload
+
+    Raises:
+        ValueError: If a required field is missing or the algorithm is unknown
+    """
+    if not isinstance(data, dict):
+        raise ValueError("simulation spec must be a JSON object")
+    requests_list = data.get('requests', [])
+    initial_position = data.get('initial_position')
+    algorithm = data.get('algorithm')
+    disk_size = data.get('disk_size', 200)
+    direction = data.get('direction', 'right')
+    n_step = data.get('n_step')
+    if n_step is not None:
+        try:
+            n_step = int(n_step)
+        except (TypeError, ValueError):
+            n_step = None
+
+    # Validate required fields
+    if not requests_list:
+        raise ValueError("requests field is required")
+    if initial_position is None:
+        raise ValueError("initial_position field is required")
+    if not algorithm:
+        raise ValueError("algorithm field is required")
     
-    seek_distances = [abs(to - from_pos) for from_pos, to in seek_operations]
-    if not seek_distances:
-        return 0.0
+    engine = data.get('engine')
+    _validate_algorithm(algorithm, n_step, engine)
+
+    # Optional arrival times switch to the event-driven (online) simulation
+    arrival_times = data.get('arrival_times')
+    if arrival_times is not None:
+        if not isinstance(arrival_times, list) or len(arrival_times) != len(requests_list):
+            raise ValueError("arrival_times must be a list with one entry per request")
+        try:
+            time_per_track = float(data.get('time_per_track', 1.0))
+        except (TypeError, ValueError):
+            raise ValueError("time_per_track must be a number")
+    else:
+        time_per_track = None
+    qos = _parse_qos(data, len(requests_list))
+    if qos is not None and arrival_times is not None:
+        raise ValueError("deadlines, priorities and writes cannot be combined with arrival_times")
+
+    return {
+        "requests": requests_list,
+        "initial_position": initial_position,
+        "algorithm": algorithm,
+        "disk_size": disk_size,
+        "direction": direction,
+        "n_step": n_step,
+        "arrival_times": arrival_times,
+        "time_per_track": time_per_track,
+        "engine": engine,
+        "qos": qos,
+        "cost_model": _parse_cost_model(data, disk_size),
+        "latency": _option_flag(data, 'latency', False)
+    }
+
+
+def _parse_compare_spec(data) -> dict:
+    """
+    Validate a compare payload
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    if not isinstance(data, dict):
+        raise ValueError("comparison spec must be a JSON object")
+    requests_list = data.get('requests', [])
+    initial_position = data.get('initial_position')
+    disk_size = data.get('disk_size', 200)
+    direction = data.get('direction', 'right')
+
+    # Validate required fields
+    if not requests_list:
+        raise ValueError("requests field is required")
+    if initial_position is None:
+        raise ValueError("initial_position field is required")
+
+    n_step = data.get('n_step', 4)
+    try:
+        n_step = int(n_step) if n_step is not None else 4
+    except (TypeError, ValueError):
+        n_step = 4
+    if n_step < 1:
+        n_step = 4
+
+    return {
+        "requests": requests_list,
+        "initial_position": initial_position,
+        "disk_size": disk_size,
+        "direction": direction,
+        "n_step": n_step,
+        "qos": _parse_qos(data, len(requests_list)),
+        "cost_model": _parse_cost_model(data, disk_size),
+        "latency": _option_flag(data, 'latency', False),
+        "optimal_wait": _option_flag(data, 'optimal_wait', False)
+    }
+
+
+def _parse_array_spec(data) -> dict:
+    """
+    Validate a RAID simulate payload
+
+    Raises:
+        ValueError: If a required field is missing or the array geometry is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValueError("array spec must be a JSON object")
+    requests_list = data.get('requests', [])
+    initial_position = data.get('initial_position')
+    algorithm = data.get('algorithm')
+    disks = data.get('disks')
+    n_step = data.get('n_step')
+    if n_step is not None:
+        try:
+            n_step = int(n_step)
+        except (TypeError, ValueError):
+            n_step = None
+
+    if not requests_list:
+        raise ValueError("requests field is required")
+    if initial_position is None:
+        raise ValueError("initial_position field is required")
+    if not algorithm:
+        raise ValueError("algorithm field is required")
+    if disks is None:
+        raise ValueError("disks field is required")
+    _validate_algorithm(algorithm, n_step)
+
+    try:
+        disks = int(disks)
+        disk_size = int(data.get('disk_size', 200))
+        stripe_size = int(data.get('stripe_size', 1))
+    except (TypeError, ValueError):
+        raise ValueError("disks, disk_size and stripe_size must be integers")
+    array = DiskArray(disks, disk_size, stripe_size, data.get('layout', 'RAID0'),
+                      cost_model=_parse_cost_model(data, disk_size))
+
+    return {
+        "requests": requests_list,
+        "initial_position": initial_position,
+        "algorithm": algorithm,
+        "direction": data.get('direction', 'right'),
+        "n_step": n_step,
+        "operation": data.get('operation', 'read'),
+        "array": array
+    }
+
+
+def _run_array_simulation(spec: dict, include_seek_operations: bool = True) -> dict:
+    """Run a validated RAID simulate spec and build the response document"""
+    requests_list = spec["requests"]
+    array = spec["array"]
+    threshold = _engine_setting('COMPARE_PARALLEL_THRESHOLD', 50000)
+    parallel = threshold is not None and len(requests_list) >= threshold
+    with timed_algorithm(normalize_algorithm_name(spec["algorithm"])):
+        result = array.simulate(
+            requests_list,
+            spec["initial_position"],
+            spec["algorithm"],
+            direction=spec["direction"],
+            n_step=spec["n_step"],
+            operation=spec["operation"],
+            max_workers=_engine_setting('COMPARE_POOL_SIZE') if parallel else 1
+        )
+    if not include_seek_operations:
+        for disk in result["disks"]:
+            del disk["seek_operations"]
+    return {
+        "request": {
+            "requests": requests_list,
+            "initial_position": spec["initial_position"],
+            "algorithm": result["algorithm"],
+            "layout": array.layout,
+            "disks": array.disks,
+            "disk_size": array.disk_size,
+            "stripe_size": array.stripe_size,
+            "direction": spec["direction"],
+            "n_step": spec["n_step"],
+            "operation": result["operation"]
+        },
+        **result
+    }
+
+
+def _parse_optimize_spec(data) -> dict:
+    """
+    Validate an optimize payload
+
+    Raises:
+        ValueError: If a required field is missing or a search list is malformed
+    """
+    if not isinstance(data, dict):
+        raise ValueError("optimization spec must be a JSON object")
+    requests_list = data.get('requests', [])
+    initial_position = data.get('initial_position')
+    if not requests_list:
+        raise ValueError("requests field is required")
+    if initial_position is None:
+        raise ValueError("initial_position field is required")
+
+    search = {}
+    for name in ('algorithms', 'directions', 'n_steps'):
+        value = data.get(name)
+        if value is not None:
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"{name} must be a non-empty list")
+            search[name] = value
+    if 'n_steps' in search:
+        try:
+            search['n_steps'] = [int(n) for n in search['n_steps']]
+        except (TypeError, ValueError):
+            raise ValueError("n_steps must be positive integers")
+
+    return {
+        "requests": requests_list,
+        "initial_position": initial_position,
+        "disk_size": data.get('disk_size', 200),
+        "objective": data.get('objective', 'max_seek_distance'),
+        "search": search
+    }
+
+
+def _run_optimization(spec: dict, include_candidates: bool = True) -> dict:
+    """Run a validated optimize spec and build the response document"""
+    result = optimize(
+        spec["requests"],
+        spec["initial_position"],
+        spec["disk_size"],
+        objective=spec["objective"],
+        **spec["search"]
+    )
+    if not include_candidates:
+        del result["candidates"]
+    return {
+        "request": {
+            "requests": spec["requests"],
+            "initial_position": spec["initial_position"],
+            "disk_size": spec["disk_size"],
+            "objective": spec["objective"],
+            **spec["search"]
+        },
+        **result
+    }
+
+
+def _include_candidates(options: dict) -> bool:
+    return _option_flag(options, 'include_candidates', True)
+
+
+def _request_data(request):
+    """Parsed request body (DRF parses lazily on first access)"""
+    with timed("parse"):
+        return request.data
+
+
+def _attach_timings(response_data: dict, options: dict) -> dict:
+    """Copy the phase timings recorded so far into the response when timings=true"""
+    timer = current_timer()
+    if timer is not None and _option_flag(options, 'timings', False):
+        response_data["timings"] = {"unit": "ms", **timer.as_milliseconds()}
+    return response_data
+
+
+def _run_simulation(spec: dict, include_seek_operations: bool = True, progress=None) -> dict:
+    """
+    Run a validated simulate spec and build the response document
+
+    Args:
+        spec: Output of _parse_simulation_spec
+        include_seek_operations: Whether to keep the (from, to) seek operations
+        progress: Optional callback receiving the completed fraction (0-1)
+    """
+    requests_list = spec["requests"]
+    initial_position = spec["initial_position"]
+    disk_size = spec["disk_size"]
+    direction = spec["direction"]
+    n_step = spec["n_step"]
+
+    online = spec.get("arrival_times") is not None
+    cache = get_result_cache() if not online else None
+    cache_key = None
+    result = None
+    if cache is not None:
+        with timed("cache"):
+            cache_key = fingerprint(requests_list, initial_position, disk_size, spec["algorithm"], direction, n_step,
+                                    cost_model=_cost_model_key(spec["cost_model"]), qos=spec.get("qos"),
+                                    latency=spec.get("latency", False))
+            result = cache.get(cache_key)
+
+    if online:
+        scheduler = OnlineScheduler(
+            requests=requests_list,
+            arrival_times=spec["arrival_times"],
+            initial_position=initial_position,
+            disk_size=disk_size,
+            time_per_track=spec["time_per_track"],
+            cost_model=spec["cost_model"]
+        )
+        with timed_algorithm(normalize_algorithm_name(spec["algorithm"])):
+            result = scheduler.simulate(
+                algorithm=spec["algorithm"],
+                direction=direction,
+                n_step=n_step,
+                latency=spec.get("latency", False)
+            )
+    elif result is None:
+        scheduler = DiskScheduler(
+            requests=requests_list,
+            initial_position=initial_position,
+            disk_size=disk_size,
+            cost_model=spec["cost_model"],
+            progress=(lambda done, total: progress(done / total)) if progress is not None else None,
+            **(spec.get("qos") or {})
+        )
+
+        with timed_algorithm(normalize_algorithm_name(spec["algorithm"])):
+            result = scheduler.simulate(
+                algorithm=spec["algorithm"],
+                direction=direction,
+                n_step=n_step,
+                engine=spec.get("engine"),
+                latency=spec.get("latency", False)
+            )
+        if cache is not None:
+            with timed("cache"):
+                cache.set(cache_key, result)
+    
+    # Calculate additional performance metrics
+    with timed("metrics"):
+        fairness = _calculate_fairness_index(result["seek_statistics"])
+    performance_metrics = {
+        "efficiency": round((1 - result["total_seek_time"] / (disk_size * len(requests_list))) * 100, 2) if requests_list else 0,
+        "throughput": round(len(requests_list) / result["total_seek_time"] * 100, 2) if result["total_seek_time"] > 0 else 0,
+        "fairness_index": fairness,
+        "max_seek_distance": result["seek_statistics"]["max"],
+        "total_service_time_ms": result["cost"]["total_ms"],
+        "average_service_time_ms": result["cost"]["average_ms"],
+        "iops": result["cost"]["iops"]
+    }
     
-    mean = sum(seek_distances) / len(seek_distances)
-    if mean == 0:
-        return 1.0
+    response_data = {
+        "request": {
+            "requests": requests_list,
+            "initial_position": initial_position,
+            "algorithm": result["algorithm"],
+            "disk_size": disk_size,
+            "direction": direction,
+            "n_step": n_step
+        },
+        "result": {
+            "algorithm": result["algorithm"],
+            "sequence": result["sequence"],
+            "total_seek_time": result["total_seek_time"],
+            "average_seek_time": result["average_seek_time"]
+        },
+        "performance_metrics": performance_metrics
+    }
+    if include_seek_operations:
+        response_data["result"]["seek_operations"] = result["seek_operations"]
+    if "edge_stops" in result:
+        response_data["result"]["edge_stops"] = result["edge_stops"]
+    if "latency" in result:
+        response_data["latency_metrics"] = result["latency"]
+    if "deadline_misses" in result:
+        response_data["qos_metrics"] = {
+            "wait_times_ms": result["wait_times_ms"],
+            "deadline_misses": result["deadline_misses"]
+        }
+    if online:
+        response_data["request"]["time_per_track"] = spec["time_per_track"]
+        response_data["result"]["wait_times"] = result["wait_times"]
+        response_data["timing_metrics"] = {
+            "average_wait_time": result["average_wait_time"],
+            "max_wait_time": result["max_wait_time"],
+            "makespan": result["makespan"]
+        }
+    return response_data
+
+
+def _run_comparison(spec: dict, include_seek_operations: bool = True, progress=None) -> dict:
+    """
+    Run every algorithm on a validated compare spec and build the response document
+
+    Args:
+        spec: Output of _parse_compare_spec
+        include_seek_operations: Whether to keep the (from, to) seek operations
+        progress: Optional callback receiving the completed fraction (0-1)
+    """
+    requests_list = spec["requests"]
+    initial_position = spec["initial_position"]
+    disk_size = spec["disk_size"]
+    direction = spec["direction"]
+    n_step = spec["n_step"]
+
+    # Deadline-aware schedulers only join the comparison when the payload has
+    # deadlines, priorities or writes; without them they repeat FCFS or LOOK
+    qos = spec.get("qos")
+    runs = [
+        (algo.name, direction, n_step if "n_step" in algo.parameters else None)
+        for algo in registry if algo.supports("compare") or (qos and algo.supports("deadlines"))
+    ]
+    algorithms = [algo for algo, _, _ in runs]
+
+    # Reuse per-algorithm results cached by earlier simulate/compare calls
+    cache = get_result_cache()
+    outcomes = [None] * len(runs)
+    cache_keys = [None] * len(runs)
+    if cache is not None:
+        with timed("cache"):
+            for index, (algo, algo_direction, algo_n_step) in enumerate(runs):
+                cache_keys[index] = fingerprint(requests_list, initial_position, disk_size, algo, algo_direction,
+                                                algo_n_step, cost_model=_cost_model_key(spec["cost_model"]),
+                                                qos=qos, latency=spec.get("latency", False))
+                outcomes[index] = cache.get(cache_keys[index])
+    pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+
+    if pending:
+        scheduler = DiskScheduler(
+            requests=requests_list,
+            initial_position=initial_position,
+            disk_size=disk_size,
+            cost_model=spec["cost_model"],
+            **(qos or {})
+        )
+        threshold = _engine_setting('COMPARE_PARALLEL_THRESHOLD', 50000)
+        if threshold is not None and len(requests_list) >= threshold:
+            # Runs overlap on the pool, so only the phase is timed, not each algorithm
+            with timed("algorithm"):
+                computed = simulate_many(
+                    requests_list, initial_position, disk_size,
+                    [runs[index] for index in pending],
+                    max_workers=_engine_setting('COMPARE_POOL_SIZE'),
+                    cost_model=spec["cost_model"],
+                    qos=qos,
+                    latency=spec.get("latency", False)
+                )
+        else:
+            computed = []
+            for position, index in enumerate(pending):
+                algo, algo_direction, algo_n_step = runs[index]
+                if progress is not None:
+                    scheduler.progress = (
+                        lambda done, total, position=position: progress((position + done / total) / len(pending))
+                    )
+                try:
+                    with timed_algorithm(algo):
+                        computed.append(scheduler.simulate(
+                            algorithm=algo,
+                            direction=algo_direction,
+                            n_step=algo_n_step,
+                            latency=spec.get("latency", False)
+                        ))
+                except Exception as e:
+                    computed.append(e)
+        for index, outcome in zip(pending, computed):
+            outcomes[index] = outcome
+            if cache is not None and not isinstance(outcome, Exception):
+                cache.set(cache_keys[index], outcome)
+
+    # Distance from the optimum. The seek bound is O(n); the exact wait is an
+    # O(m^2) DP over the m distinct tracks, so it only runs up to
+    # COMPARE_OPTIMAL_WAIT_TRACKS unless the client asks for it ("optimal_wait"),
+    # and is replaced by a lower bound beyond that
+    max_tracks = (OPTIMAL_WAIT_MAX_TRACKS if spec.get("optimal_wait")
+                  else _engine_setting('COMPARE_OPTIMAL_WAIT_TRACKS', 256))
+    with timed("metrics"):
+        bounds = optimal_bounds(requests_list, initial_position, max_tracks)
+
+    results = []
+    for algo, outcome in zip(algorithms, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({
+                "algorithm": algo,
+                "error": str(outcome)
+            })
+            continue
+        # Copy, so results held by the cache are left untouched
+        outcome = {key: value for key, value in outcome.items()
+                   if include_seek_operations or key != "seek_operations"}
+        with timed("metrics"):
+            total_wait = schedule_wait(outcome["sequence"], initial_position, outcome.get("edge_stops", ()))
+        outcome["gap_to_optimal"] = {
+            "seek_time_pct": gap_percent(outcome["total_seek_time"], bounds["total_seek_time"]),
+            "total_wait": total_wait,
+            "wait_pct": gap_percent(total_wait, bounds["total_wait"]),
+        }
+        results.append(outcome)
     
-    variance = sum((d - mean) ** 2 for d in seek_distances) / len(seek_distances)
-    std_dev = variance ** 0.5
+    # Sort by total seek time to find the best algorithm
+    valid_results = [r for r in results if "error" not in r]
+    if valid_results:
+        best_algorithm = min(valid_results, key=lambda x: x["total_seek_time"])
+        fastest_algorithm = min(valid_results, key=lambda x: x["cost"]["total_ms"])
+    else:
+        best_algorithm = None
+        fastest_algorithm = None
     
-    # Fairness index: lower variance = higher fairness
-    # Normalize to 0-1 scale
-    fairness = max(0, 1 - (std_dev / mean)) if mean > 0 else 1.0
-    return round(fairness, 2)
+    return {
+        "request": {
+            "requests": requests_list,
+            "initial_position": initial_position,
+            "disk_size": disk_size,
+            "direction": direction
+        },
+        "results": results,
+        "best_algorithm": best_algorithm["algorithm"] if best_algorithm else None,
+        "optimal": bounds,
+        "comparison": {
+            "best_total_seek_time": best_algorithm["total_seek_time"] if best_algorithm else None,
+            "worst_total_seek_time": max([r["total_seek_time"] for r in valid_results], default=None),
+            "average_total_seek_time": sum([r["total_seek_time"] for r in valid_results]) / len(valid_results) if valid_results else None,
+            "best_service_time_algorithm": fastest_algorithm["algorithm"] if fastest_algorithm else None,
+            "best_total_service_time_ms": fastest_algorithm["cost"]["total_ms"] if fastest_algorithm else None,
+            "best_iops": max([r["cost"]["iops"] for r in valid_results], default=None)
+        }
+    }
+
+
+def _run_batch_item(index: int, item, options: dict) -> dict:
+    """Run one batch entry, isolating its errors from the rest of the batch"""
+    try:
+        if not isinstance(item, dict):
+            raise ValueError("batch item must be a JSON object")
+        item_options = {**options, **item}
+        include_seek_operations = _include_seek_operations(item_options)
+        mode = str(item.get('mode') or ('simulate' if item.get('algorithm') else 'compare')).lower()
+        if mode == 'simulate':
+            response_data = _run_simulation(_parse_simulation_spec(item), include_seek_operations)
+        elif mode == 'compare':
+            response_data = _run_comparison(_parse_compare_spec(item), include_seek_operations)
+        elif mode == 'optimize':
+            response_data = _run_optimization(_parse_optimize_spec(item), _include_candidates(item_options))
+        else:
+            raise ValueError(f"Unknown batch mode '{mode}'. Available: simulate, compare, optimize")
+        return {"index": index, "mode": mode, "status": status.HTTP_200_OK, "response": response_data}
+    except ValueError as e:
+        return {"index": index, "status": status.HTTP_400_BAD_REQUEST, "detail": str(e)}
+    except Exception as e:
+        return {"index": index, "status": status.HTTP_500_INTERNAL_SERVER_ERROR, "detail": f"Internal server error: {str(e)}"}
 
 
 @api_view(['GET'])
@@ -40,171 +730,61 @@ def root(request):
         "endpoints": {
             "simulate": "/api/simulate",
             "compare": "/api/compare",
-            "algorithms": "/api/algorithms"
+            "optimize": "/api/optimize",
+            "algorithms": "/api/algorithms",
+            "batch": "/api/batch",
+            "traces": "/api/traces/simulate",
+            "raid": "/api/raid/simulate",
+            "async_simulate": "/api/async/simulate",
+            "async_compare": "/api/async/compare",
+            "jobs": "/api/jobs",
+            "cache": "/api/cache",
+            "metrics": "/api/metrics"
         }
     })
 
 
 @api_view(['GET'])
 def get_algorithms(request):
-    """Get list of available algorithms"""
+    """Get list of available algorithms, as registered in the algorithm registry"""
+    return Response({
+        "algorithms": [spec.describe() for spec in registry]
+    })
+
+
+@api_view(['GET'])
+def prometheus_metrics(request):
+    """Request, algorithm latency and input size metrics in Prometheus text format"""
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@api_view(['GET'])
+def cache_stats(request):
+    """Hit/miss counters of the simulation result cache"""
+    cache = get_result_cache()
     return Response({
-        "algorithms": [
-            {
-                "name": "FCFS",
-                "full_name": "First Come First Served",
-                "description": "Services requests in the order they arrive",
-                "requires_direction": False
-            },
-            {
-                "name": "SSTF",
-                "full_name": "Shortest Seek Time First",
-                "description": "Always services the request closest to the current head position",
-                "requires_direction": False
-            },
-            {
-                "name": "SCAN",
-                "full_name": "SCAN (Elevator Algorithm)",
-                "description": "Moves the head in one direction until the end, then reverses",
-                "requires_direction": True
-            },
-            {
-                "name": "C-SCAN",
-                "full_name": "Circular SCAN",
-                "description": "Moves the head in one direction until the end, then jumps to the beginning",
-                "requires_direction": True
-            },
-            {
-                "name": "LOOK",
-                "full_name": "LOOK Algorithm",
-                "description": "Similar to SCAN but only goes to the last request in that direction",
-                "requires_direction": True
-            },
-            {
-                "name": "C-LOOK",
-                "full_name": "Circular LOOK",
-                "description": "Similar to C-SCAN but only goes to the last request",
-                "requires_direction": True
-            },
-            {
-                "name": "N-STEP SCAN",
-                "full_name": "N-Step SCAN",
-                "description": "Splits requests into batches of N; each batch serviced with SCAN",
-                "requires_direction": True,
-                "requires_n_step": True
-            },
-            {
-                "name": "FSCAN",
-                "full_name": "FSCAN",
-                "description": "Two queues: service one with SCAN while the other collects (simulated as two batches)",
-                "requires_direction": True
-            }
-        ]
+        "enabled": cache is not None,
+        "stats": cache.stats() if cache is not None else None
     })
 
 
 @api_view(['POST'])
+@renderer_classes(STREAMING_RENDERERS)
 def simulate(request):
     try:
-        requests_list = request.data.get('requests', [])
-        initial_position = request.data.get('initial_position')
-        algorithm = request.data.get('algorithm')
-        disk_size = request.data.get('disk_size', 200)
-        direction = request.data.get('direction', 'right')
-        n_step = request.data.get('n_step')
-        if n_step is not None:
-            try:
-                n_step = int(n_step)
-            except (TypeError, ValueError):
-                n_step = None
-
-        # Validate required fields
-        if not requests_list:
-            return Response(
-                {"detail": "requests field is required"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        if initial_position is None:
-            return Response(
-                {"detail": "initial_position field is required"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        if not algorithm:
-            return Response(
-                {"detail": "algorithm field is required"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # Validate algorithm (normalize N-STEP SCAN for check)
-        valid_algorithms = ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK", "N-STEP SCAN", "FSCAN"]
-        algo_upper = algorithm.upper().strip()
-        if algo_upper == "NSTEP SCAN":
-            algo_upper = "N-STEP SCAN"
-        if algo_upper not in valid_algorithms:
-            return Response(
-                {"detail": f"Unknown algorithm '{algorithm}'. Available: {', '.join(valid_algorithms)}"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        if algo_upper == "N-STEP SCAN" and (n_step is None or n_step < 1):
-            return Response(
-                {"detail": "n_step (positive integer) is required for N-Step SCAN"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        scheduler = DiskScheduler(
-            requests=requests_list,
-            initial_position=initial_position,
-            disk_size=disk_size
-        )
-
-        result = scheduler.simulate(
-            algorithm=algorithm,
-            direction=direction,
-            n_step=n_step
-        )
-        
-        # Calculate additional performance metrics
-        performance_metrics = {
-            "efficiency": round((1 - result["total_seek_time"] / (disk_size * len(requests_list))) * 100, 2) if requests_list else 0,
-            "throughput": round(len(requests_list) / result["total_seek_time"] * 100, 2) if result["total_seek_time"] > 0 else 0,
-            "fairness_index": _calculate_fairness_index(result["seek_operations"]),
-            "max_seek_distance": max([abs(to - from_pos) for from_pos, to in result["seek_operations"]], default=0)
-        }
-        
-        response_data = {
-            "request": {
-                "requests": requests_list,
-                "initial_position": initial_position,
-                "algorithm": result["algorithm"],
-                "disk_size": disk_size,
-                "direction": direction,
-                "n_step": n_step
-            },
-            "result": {
-                "algorithm": result["algorithm"],
-                "sequence": result["sequence"],
-                "total_seek_time": result["total_seek_time"],
-                "average_seek_time": result["average_seek_time"],
-                "seek_operations": result["seek_operations"]
-            },
-            "performance_metrics": performance_metrics
-        }
-        
-        return Response(response_data, status=status.HTTP_200_OK)
-    
-    except ValueError as e:
-        return Response(
-            {"detail": str(e)},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        data = _request_data(request)
+        with timed("validate"):
+            spec = _parse_simulation_spec(data)
+        metrics.observe_input_size("simulate", len(spec["requests"]))
+        options = _request_options(request)
+        response_data = _run_simulation(spec, _include_seek_operations(options))
+        return _respond(request, _attach_timings(response_data, options))
     except Exception as e:
-        return Response(
-            {"detail": f"Internal server error: {str(e)}"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return _error_response(e)
 
 
 @api_view(['POST'])
+@renderer_classes(STREAMING_RENDERERS)
 def compare_algorithms(request):
     """
     Compare all algorithms for the given request set
@@ -216,87 +796,303 @@ def compare_algorithms(request):
         "disk_size": 200,
         "direction": "right"
     }
+
+    Pass "stream": "json" or "ndjson" to serialize large responses incrementally
+    (every algorithm still runs before the first byte is sent).
+    Pass "include_seek_operations": false (or "response_format": "compact") to omit the
+    per-algorithm seek_operations, which can be rebuilt from each sequence.
     """
     try:
-        requests_list = request.data.get('requests', [])
-        initial_position = request.data.get('initial_position')
-        disk_size = request.data.get('disk_size', 200)
-        direction = request.data.get('direction', 'right')
-        
-        # Validate required fields
-        if not requests_list:
-            return Response(
-                {"detail": "requests field is required"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        if initial_position is None:
-            return Response(
-                {"detail": "initial_position field is required"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        scheduler = DiskScheduler(
-            requests=requests_list,
-            initial_position=initial_position,
-            disk_size=disk_size
-        )
-        
-        algorithms = ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK", "N-STEP SCAN", "FSCAN"]
-        n_step = request.data.get('n_step', 4)
-        try:
-            n_step = int(n_step) if n_step is not None else 4
-        except (TypeError, ValueError):
-            n_step = 4
-        if n_step < 1:
-            n_step = 4
-        results = []
-
-        for algo in algorithms:
-            try:
-                result = scheduler.simulate(
-                    algorithm=algo,
-                    direction=direction,
-                    n_step=n_step if algo == "N-STEP SCAN" else None
-                )
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "algorithm": algo,
-                    "error": str(e)
-                })
-        
-        # Sort by total seek time to find the best algorithm
-        valid_results = [r for r in results if "error" not in r]
-        if valid_results:
-            best_algorithm = min(valid_results, key=lambda x: x["total_seek_time"])
-        else:
-            best_algorithm = None
-        
-        response_data = {
-            "request": {
-                "requests": requests_list,
-                "initial_position": initial_position,
-                "disk_size": disk_size,
-                "direction": direction
-            },
-            "results": results,
-            "best_algorithm": best_algorithm["algorithm"] if best_algorithm else None,
-            "comparison": {
-                "best_total_seek_time": best_algorithm["total_seek_time"] if best_algorithm else None,
-                "worst_total_seek_time": max([r["total_seek_time"] for r in valid_results], default=None),
-                "average_total_seek_time": sum([r["total_seek_time"] for r in valid_results]) / len(valid_results) if valid_results else None
-            }
-        }
-        
-        return Response(response_data, status=status.HTTP_200_OK)
+        data = _request_data(request)
+        with timed("validate"):
+            spec = _parse_compare_spec(data)
+        metrics.observe_input_size("compare", len(spec["requests"]))
+        options = _request_options(request)
+        response_data = _run_comparison(spec, _include_seek_operations(options))
+        return _respond(request, _attach_timings(response_data, options))
+    except Exception as e:
+        return _error_response(e)
+
+
+@api_view(['POST'])
+def simulate_array(request):
+    """
+    Simulate a striped/mirrored multi-disk array
+
+    Expected JSON body:
+    {
+        "requests": [98, 183, 37, 122],
+        "initial_position": 53,
+        "algorithm": "SSTF",
+        "disks": 4,
+        "layout": "RAID10",
+        "stripe_size": 8,
+        "disk_size": 200,
+        "operation": "read"
+    }
+
+    requests are logical block addresses in [0, capacity). Each disk runs the
+    algorithm on its own share; the response carries every disk's result plus
+    the array makespan and load imbalance (max/mean, 1.0 = perfectly even).
+    initial_position may also be a list with one head position per disk.
+    """
+    try:
+        data = _request_data(request)
+        with timed("validate"):
+            spec = _parse_array_spec(data)
+        metrics.observe_input_size("raid", len(spec["requests"]))
+        options = _request_options(request)
+        response_data = _run_array_simulation(spec, _include_seek_operations(options))
+        return _respond(request, _attach_timings(response_data, options))
+    except Exception as e:
+        return _error_response(e)
+
+
+def _form_int(data, name: str, default=None):
+    """Integer form field (multipart values arrive as strings)"""
+    value = data.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer")
+
+
+def _form_flag(data, name: str) -> bool:
+    return str(data.get(name, '')).strip().lower() in ('true', '1', 'yes')
+
+
+def _load_uploaded_trace(request):
+    """Parse the uploaded trace file of a multipart request"""
+    upload = request.FILES.get('trace')
+    if upload is None:
+        raise ValueError("trace file field is required")
+    data = request.data
+    format = data.get('trace_format') or None
+    column = data.get('column') or 'lba'
+    time_column = data.get('time_column') or None
+    options = {
+        "format": format,
+        "sectors_per_track": _form_int(data, 'sectors_per_track', 1),
+        "column": int(column) if str(column).isdigit() else column,
+        "time_column": int(time_column) if str(time_column).isdigit() else time_column,
+        "delimiter": data.get('delimiter') or ',',
+        "action": data.get('action') or 'Q',
+    }
+    if format is None:
+        options["format"] = detect_format(upload.name)
+    if hasattr(upload, 'temporary_file_path'):
+        # Large uploads are spooled to disk: memory-map them instead of reading into memory
+        trace = load_trace(upload.temporary_file_path(), **options)
+    else:
+        trace = load_trace(upload, **options)
+    trace.source = upload.name
+    return trace
+
+
+@api_view(['POST'])
+def optimize_parameters(request):
+    """
+    Search algorithms, directions and N-Step SCAN batch sizes for a workload
     
-    except ValueError as e:
-        return Response(
-            {"detail": str(e)},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+    Expected JSON body:
+    {
+        "requests": [98, 183, 37, 122],
+        "initial_position": 53,
+        "disk_size": 200,
+        "algorithms": ["SCAN", "N-STEP SCAN"],   (optional, default: all)
+        "directions": ["left", "right"],         (optional, default: both)
+        "n_steps": [2, 4, 8],                    (optional, default: 1-16 and powers of two)
+        "objective": "max_seek_distance"         (or "fairness")
+    }
+
+    Returns the best candidate, the Pareto front of total seek time against
+    the objective, and every evaluated candidate (omit them with
+    "include_candidates": false).
+    """
+    try:
+        data = _request_data(request)
+        with timed("validate"):
+            spec = _parse_optimize_spec(data)
+        metrics.observe_input_size("optimize", len(spec["requests"]))
+        options = _request_options(request)
+        with timed("algorithm"):
+            response_data = _run_optimization(spec, _include_candidates(options))
+        return _respond(request, _attach_timings(response_data, options))
     except Exception as e:
-        return Response(
-            {"detail": f"Internal server error: {str(e)}"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+        return _error_response(e)
+
+
+@api_view(['POST'])
+@parser_classes([MultiPartParser, FormParser])
+@renderer_classes(STREAMING_RENDERERS)
+def simulate_trace(request):
+    """
+    Replay an uploaded I/O trace
+    
+    Expected multipart form:
+        trace: Trace file (csv, blkparse, bin32 or bin64)
+        trace_format: Trace format (inferred from the file extension when omitted)
+        initial_position, disk_size, direction, n_step: As for /api/simulate
+        algorithm: Algorithm to run; without it every algorithm is compared
+        sectors_per_track: LBAs per track (default 1)
+        column, time_column, delimiter: CSV columns (name or index) and delimiter
+        action: blkparse event to replay (default Q)
+        use_arrival_times: Replay trace timestamps through the online simulation
+        latency, optimal_wait: As for /api/simulate and /api/compare
+
+    response_format=compact, include_seek_operations and stream work as for /api/simulate.
+    The response describes the trace instead of echoing every request.
+    """
+    try:
+        with timed("parse"):
+            trace = _load_uploaded_trace(request)
+        metrics.observe_input_size("simulate-trace", len(trace))
+        data = request.data
+        spec_data = {
+            "requests": trace.requests,
+            "initial_position": _form_int(data, 'initial_position'),
+            "disk_size": _form_int(data, 'disk_size', 200),
+            "direction": data.get('direction') or 'right',
+            "n_step": _form_int(data, 'n_step'),
+            "latency": _form_flag(data, 'latency'),
+            "optimal_wait": _form_flag(data, 'optimal_wait'),
+        }
+        if _form_flag(data, 'use_arrival_times'):
+            if trace.arrival_times is None:
+                raise ValueError("trace has no timestamps (set time_column for CSV traces)")
+            spec_data["arrival_times"] = trace.arrival_times.tolist()
+            spec_data["time_per_track"] = data.get('time_per_track', 1.0)
+        include_seek_operations = _include_seek_operations(_request_options(request))
+        if data.get('algorithm'):
+            spec_data["algorithm"] = data.get('algorithm')
+            response_data = _run_simulation(_parse_simulation_spec(spec_data), include_seek_operations)
+        else:
+            if spec_data["n_step"] is None:
+                del spec_data["n_step"]
+            response_data = _run_comparison(_parse_compare_spec(spec_data), include_seek_operations)
+        del response_data["request"]["requests"]
+        response_data["request"]["trace"] = trace.summary()
+        return _respond(request, _attach_timings(response_data, _request_options(request)))
+    except Exception as e:
+        return _error_response(e)
+
+
+@api_view(['POST'])
+@parser_classes([JSONParser, NDJSONParser])
+@renderer_classes(STREAMING_RENDERERS)
+def batch(request):
+    """
+    Run many simulate/compare workloads in one request
+
+    Expected body: a JSON array of specs, {"items": [...]} or NDJSON with one
+    spec per line. A spec with "algorithm" is a simulate payload, one without
+    it (or with "mode": "compare") is a compare payload; "mode": "optimize"
+    runs a parameter search. Top-level options
+    (response_format, include_seek_operations) apply to every item unless overridden.
+
+    Results are returned in input order; each carries its own status so one
+    bad item does not fail the batch. With "stream": "ndjson" (or an
+    Accept: application/x-ndjson header) each result is sent as soon as it
+    has been computed.
+    """
+    try:
+        items = request.data if isinstance(request.data, list) else request.data.get('items')
+        if not isinstance(items, list) or not items:
+            raise ValueError("items must be a non-empty list of simulation specs")
+        max_items = _engine_setting('BATCH_MAX_ITEMS', 1000)
+        if max_items is not None and len(items) > max_items:
+            raise ValueError(f"batch is limited to {max_items} items")
+
+        options = _request_options(request)
+        options.pop('items', None)
+        if _stream_format(request):
+            records = (_run_batch_item(index, item, options) for index, item in enumerate(items))
+            return ndjson_response(records)
+
+        results = [_run_batch_item(index, item, options) for index, item in enumerate(items)]
+        return Response({
+            "count": len(results),
+            "succeeded": sum(1 for r in results if r["status"] == status.HTTP_200_OK),
+            "results": results
+        }, status=status.HTTP_200_OK)
+    except Exception as e:
+        return _error_response(e)
+
+
+def _job_document(request, job: dict) -> dict:
+    """Job status with the URLs to poll it and fetch its result"""
+    status_url = request.build_absolute_uri(f"/api/jobs/{job['id']}/")
+    public = {key: value for key, value in job.items() if key != "owner"}
+    return {**public, "status_url": status_url, "result_url": f"{status_url}result/"}
+
+
+@api_view(['POST'])
+def submit_job(request):
+    """
+    Run a simulate/compare workload in the background
+
+    Accepts the /api/simulate/ payload (with "algorithm") or the /api/compare/
+    payload (without it, or with "mode": "compare"). The spec is validated
+    right away; the response is 202 with the job id and the URLs to poll its
+    progress and download its result.
+    """
+    try:
+        data = _request_data(request)
+        if not isinstance(data, dict):
+            raise ValueError("job spec must be a JSON object")
+        mode = str(data.get('mode') or ('simulate' if data.get('algorithm') else 'compare')).lower()
+        options = _request_options(request)
+        include_seek_operations = _include_seek_operations(options)
+        with timed("validate"):
+            if mode == 'simulate':
+                spec = _parse_simulation_spec(data)
+                run = _run_simulation
+            elif mode == 'compare':
+                spec = _parse_compare_spec(data)
+                run = _run_comparison
+            else:
+                raise ValueError(f"Unknown job mode '{mode}'. Available: simulate, compare")
+        metrics.observe_input_size("jobs", len(spec["requests"]))
+
+        job = get_job_store().submit(mode, lambda progress: run(spec, include_seek_operations, progress))
+        return Response(_job_document(request, job), status=status.HTTP_202_ACCEPTED)
+    except JobQueueFull as e:
+        return Response({"detail": str(e)}, status=status.HTTP_429_TOO_MANY_REQUESTS, headers={"Retry-After": "5"})
+    except Exception as e:
+        return _error_response(e)
+
+
+@api_view(['GET', 'DELETE'])
+def job_status(request, job_id):
+    """Status and progress of a job (GET), or cancel/forget it (DELETE)"""
+    store = get_job_store()
+    if request.method == 'DELETE':
+        job = store.get(job_id)
+        if job is None:
+            return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        if not store.delete(job_id):
+            return Response({"detail": "A running job cannot be cancelled"}, status=status.HTTP_409_CONFLICT)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    job = store.get(job_id)
+    if job is None:
+        return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(_job_document(request, job))
+
+
+@api_view(['GET'])
+def job_result(request, job_id):
+    """The response document of a succeeded job, as /api/simulate/ or /api/compare/ would return it"""
+    store = get_job_store()
+    job = store.get(job_id)
+    if job is None:
+        return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+    if job["status"] != "succeeded":
+        detail = f"Job {job['status']}" + (f": {job['error']}" if job.get("error") else "")
+        return Response({"detail": detail, "status": job["status"]}, status=status.HTTP_409_CONFLICT)
+    try:
+        return FileResponse(open(store.result_path(job_id), "rb"), content_type="application/json")
+    except FileNotFoundError:
+        return Response({"detail": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
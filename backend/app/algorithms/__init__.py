@@ -1,3 +1,7 @@
-from .disk_scheduling import DiskScheduler
+from .cost_model import CostModel
+from .disk_scheduling import DiskScheduler, normalize_algorithm_name
+from .online import OnlineScheduler
+from .raid import DiskArray
+from .trace import Trace, load_trace
 
-__all__ = ['DiskScheduler']
+__all__ = ['CostModel', 'DiskArray', 'DiskScheduler', 'OnlineScheduler', 'Trace', 'load_trace', 'normalize_algorithm_name']
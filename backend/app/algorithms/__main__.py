@@ -0,0 +1,232 @@
+"""
+Command-line disk scheduling simulator.
+
+Only the algorithms package is imported (no Django settings, apps or
+database), so it starts quickly for offline analysis.
+
+Usage (from backend/):
+    python -m app.algorithms replay trace.bin --initial-position 0 --disk-size 1000000
+    python -m app.algorithms replay trace.csv --time-column time --algorithm SSTF --arrival-times
+    cat lbas.txt | python -m app.algorithms replay - --column 0
+    python -m app.algorithms sweep trace.bin --initial-positions 0,500,999 --directions left,right \
+        --n-steps 2,4,8,16 --output sweep.csv
+
+"replay" is the default command, so "python -m app.algorithms trace.bin" works too.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from itertools import product
+
+from .disk_scheduling import DiskScheduler
+from .online import OnlineScheduler
+from .parallel import SWEEP_COLUMNS, sweep
+from .registry import registry
+from .trace import FORMATS, load_trace
+
+
+COMMANDS = ("replay", "sweep")
+
+OUTPUT_FORMATS = ("csv", "columns", "parquet")
+
+SUMMARY_FIELDS = ("algorithm", "total_seek_time", "average_seek_time", "total_requests", "seek_statistics", "cost",
+                  "latency")
+ONLINE_FIELDS = ("average_wait_time", "max_wait_time", "makespan")
+
+
+def _column(value: str):
+    return int(value) if value.isdigit() else value
+
+
+def _int_list(value: str):
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def _str_list(value: str):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _read_trace(args):
+    """Load the trace named on the command line ("-" reads stdin, CSV unless --format is given)"""
+    source = args.trace
+    format = args.format
+    if source == "-":
+        format = format or "csv"
+        source = sys.stdin.buffer if format.startswith("bin") else sys.stdin
+    return load_trace(source, format=format, sectors_per_track=args.sectors_per_track, column=args.column,
+                      time_column=args.time_column, delimiter=args.delimiter, action=args.action)
+
+
+def _default_disk_size(trace, initial_position: int) -> int:
+    return max(max(trace.requests, default=0), initial_position) + 1
+
+
+def replay(trace, algorithms, initial_position: int, disk_size: int, direction: str, n_step: int,
+           arrival_times: bool = False, time_per_track: float = 1.0, include_sequence: bool = False) -> list:
+    """Run each algorithm over a loaded trace and return one summary dict per algorithm"""
+    if arrival_times:
+        if trace.arrival_times is None:
+            raise ValueError("trace has no timestamps (set --time-column for CSV traces)")
+        scheduler = OnlineScheduler(trace.requests, trace.arrival_times, initial_position, disk_size, time_per_track)
+        fields = SUMMARY_FIELDS + ONLINE_FIELDS
+    else:
+        scheduler = DiskScheduler(trace.requests, initial_position, disk_size)
+        fields = SUMMARY_FIELDS
+    if include_sequence:
+        fields += ("sequence",)
+
+    summaries = []
+    for algorithm in algorithms:
+        result = scheduler.simulate(algorithm, direction, n_step, latency=True)
+        summaries.append({field: result[field] for field in fields})
+    return summaries
+
+
+def sweep_grid(algorithms, initial_positions, disk_sizes, directions, n_steps) -> list:
+    """
+    Expand parameter lists into sweep points
+
+    Parameters an algorithm ignores are not swept: FCFS and SSTF run once per
+    (initial_position, disk_size) with direction None, and n_step is only
+    varied for N-Step SCAN.
+    """
+    points = []
+    for initial_position, disk_size, algorithm in product(initial_positions, disk_sizes, algorithms):
+        spec = registry.get(algorithm)
+        algorithm = spec.name
+        algorithm_directions = directions if spec.uses_direction else [None]
+        algorithm_n_steps = n_steps if "n_step" in spec.parameters else [None]
+        for direction, n_step in product(algorithm_directions, algorithm_n_steps):
+            points.append((initial_position, disk_size, algorithm, direction, n_step))
+    return points
+
+
+def write_rows(rows: list, output, output_format: str):
+    """
+    Write sweep rows
+
+    Args:
+        rows: Row dicts with SWEEP_COLUMNS keys
+        output: Path, or None for stdout (parquet needs a path)
+        output_format: "csv", "columns" (JSON object of column arrays) or
+            "parquet" (requires the optional pyarrow package)
+    """
+    if output_format == "parquet":
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("parquet output requires pyarrow (pip install pyarrow)")
+        if output is None:
+            raise ValueError("parquet output requires --output")
+        table = pyarrow.table({column: [row[column] for row in rows] for column in SWEEP_COLUMNS})
+        pyarrow.parquet.write_table(table, output)
+        return
+
+    stream = open(output, "w", newline="") if output else sys.stdout
+    try:
+        if output_format == "csv":
+            writer = csv.DictWriter(stream, fieldnames=SWEEP_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump({
+                "columns": list(SWEEP_COLUMNS),
+                "rows": len(rows),
+                "data": {column: [row[column] for row in rows] for column in SWEEP_COLUMNS},
+            }, stream)
+            stream.write("\n")
+    finally:
+        if output:
+            stream.close()
+
+
+def _output_format(args) -> str:
+    if args.output_format:
+        return args.output_format
+    if args.output and args.output.endswith(".parquet"):
+        return "parquet"
+    if args.output and args.output.endswith(".json"):
+        return "columns"
+    return "csv"
+
+
+def _add_trace_arguments(parser):
+    parser.add_argument("trace", help="trace file, or - for stdin")
+    parser.add_argument("--format", choices=FORMATS, help="trace format (default: from the file extension)")
+    parser.add_argument("--sectors-per-track", type=int, default=1, help="LBAs per track")
+    parser.add_argument("--column", type=_column, default="lba", help="CSV LBA column (name or index)")
+    parser.add_argument("--time-column", type=_column, help="CSV arrival time column (name or index)")
+    parser.add_argument("--delimiter", default=",", help="CSV delimiter")
+    parser.add_argument("--action", default="Q", help="blkparse event action to replay")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.algorithms",
+                                     description="Offline disk scheduling simulator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    replay_parser = commands.add_parser("replay", help="run algorithms over one trace, print a JSON summary")
+    _add_trace_arguments(replay_parser)
+    replay_parser.add_argument("--algorithm", action="append",
+                               help=f"algorithm to run, repeatable (default: all of {', '.join(registry.names('compare'))}; "
+                                    f"with --arrival-times, all of {', '.join(registry.names('online'))})")
+    replay_parser.add_argument("--initial-position", type=int, default=0)
+    replay_parser.add_argument("--disk-size", type=int, help="number of tracks (default: largest track + 1)")
+    replay_parser.add_argument("--direction", choices=("left", "right"), default="right")
+    replay_parser.add_argument("--n-step", type=int, default=4)
+    replay_parser.add_argument("--arrival-times", action="store_true",
+                               help="replay trace timestamps through the online (event-driven) simulation")
+    replay_parser.add_argument("--time-per-track", type=float, default=1.0)
+    replay_parser.add_argument("--sequence", action="store_true", help="include the service sequence in the output")
+
+    sweep_parser = commands.add_parser("sweep", help="run a parameter grid on all cores, write one row per run")
+    _add_trace_arguments(sweep_parser)
+    sweep_parser.add_argument("--algorithms", type=_str_list, default=list(registry.names("compare")),
+                              help="comma-separated algorithms (default: all)")
+    sweep_parser.add_argument("--initial-positions", type=_int_list, default=[0],
+                              help="comma-separated initial head positions")
+    sweep_parser.add_argument("--disk-sizes", type=_int_list,
+                              help="comma-separated disk sizes (default: largest track + 1)")
+    sweep_parser.add_argument("--directions", type=_str_list, default=["left", "right"],
+                              help="comma-separated directions")
+    sweep_parser.add_argument("--n-steps", type=_int_list, default=[4], help="comma-separated N-Step SCAN batch sizes")
+    sweep_parser.add_argument("--workers", type=int, help="worker processes (default: number of CPUs)")
+    sweep_parser.add_argument("--output", help="output file (default: stdout)")
+    sweep_parser.add_argument("--output-format", choices=OUTPUT_FORMATS,
+                              help="csv, columns (columnar JSON) or parquet (default: from --output extension, else csv)")
+    return parser
+
+
+def main(argv=None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] not in COMMANDS and argv[0] not in ("-h", "--help"):
+        argv.insert(0, "replay")
+    args = build_parser().parse_args(argv)
+
+    try:
+        trace = _read_trace(args)
+        if args.command == "replay":
+            disk_size = args.disk_size or _default_disk_size(trace, args.initial_position)
+            algorithms = args.algorithm or registry.names("online" if args.arrival_times else "compare")
+            results = replay(trace, algorithms, args.initial_position, disk_size,
+                             args.direction, args.n_step, args.arrival_times, args.time_per_track, args.sequence)
+            json.dump({"trace": trace.summary(), "disk_size": disk_size, "results": results}, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+            return 0
+
+        disk_sizes = args.disk_sizes or [_default_disk_size(trace, max(args.initial_positions))]
+        points = sweep_grid(args.algorithms, args.initial_positions, disk_sizes, args.directions, args.n_steps)
+        rows = sweep(trace.requests, points, max_workers=args.workers)
+        write_rows(rows, args.output, _output_format(args))
+        print(f"{len(rows)} runs over {len(trace)} requests", file=sys.stderr)
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
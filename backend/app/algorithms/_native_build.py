@@ -0,0 +1,191 @@
+"""
+Build script for the optional compiled kernels (app.algorithms._native).
+
+Needs cffi and a C compiler. Run from backend/:
+
+    pip install cffi
+    python -m app.algorithms._native_build
+
+The extension is written next to this file; app.algorithms.native picks it up
+on the next import and falls back to pure Python when it is missing. The
+kernels work on contiguous int64 buffers and produce exactly the values of
+the Python implementations in disk_scheduling.py.
+"""
+
+from pathlib import Path
+
+from cffi import FFI
+
+
+CDEF = """
+    int64_t seek_total(const int64_t *sequence, size_t count, int64_t initial_position);
+    int64_t sstf(const int64_t *requests, size_t count, int64_t initial_position, int64_t *out);
+    int64_t batched_scan(const int64_t *requests, size_t count, size_t batch_size, int64_t initial_position,
+                         int going_right, int alternate, int64_t last_track, int64_t *out, int64_t *total_seek,
+                         int64_t *stops, int64_t *stop_count);
+"""
+
+SOURCE = r"""
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+int64_t seek_total(const int64_t *sequence, size_t count, int64_t initial_position)
+{
+    int64_t total = 0, position = initial_position;
+    for (size_t i = 0; i < count; i++) {
+        int64_t distance = sequence[i] - position;
+        total += distance < 0 ? -distance : distance;
+        position = sequence[i];
+    }
+    return total;
+}
+
+typedef struct { int64_t track; int64_t index; } entry_t;
+
+static int compare_entries(const void *a, const void *b)
+{
+    const entry_t *x = a, *y = b;
+    if (x->track != y->track) return x->track < y->track ? -1 : 1;
+    return x->index < y->index ? -1 : (x->index > y->index);
+}
+
+static int compare_tracks(const void *a, const void *b)
+{
+    int64_t x = *(const int64_t *)a, y = *(const int64_t *)b;
+    return x < y ? -1 : (x > y);
+}
+
+/* DiskScheduler.sstf: visited tracks always form an interval around the head,
+   so the candidates are the nearest unvisited distinct track on either side;
+   ties go to the track requested first. Writes count entries, returns count
+   or -1 when out of memory. */
+int64_t sstf(const int64_t *requests, size_t count, int64_t initial_position, int64_t *out)
+{
+    if (count == 0) return 0;
+    entry_t *entries = malloc(count * sizeof(entry_t));
+    if (entries == NULL) return -1;
+    for (size_t i = 0; i < count; i++) {
+        entries[i].track = requests[i];
+        entries[i].index = (int64_t)i;
+    }
+    qsort(entries, count, sizeof(entry_t), compare_entries);
+
+    /* Collapse into distinct tracks: entries[d] keeps the track and its first
+       index, runs[d] the number of copies */
+    size_t *runs = malloc(count * sizeof(size_t));
+    if (runs == NULL) { free(entries); return -1; }
+    size_t size = 0;
+    for (size_t i = 0; i < count; i++) {
+        if (size > 0 && entries[size - 1].track == entries[i].track) {
+            runs[size - 1]++;
+        } else {
+            entries[size] = entries[i];
+            runs[size++] = 1;
+        }
+    }
+
+    /* First distinct track strictly right of the head */
+    size_t low = 0, high = size;
+    while (low < high) {
+        size_t middle = low + (high - low) / 2;
+        if (entries[middle].track <= initial_position) low = middle + 1; else high = middle;
+    }
+    int64_t right = (int64_t)low, left = right - 1, filled = 0;
+    int64_t position = initial_position;
+    while (left >= 0 || right < (int64_t)size) {
+        int64_t chosen;
+        if (left < 0) {
+            chosen = right;
+        } else if (right >= (int64_t)size) {
+            chosen = left;
+        } else {
+            int64_t left_distance = position - entries[left].track;
+            int64_t right_distance = entries[right].track - position;
+            if (left_distance < right_distance) chosen = left;
+            else if (right_distance < left_distance) chosen = right;
+            else chosen = entries[left].index < entries[right].index ? left : right;
+        }
+        position = entries[chosen].track;
+        for (size_t copy = 0; copy < runs[chosen]; copy++) out[filled++] = position;
+        if (chosen == left) left--; else right++;
+    }
+    free(runs);
+    free(entries);
+    return filled;
+}
+
+/* DiskScheduler._batched_scan / scan_pass: SCAN over consecutive batches of
+   batch_size requests, with a disk-end stop before reversing inside a batch.
+   out needs count + ceil(count / batch_size) entries, stops one per batch.
+   Returns the number of entries written (-1 when out of memory) and stores
+   the seek total and the indexes in out of the disk-end stops. */
+int64_t batched_scan(const int64_t *requests, size_t count, size_t batch_size, int64_t initial_position,
+                     int going_right, int alternate, int64_t last_track, int64_t *out, int64_t *total_seek,
+                     int64_t *stops, int64_t *stop_count)
+{
+    *total_seek = 0;
+    *stop_count = 0;
+    if (count == 0) return 0;
+    size_t capacity = batch_size < count ? batch_size : count;
+    int64_t *batch = malloc(capacity * sizeof(int64_t));
+    if (batch == NULL) return -1;
+    int64_t position = initial_position, filled = 0, total = 0;
+    for (size_t start = 0; start < count; start += batch_size) {
+        size_t size = count - start < batch_size ? count - start : batch_size;
+        memcpy(batch, requests + start, size * sizeof(int64_t));
+        qsort(batch, size, sizeof(int64_t), compare_tracks);
+        size_t low = 0, high = size, split;
+        if (going_right) {
+            /* bisect_left: first request >= position */
+            while (low < high) {
+                size_t middle = low + (high - low) / 2;
+                if (batch[middle] < position) low = middle + 1; else high = middle;
+            }
+            split = low;
+            for (size_t i = split; i < size; i++) out[filled++] = batch[i];
+            if (split == 0) {
+                total += batch[size - 1] - position;
+                position = batch[size - 1];
+            } else {
+                stops[(*stop_count)++] = filled;
+                out[filled++] = last_track;
+                for (size_t i = split; i-- > 0;) out[filled++] = batch[i];
+                total += (last_track - position) + (last_track - batch[0]);
+                position = batch[0];
+            }
+        } else {
+            /* bisect_right: first request > position */
+            while (low < high) {
+                size_t middle = low + (high - low) / 2;
+                if (batch[middle] <= position) low = middle + 1; else high = middle;
+            }
+            split = low;
+            for (size_t i = split; i-- > 0;) out[filled++] = batch[i];
+            if (split == size) {
+                total += position - batch[0];
+                position = batch[0];
+            } else {
+                stops[(*stop_count)++] = filled;
+                out[filled++] = 0;
+                for (size_t i = split; i < size; i++) out[filled++] = batch[i];
+                total += position + batch[size - 1];
+                position = batch[size - 1];
+            }
+        }
+        if (alternate) going_right = !going_right;
+    }
+    free(batch);
+    *total_seek = total;
+    return filled;
+}
+"""
+
+ffibuilder = FFI()
+ffibuilder.cdef(CDEF)
+ffibuilder.set_source("app.algorithms._native", SOURCE, extra_compile_args=["-O2"])
+
+
+if __name__ == "__main__":
+    # backend/, so the module lands in backend/app/algorithms/
+    ffibuilder.compile(tmpdir=str(Path(__file__).resolve().parents[2]), verbose=True)
@@ -0,0 +1,127 @@
+"""
+Result cache for DiskScheduler simulations.
+
+Simulation results are deterministic in their inputs, so identical
+(requests, initial_position, disk_size, algorithm, direction, n_step)
+payloads can be served from memory instead of being recomputed.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Sequence
+
+from .disk_scheduling import normalize_algorithm_name, pack_requests
+from .registry import registry
+
+
+def fingerprint(requests: Sequence[int], initial_position: int, disk_size: int,
+                algorithm: str, direction: str = "right", n_step: Optional[int] = None,
+                cost_model: Optional[dict] = None, qos: Optional[dict] = None, latency: bool = False) -> str:
+    """
+    Hash a canonicalized simulation input
+
+    Parameters the algorithm does not read, according to its registry spec,
+    are dropped (direction for FCFS and SSTF, n_step for everything except
+    N-Step SCAN) and n_step is resolved to the value simulate() would use, so
+    equivalent payloads share a key.
+    cost_model is the service-time model configuration (CostModel.to_dict()).
+    qos holds the per-request deadlines/priorities/writes; it only enters the
+    key of algorithms with the "deadlines" capability.
+    latency marks results that carry the per-request wait distribution.
+
+    Returns:
+        Hex digest identifying the simulation
+    """
+    algorithm = normalize_algorithm_name(algorithm)
+    spec = registry.get(algorithm) if algorithm in registry else None
+    parameters = spec.parameters if spec is not None else ("direction", "n_step")
+    if spec is not None and not spec.supports("deadlines"):
+        qos = None
+    direction = str(direction).lower() if "direction" in parameters else None
+    if "n_step" in parameters:
+        n_step = n_step if n_step is not None and n_step >= 1 else 4
+    else:
+        n_step = None
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(
+        [algorithm, direction, n_step, initial_position, disk_size, len(requests), cost_model],
+        sort_keys=True
+    ).encode())
+    try:
+        # Hash the packed buffer instead of serializing element by element
+        digest.update(memoryview(pack_requests(requests)).cast('B'))
+    except (OverflowError, TypeError):
+        digest.update(json.dumps(list(requests)).encode())
+    if qos:
+        digest.update(json.dumps(qos, sort_keys=True).encode())
+    if latency:
+        digest.update(b"latency")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """In-process LRU cache with size and TTL eviction"""
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 300):
+        """
+        Args:
+            max_entries: Maximum number of cached results
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached result for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return dict(value)
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: dict):
+        """Store a result, evicting the least recently used entries when full"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "local",
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -0,0 +1,163 @@
+"""
+Service-time cost model for disk scheduling.
+
+Track distance is only a proxy for cost. CostModel converts a schedule into
+milliseconds using a two-phase seek curve (settle + square-root phase for
+short seeks, linear phase for long ones), average rotational latency from the
+spindle speed, and transfer time for the request size, and derives IOPS.
+"""
+
+from math import sqrt
+from typing import Optional
+
+from .seek import np, seek_distances
+
+
+class CostModel:
+    """Converts head movements and serviced requests into milliseconds"""
+
+    FIELDS = (
+        "cylinders", "settle_ms", "track_to_track_ms", "full_stroke_ms",
+        "short_seek_tracks", "rpm", "transfer_rate_mb_s", "request_size_kb",
+    )
+
+    def __init__(self, cylinders: int = 200, settle_ms: float = 0.5, track_to_track_ms: float = 1.0,
+                 full_stroke_ms: float = 15.0, short_seek_tracks: Optional[int] = None, rpm: float = 7200,
+                 transfer_rate_mb_s: float = 150.0, request_size_kb: float = 4.0):
+        """
+        Initialize the cost model
+
+        Args:
+            cylinders: Number of tracks the seek curve spans (usually disk_size)
+            settle_ms: Head settle time paid by every non-zero seek
+            track_to_track_ms: Seek time for a one-track move (includes settle)
+            full_stroke_ms: Seek time across the whole disk (includes settle)
+            short_seek_tracks: Distance where the sqrt phase hands over to the
+                linear phase (default: a third of the disk)
+            rpm: Spindle speed, used for average rotational latency
+            transfer_rate_mb_s: Media transfer rate
+            request_size_kb: Size of each request
+        """
+        if cylinders < 1:
+            raise ValueError("cylinders must be at least 1")
+        if min(settle_ms, track_to_track_ms, full_stroke_ms) < 0:
+            raise ValueError("seek times must not be negative")
+        if track_to_track_ms < settle_ms:
+            raise ValueError("track_to_track_ms must include settle_ms")
+        if rpm <= 0 or transfer_rate_mb_s <= 0 or request_size_kb < 0:
+            raise ValueError("rpm and transfer_rate_mb_s must be positive, request_size_kb non-negative")
+        self.cylinders = cylinders
+        self.settle_ms = float(settle_ms)
+        self.track_to_track_ms = float(track_to_track_ms)
+        self.full_stroke_ms = float(full_stroke_ms)
+        self.short_seek_tracks = short_seek_tracks if short_seek_tracks is not None else max(1, (cylinders - 1) // 3)
+        self.rpm = float(rpm)
+        self.transfer_rate_mb_s = float(transfer_rate_mb_s)
+        self.request_size_kb = float(request_size_kb)
+
+        # Short seeks: settle + a * sqrt(d), with seek(1) == track_to_track_ms
+        self._sqrt_coefficient = self.track_to_track_ms - self.settle_ms
+        # Long seeks: continue linearly from the hand-over point to full_stroke_ms
+        self._handover_ms = self.settle_ms + self._sqrt_coefficient * sqrt(self.short_seek_tracks)
+        remaining_tracks = (cylinders - 1) - self.short_seek_tracks
+        if remaining_tracks > 0:
+            self._linear_slope = max(0.0, (self.full_stroke_ms - self._handover_ms) / remaining_tracks)
+        else:
+            self._linear_slope = 0.0
+
+    @classmethod
+    def from_dict(cls, config: Optional[dict], cylinders: int = 200) -> "CostModel":
+        """
+        Build a cost model from a (possibly partial) configuration dict
+
+        Raises:
+            ValueError: On unknown keys or invalid values
+        """
+        config = dict(config or {})
+        unknown = set(config) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown cost model parameter(s): {', '.join(sorted(unknown))}")
+        config.setdefault("cylinders", cylinders)
+        try:
+            return cls(**config)
+        except TypeError as e:
+            raise ValueError(f"Invalid cost model: {e}")
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @property
+    def rotational_latency_ms(self) -> float:
+        """Average rotational latency: half a revolution"""
+        return 30000.0 / self.rpm
+
+    @property
+    def transfer_ms(self) -> float:
+        """Time to transfer one request"""
+        return self.request_size_kb / 1024.0 / self.transfer_rate_mb_s * 1000.0
+
+    def seek_time_ms(self, distance: int) -> float:
+        """Seek time for a head movement of the given number of tracks"""
+        if distance <= 0:
+            return 0.0
+        if distance <= self.short_seek_tracks:
+            return self.settle_ms + self._sqrt_coefficient * sqrt(distance)
+        return self._handover_ms + self._linear_slope * (distance - self.short_seek_tracks)
+
+    def seek_times_ms(self, sequence, initial_position: int, distances=None):
+        """
+        Seek time of every movement of a sequence
+
+        Args:
+            sequence: Sequence of track accesses
+            initial_position: Head position before the first access
+            distances: seek_distances(sequence, initial_position), when already computed
+
+        Returns:
+            NumPy float64 array for large sequences when NumPy is available,
+            otherwise a list of floats (same values either way)
+        """
+        if distances is None:
+            distances = seek_distances(sequence, initial_position)
+        if np is not None and isinstance(distances, np.ndarray):
+            as_float = distances.astype(np.float64)
+            short = self.settle_ms + self._sqrt_coefficient * np.sqrt(as_float)
+            long = self._handover_ms + self._linear_slope * (as_float - self.short_seek_tracks)
+            times = np.where(distances <= self.short_seek_tracks, short, long)
+            return np.where(distances > 0, times, 0.0)
+        seek_time = self.seek_time_ms
+        return [seek_time(d) for d in distances]
+
+    def total_seek_time_ms(self, sequence, initial_position: int, distances=None) -> float:
+        """Sum of seek times over every movement of a sequence"""
+        times = self.seek_times_ms(sequence, initial_position, distances)
+        if np is not None and isinstance(times, np.ndarray):
+            return float(times.sum())
+        return sum(times)
+
+    def service_cost(self, sequence, initial_position: int, request_count: int, distances=None) -> dict:
+        """
+        Cost of servicing a schedule
+
+        Args:
+            sequence: Sequence of track accesses (may include end-of-disk stops)
+            initial_position: Head position before the first access
+            request_count: Number of requests serviced (rotation/transfer are paid per request)
+            distances: seek_distances(sequence, initial_position), when already computed
+
+        Returns:
+            Dictionary with total/seek/rotational/transfer milliseconds,
+            average milliseconds per request and IOPS
+        """
+        seek_ms = self.total_seek_time_ms(sequence, initial_position, distances)
+        rotational_ms = self.rotational_latency_ms * request_count
+        transfer_ms = self.transfer_ms * request_count
+        total_ms = seek_ms + rotational_ms + transfer_ms
+        return {
+            "total_ms": round(total_ms, 3),
+            "seek_ms": round(seek_ms, 3),
+            "rotational_latency_ms": round(rotational_ms, 3),
+            "transfer_ms": round(transfer_ms, 3),
+            "average_ms": round(total_ms / request_count, 3) if request_count else 0,
+            "iops": round(request_count / (total_ms / 1000.0), 2) if total_ms > 0 else 0,
+        }
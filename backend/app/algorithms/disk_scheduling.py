@@ -3,34 +3,291 @@ Disk Scheduling Algorithms Implementation
 Implements various disk scheduling algorithms for efficient disk I/O operations.
 """
 
-from typing import List, Tuple, Optional
-from copy import deepcopy
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from math import inf
+from typing import Callable, List, Tuple, Optional, Sequence
+
+from . import native
+from .cost_model import CostModel
+from .latency import LatencyStats, schedule_latency
+from .optimal import minimum_travel, optimal_wait_order
+from .pending import PendingTracks
+from .registry import AlgorithmSpec, registry
+from .seek import NUMPY_MIN_SIZE, np, seek_distances, seek_statistics
+
+
+def normalize_algorithm_name(algorithm: str) -> str:
+    """
+    Normalize an algorithm name to the label used in simulation results
+
+    Args:
+        algorithm: Algorithm name as supplied by the caller
+
+    Returns:
+        Canonical registry name for known algorithms and aliases (e.g.
+        "nstep scan" -> "N-STEP SCAN", "cscan" -> "C-SCAN"), otherwise the
+        upper-cased name
+    """
+    return registry.resolve(algorithm) or algorithm.upper().strip()
+
+
+def scan_pass(batch: List[int], position: int, going_right: bool, last_track: int,
+              out: list, offset: int, stops: Optional[list] = None) -> Tuple[int, int, int]:
+    """
+    Write the SCAN order of one sorted batch into a preallocated output list
+
+    Produces the same stops as DiskScheduler(batch, position).scan() (including
+    the disk-end stop before reversing) without building a scheduler, and
+    computes the seek total from the batch extremes instead of summing moves.
+
+    Args:
+        batch: Requests of the batch in ascending order (already validated)
+        position: Head position before the batch
+        going_right: Direction of the pass
+        last_track: disk_size - 1
+        out: Output list with room for len(batch) + 1 entries from offset
+        offset: Index in out where the batch starts
+        stops: When given, the index in out of the disk-end stop is appended
+
+    Returns:
+        Tuple of (offset after the batch, head position after it, seek total)
+    """
+    size = len(batch)
+    if going_right:
+        split = bisect_left(batch, position)
+        out[offset:offset + size - split] = batch[split:]
+        offset += size - split
+        if split == 0:
+            return offset, batch[-1], batch[-1] - position
+        if stops is not None:
+            stops.append(offset)
+        out[offset] = last_track
+        out[offset + 1:offset + 1 + split] = batch[split - 1::-1]
+        return offset + 1 + split, batch[0], (last_track - position) + (last_track - batch[0])
+
+    split = bisect_right(batch, position)
+    out[offset:offset + split] = batch[split - 1::-1] if split else []
+    offset += split
+    if split == size:
+        return offset, batch[0], position - batch[0]
+    if stops is not None:
+        stops.append(offset)
+    out[offset] = 0
+    out[offset + 1:offset + 1 + size - split] = batch[split:]
+    return offset + 1 + size - split, batch[-1], position + batch[-1]
+
+
+# Linux mq-deadline defaults: FIFO expiry per direction, requests dispatched
+# in sector order per batch, and reads preferred over writes this many times
+DEADLINE_READ_EXPIRE_MS = 500.0
+DEADLINE_WRITE_EXPIRE_MS = 5000.0
+DEADLINE_FIFO_BATCH = 16
+DEADLINE_WRITES_STARVED = 2
+
+# Linux anticipatory scheduler defaults: FIFO expiry and batch time slice per
+# direction, and backward seeks costing twice as much as forward ones
+ANTICIPATORY_READ_EXPIRE_MS = 125.0
+ANTICIPATORY_WRITE_EXPIRE_MS = 250.0
+ANTICIPATORY_READ_BATCH_MS = 500.0
+ANTICIPATORY_WRITE_BATCH_MS = 125.0
+ANTICIPATORY_BACK_SEEK_PENALTY = 2
+
+
+def _per_request(values: Optional[Sequence], count: int, name: str, convert) -> Optional[list]:
+    """Validate an optional per-request list (deadlines, priorities, writes)"""
+    if values is None:
+        return None
+    if len(values) != count:
+        raise ValueError(f"{name} must have one entry per request")
+    try:
+        return [convert(value) for value in values]
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} contains an invalid value")
+
+
+def _optional_deadline(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _copy_requests(requests: Sequence[int]) -> Sequence[int]:
+    """Shallow copy of a request container, keeping its type where possible"""
+    if isinstance(requests, array):
+        return array(requests.typecode, requests)
+    if hasattr(requests, "copy"):
+        return requests.copy()  # list, NumPy array
+    return list(requests)
+
+
+def pack_requests(requests: Sequence[int]) -> array:
+    """Requests as a packed array('q'), without a per-element loop for buffer inputs"""
+    if isinstance(requests, array) and requests.typecode == "q":
+        return requests
+    if np is not None and isinstance(requests, (np.ndarray, array, memoryview)):
+        packed = array("q")
+        packed.frombytes(np.ascontiguousarray(requests, dtype=np.int64).tobytes())
+        return packed
+    return array("q", requests)
+
+
+class SeekOperations:
+    """
+    Lazy view of the (from, to) head movements of a sequence
+
+    Only the sequence and the starting head position are stored; the pairs are
+    produced on demand, so a result does not hold a second copy of the schedule.
+    Supports len(), iteration, indexing and slicing like a list of tuples.
+    """
+
+    __slots__ = ("sequence", "initial_position")
+
+    def __init__(self, sequence, initial_position: int):
+        self.sequence = sequence
+        self.initial_position = initial_position
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    def __iter__(self):
+        return zip(chain((self.initial_position,), self.sequence), self.sequence)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seek operation index out of range")
+        from_pos = self.sequence[index - 1] if index > 0 else self.initial_position
+        return (from_pos, self.sequence[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SeekOperations, list, tuple)):
+            return len(self) == len(other) and all(
+                tuple(a) == tuple(b) for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SeekOperations(len={len(self)}, initial_position={self.initial_position})"
+
+    def tolist(self) -> List[List[int]]:
+        """Materialize as a JSON-friendly list of [from, to] pairs"""
+        return [[from_pos, to] for from_pos, to in self]
 
 
 class DiskScheduler:
     """Main class for disk scheduling algorithms"""
     
-    def __init__(self, requests: List[int], initial_position: int, disk_size: int = 200):
+    def __init__(self, requests: Sequence[int], initial_position: int, disk_size: int = 200,
+                 cost_model: Optional[CostModel] = None, copy: bool = False,
+                 progress: Optional[Callable[[int, int], None]] = None,
+                 deadlines: Optional[Sequence[Optional[float]]] = None,
+                 priorities: Optional[Sequence[int]] = None,
+                 writes: Optional[Sequence[bool]] = None):
         """
         Initialize the disk scheduler
         
         Args:
-            requests: List of track requests
+            requests: Track requests: a list, array.array, NumPy array, memoryview
+                or any other sequence of ints. It is used as-is, not copied
             initial_position: Initial head position
             disk_size: Total number of tracks on the disk
+            cost_model: Service-time model used to report milliseconds and IOPS
+                (defaults to CostModel spanning disk_size cylinders)
+            copy: Keep a private copy of requests, for callers that mutate the
+                input after constructing the scheduler
+            progress: Optional callback(done, total) invoked as an algorithm
+                advances (about 100 times for long runs, and once on completion)
+            deadlines: Optional per-request deadline in milliseconds from the
+                start of the simulation (None entries have no deadline), used
+                by the deadline-aware algorithms and counted as misses
+            priorities: Optional per-request priority class; lower values are
+                served first by the deadline-aware algorithms (default 0)
+            writes: Optional per-request flag marking writes (default: reads),
+                used by DEADLINE and ANTICIPATORY
         """
-        self.requests = deepcopy(requests)
+        self.requests = _copy_requests(requests) if copy else requests
         self.initial_position = initial_position
         self.disk_size = disk_size
+        self.cost_model = cost_model if cost_model is not None else CostModel(cylinders=disk_size)
+        self.progress = progress
+        self._request_list = None
+        self._sorted_requests = None
         self.validate_requests()
+        count = len(self.requests)
+        self.deadlines = _per_request(deadlines, count, "deadlines", _optional_deadline)
+        self.priorities = _per_request(priorities, count, "priorities", int)
+        self.writes = _per_request(writes, count, "writes", bool)
     
     def validate_requests(self):
         """Validate that all requests are within disk bounds"""
-        for req in self.requests:
-            if req < 0 or req >= self.disk_size:
-                raise ValueError(f"Request {req} is out of bounds (0-{self.disk_size-1})")
+        requests = self.requests
+        if len(requests) == 0:
+            return
+        # One min/max pass (vectorized for buffers); the slow scan below only
+        # runs to report the first offending request
+        if np is not None and isinstance(requests, (np.ndarray, array, memoryview)):
+            values = np.asarray(requests)
+            low, high = values.min(), values.max()
+        else:
+            low, high = min(requests), max(requests)
+        if low < 0 or high >= self.disk_size:
+            for req in requests:
+                if req < 0 or req >= self.disk_size:
+                    raise ValueError(f"Request {req} is out of bounds (0-{self.disk_size-1})")
+    
+    def request_list(self) -> List[int]:
+        """
+        Requests as a list of Python ints, converted once for buffer inputs
+        (a list input is returned as-is)
+        """
+        if self._request_list is None:
+            requests = self.requests
+            if isinstance(requests, list):
+                self._request_list = requests
+            elif hasattr(requests, "tolist"):
+                self._request_list = requests.tolist()
+            else:
+                self._request_list = list(requests)
+        return self._request_list
+    
+    def sorted_requests(self) -> List[int]:
+        """
+        Requests in ascending order, sorted once and shared by the elevator-family
+        algorithms (SCAN, C-SCAN, LOOK, C-LOOK) across calls on this scheduler.
+        """
+        if self._sorted_requests is None:
+            requests = self.requests
+            if np is not None and isinstance(requests, (np.ndarray, array, memoryview)) and len(requests) >= NUMPY_MIN_SIZE:
+                self._sorted_requests = np.sort(np.asarray(requests)).tolist()
+            else:
+                self._sorted_requests = sorted(self.request_list())
+        return self._sorted_requests
+    
+    def split_requests(self, going_right: bool) -> Tuple[List[int], List[int]]:
+        """
+        Split the sorted requests around the initial head position
+        
+        Requests exactly at the head position belong to the side the head is
+        moving towards.
+        
+        Args:
+            going_right: Whether the head initially moves towards higher tracks
+            
+        Returns:
+            Tuple of (left_side, right_side), both in ascending order
+        """
+        ordered = self.sorted_requests()
+        if going_right:
+            split = bisect_left(ordered, self.initial_position)
+        else:
+            split = bisect_right(ordered, self.initial_position)
+        return ordered[:split], ordered[split:]
     
-    def calculate_seek_time(self, sequence: List[int]) -> Tuple[int, List[Tuple[int, int]]]:
+    def calculate_seek_time(self, sequence: List[int]) -> Tuple[int, SeekOperations]:
         """
         Calculate total seek time and individual seek operations
         
@@ -38,24 +295,22 @@ class DiskScheduler:
             sequence: Sequence of track accesses
             
         Returns:
-            Tuple of (total_seek_time, list of (from, to) operations)
+            Tuple of (total_seek_time, lazy view of (from, to) operations)
         """
+        seek_operations = SeekOperations(sequence, self.initial_position)
         if not sequence:
-            return 0, []
+            return 0, seek_operations
+        if native.use_native(len(sequence), self.disk_size):
+            total_seek_time = native.seek_total(sequence, self.initial_position)
+            if total_seek_time is not None:
+                return total_seek_time, seek_operations
         
-        seek_operations = []
-        total_seek_time = 0
-        current = self.initial_position
-        
-        for track in sequence:
-            seek_distance = abs(track - current)
-            seek_operations.append((current, track))
-            total_seek_time += seek_distance
-            current = track
+        distances = seek_distances(sequence, self.initial_position)
+        total_seek_time = int(distances.sum()) if np is not None and isinstance(distances, np.ndarray) else sum(distances)
         
         return total_seek_time, seek_operations
     
-    def fcfs(self) -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def fcfs(self) -> Tuple[List[int], int, SeekOperations]:
         """
         First Come First Served (FCFS) Algorithm
         Services requests in the order they arrive.
@@ -63,249 +318,718 @@ class DiskScheduler:
         Returns:
             Tuple of (sequence, total_seek_time, seek_operations)
         """
-        sequence = self.requests.copy()
+        sequence = list(self.request_list())
         total_seek_time, seek_operations = self.calculate_seek_time(sequence)
         return sequence, total_seek_time, seek_operations
     
-    def sstf(self) -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def sstf(self) -> Tuple[List[int], int, SeekOperations]:
         """
         Shortest Seek Time First (SSTF) Algorithm
         Always services the request closest to the current head position.
+        Ties are broken in favour of the request that arrived first.
+
+        Runs in O(n log n): the distinct tracks are sorted once and the head only
+        ever moves to the nearest unvisited neighbour on either side.
         
         Returns:
             Tuple of (sequence, total_seek_time, seek_operations)
         """
-        sequence = []
-        remaining_requests = self.requests.copy()
+        if len(self.requests) == 0:
+            return [], 0, SeekOperations([], self.initial_position)
+        if native.use_native(len(self.requests), self.disk_size):
+            count = len(self.requests)
+            if self.progress is not None:
+                self.progress(0, count)
+            sequence = native.sstf(self.requests, self.initial_position)
+            if sequence is not None:
+                if self.progress is not None:
+                    self.progress(count, count)
+                total_seek_time, seek_operations = self.calculate_seek_time(sequence)
+                return sequence, total_seek_time, seek_operations
+
+        # Collapse duplicates into distinct tracks, remembering how many times each
+        # was requested and the earliest position it appears at in the input. Once a
+        # track is visited every copy of it is at distance 0, so all copies are
+        # serviced together; the earliest index reproduces the tie-break of scanning
+        # the remaining list in arrival order.
+        first_index = {}
+        counts = {}
+        for index, track in enumerate(self.request_list()):
+            if track not in first_index:
+                first_index[track] = index
+                counts[track] = 0
+            counts[track] += 1
+        tracks = sorted(first_index)
+
+        # Doubly linked list over the sorted distinct tracks (-1 / len(tracks) are sentinels)
+        size = len(tracks)
+        prev_link = list(range(-1, size - 1))
+        next_link = list(range(1, size + 1))
+
         current_position = self.initial_position
-        
-        while remaining_requests:
-            # Find the closest request
-            closest = min(remaining_requests, key=lambda x: abs(x - current_position))
-            sequence.append(closest)
-            remaining_requests.remove(closest)
-            current_position = closest
+        right = bisect_right(tracks, current_position)
+        left = right - 1
+        sequence = []
+        visited = 0
+        report_every = max(1, size // 100)
+        report_at = report_every if self.progress is not None else size + 1
+
+        while left >= 0 or right < size:
+            if left < 0:
+                chosen = right
+            elif right >= size:
+                chosen = left
+            else:
+                left_distance = current_position - tracks[left]
+                right_distance = tracks[right] - current_position
+                if left_distance < right_distance:
+                    chosen = left
+                elif right_distance < left_distance:
+                    chosen = right
+                else:
+                    chosen = left if first_index[tracks[left]] < first_index[tracks[right]] else right
+
+            track = tracks[chosen]
+            sequence.extend([track] * counts[track])
+            current_position = track
+            visited += 1
+            if visited == report_at:
+                self.progress(visited, size)
+                report_at += report_every
+
+            # Unlink the serviced track; its neighbours become the new candidates
+            left, right = prev_link[chosen], next_link[chosen]
+            if left >= 0:
+                next_link[left] = right
+            if right < size:
+                prev_link[right] = left
         
         total_seek_time, seek_operations = self.calculate_seek_time(sequence)
         return sequence, total_seek_time, seek_operations
     
-    def scan(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def scan(self, direction: str = "right", stops: Optional[list] = None) -> Tuple[List[int], int, SeekOperations]:
         """
         SCAN Algorithm (Elevator Algorithm)
         Moves the head in one direction until the end, then reverses.
+        When stops is given, the index of the disk-end stop (which services
+        no request) is appended to it.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
         going_right = direction.lower() == "right"
+        left_side, right_side = self.split_requests(going_right)
         
         if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
+            sequence = right_side
             if left_side:
+                if stops is not None:
+                    stops.append(len(sequence))
                 sequence.append(self.disk_size - 1)
-                sequence.extend(sorted(left_side, reverse=True))
+                sequence.extend(reversed(left_side))
         else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
+            sequence = left_side[::-1]
             if right_side:
+                if stops is not None:
+                    stops.append(len(sequence))
                 sequence.append(0)
-                sequence.extend(sorted(right_side))
+                sequence.extend(right_side)
         
         total_seek_time, seek_operations = self.calculate_seek_time(sequence)
         return sequence, total_seek_time, seek_operations
     
-    def c_scan(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def c_scan(self, direction: str = "right", stops: Optional[list] = None) -> Tuple[List[int], int, SeekOperations]:
         """
         C-SCAN Algorithm (Circular SCAN)
         Moves the head in one direction until the end, then jumps to the beginning.
+        When stops is given, the indexes of the two disk-end stops are appended to it.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
         going_right = direction.lower() == "right"
+        left_side, right_side = self.split_requests(going_right)
         
         if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
+            sequence = right_side
             if left_side:
+                if stops is not None:
+                    stops.extend((len(sequence), len(sequence) + 1))
                 sequence.append(self.disk_size - 1)
                 sequence.append(0)
-                sequence.extend(sorted(left_side))
+                sequence.extend(left_side)
         else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
+            sequence = left_side[::-1]
             if right_side:
+                if stops is not None:
+                    stops.extend((len(sequence), len(sequence) + 1))
                 sequence.append(0)
                 sequence.append(self.disk_size - 1)
-                sequence.extend(sorted(right_side, reverse=True))
+                sequence.extend(reversed(right_side))
         
         total_seek_time, seek_operations = self.calculate_seek_time(sequence)
         return sequence, total_seek_time, seek_operations
     
-    def look(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def look(self, direction: str = "right") -> Tuple[List[int], int, SeekOperations]:
         """
         LOOK Algorithm - like SCAN but only to last request in direction.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
+        if len(self.requests) == 0:
+            return [], 0, SeekOperations([], self.initial_position)
         
-        if not remaining_requests:
-            return sequence, 0, []
+        going_right = direction.lower() == "right"
+        left_side, right_side = self.split_requests(going_right)
         
         if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
-            if left_side:
-                sequence.extend(sorted(left_side, reverse=True))
+            sequence = right_side
+            sequence.extend(reversed(left_side))
         else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
-            if right_side:
-                sequence.extend(sorted(right_side))
+            sequence = left_side[::-1]
+            sequence.extend(right_side)
         
         total_seek_time, seek_operations = self.calculate_seek_time(sequence)
         return sequence, total_seek_time, seek_operations
     
-    def c_look(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def c_look(self, direction: str = "right") -> Tuple[List[int], int, SeekOperations]:
         """
         C-LOOK Algorithm - like C-SCAN but only to last request.
         """
-        sequence = []
-        remaining_requests = sorted(self.requests.copy())
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
+        if len(self.requests) == 0:
+            return [], 0, SeekOperations([], self.initial_position)
         
-        if not remaining_requests:
-            return sequence, 0, []
+        going_right = direction.lower() == "right"
+        left_side, right_side = self.split_requests(going_right)
         
         if going_right:
-            right_side = [r for r in remaining_requests if r >= current_position]
-            left_side = [r for r in remaining_requests if r < current_position]
-            sequence.extend(sorted(right_side))
-            if left_side:
-                sequence.extend(sorted(left_side))
+            sequence = right_side
+            sequence.extend(left_side)
         else:
-            left_side = [r for r in remaining_requests if r <= current_position]
-            right_side = [r for r in remaining_requests if r > current_position]
-            sequence.extend(sorted(left_side, reverse=True))
-            if right_side:
-                sequence.extend(sorted(right_side, reverse=True))
+            sequence = left_side[::-1]
+            sequence.extend(reversed(right_side))
         
         total_seek_time, seek_operations = self.calculate_seek_time(sequence)
         return sequence, total_seek_time, seek_operations
 
-    def n_step_scan(self, n: int, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def _batched_scan(self, n: int, going_right: bool, alternate: bool,
+                      stops: Optional[list] = None) -> Tuple[List[int], int, SeekOperations]:
+        """
+        Service the requests in consecutive batches of n, each with SCAN from
+        where the previous batch ended
+
+        Batches are slices of the already validated request list, written into
+        one preallocated output sequence by scan_pass.
+
+        Args:
+            n: Batch size
+            going_right: Direction of the first batch
+            alternate: Reverse the direction after every batch
+            stops: When given, the index of every disk-end stop is appended
+        """
+        count = len(self.requests)
+        if not count:
+            return [], 0, SeekOperations([], self.initial_position)
+        last_track = self.disk_size - 1
+        batches = -(-count // n)
+        if native.use_native(count, self.disk_size):
+            if self.progress is not None:
+                self.progress(0, batches)
+            scanned = native.batched_scan(self.requests, n, self.initial_position, going_right, alternate, last_track)
+            if scanned is not None:
+                if self.progress is not None:
+                    self.progress(batches, batches)
+                sequence, total_seek_time, native_stops = scanned
+                if stops is not None:
+                    stops.extend(native_stops)
+                return sequence, total_seek_time, SeekOperations(sequence, self.initial_position)
+        requests = self.request_list()
+        # At most one disk-end stop per batch
+        sequence = [0] * (count + batches)
+        filled = 0
+        position = self.initial_position
+        total_seek_time = 0
+        report_every = max(1, batches // 100)
+        for batch_index, start in enumerate(range(0, count, n), start=1):
+            filled, position, seek_time = scan_pass(
+                sorted(requests[start:start + n]), position, going_right, last_track, sequence, filled, stops
+            )
+            total_seek_time += seek_time
+            if alternate:
+                going_right = not going_right
+            if self.progress is not None and batch_index % report_every == 0:
+                self.progress(batch_index, batches)
+        del sequence[filled:]
+        return sequence, total_seek_time, SeekOperations(sequence, self.initial_position)
+
+    def n_step_scan(self, n: int, direction: str = "right",
+                    stops: Optional[list] = None) -> Tuple[List[int], int, SeekOperations]:
         """
         N-Step SCAN Algorithm.
         Splits requests into segments of size N and processes each segment with SCAN.
         New requests (in next segment) are not serviced until the current segment is done.
+        The direction alternates between segments (common variant).
         """
         if n < 1:
             raise ValueError("N must be at least 1")
-        reqs = self.requests.copy()
-        if not reqs:
-            return [], 0, []
-        full_sequence = []
-        current_position = self.initial_position
-        going_right = direction.lower() == "right"
-        total_seek_time = 0
-        all_seek_ops = []
-        for i in range(0, len(reqs), n):
-            batch = reqs[i : i + n]
-            scheduler = DiskScheduler(batch, current_position, self.disk_size)
-            seq, seek_time, seek_ops = scheduler.scan("right" if going_right else "left")
-            full_sequence.extend(seq)
-            total_seek_time += seek_time
-            all_seek_ops.extend(seek_ops)
-            if seq:
-                current_position = seq[-1]
-            going_right = not going_right  # alternate direction for next batch (common variant)
-        return full_sequence, total_seek_time, all_seek_ops
+        return self._batched_scan(n, direction.lower() == "right", alternate=True, stops=stops)
 
-    def fscan(self, direction: str = "right") -> Tuple[List[int], int, List[Tuple[int, int]]]:
+    def fscan(self, direction: str = "right", stops: Optional[list] = None) -> Tuple[List[int], int, SeekOperations]:
         """
         FSCAN Algorithm.
         Uses two queues: while one queue is serviced with SCAN, new requests go to the other.
         For static input we split requests into two queues (first half / second half) and
         service queue 1 with SCAN, then queue 2 with SCAN from where we left off.
         """
-        reqs = self.requests.copy()
-        if not reqs:
-            return [], 0, []
-        mid = (len(reqs) + 1) // 2
-        queue1, queue2 = reqs[:mid], reqs[mid:]
-        full_sequence = []
-        current_position = self.initial_position
-        total_seek_time = 0
-        all_seek_ops = []
-        for batch in (queue1, queue2):
-            if not batch:
-                continue
-            scheduler = DiskScheduler(batch, current_position, self.disk_size)
-            seq, seek_time, seek_ops = scheduler.scan(direction)
-            full_sequence.extend(seq)
-            total_seek_time += seek_time
-            all_seek_ops.extend(seek_ops)
-            if seq:
-                current_position = seq[-1]
-        return full_sequence, total_seek_time, all_seek_ops
+        mid = (len(self.requests) + 1) // 2
+        return self._batched_scan(max(mid, 1), direction.lower() == "right", alternate=False, stops=stops)
+
+    def optimal(self) -> Tuple[List[int], int, SeekOperations]:
+        """
+        Minimum-travel schedule: the lower bound of total seek time.
+        All requests are present and cost is linear in distance, so the optimum
+        is a LOOK towards the nearer extreme request (see optimal.minimum_travel).
+        """
+        ordered = self.sorted_requests()
+        # Only the extreme requests matter
+        _, right_first = minimum_travel(ordered[:1] + ordered[-1:], self.initial_position)
+        return self.look("right" if right_first else "left")
+
+    def optimal_wait(self) -> Tuple[List[int], int, SeekOperations]:
+        """
+        Minimum total wait schedule for linear seek cost, by interval dynamic
+        programming over the distinct tracks (see optimal.optimal_wait_order).
+        Requests of the same track are serviced together, in arrival order.
+        """
+        sequence, _ = optimal_wait_order(self.requests, self.initial_position)
+        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
+        return sequence, total_seek_time, seek_operations
+
+    def _timed_result(self, sequence: List[int], completion_times: List[float]):
+        """Engine result of a deadline-aware algorithm: adds wait percentiles and deadline misses"""
+        total_seek_time, seek_operations = self.calculate_seek_time(sequence)
+        deadlines = self.deadlines or ()
+        misses = sum(1 for done, deadline in zip(completion_times, deadlines)
+                     if deadline is not None and done > deadline)
+        # Every request is queued at time zero, so its wait is its completion time
+        waits = LatencyStats()
+        if np is not None and len(completion_times) >= NUMPY_MIN_SIZE:
+            waits.add_many(np.asarray(completion_times, dtype=np.float64))
+        else:
+            for done in completion_times:
+                waits.add(done)
+        return sequence, total_seek_time, seek_operations, {
+            "wait_times_ms": waits.summary()["wait_ms"],
+            "deadline_misses": misses,
+        }
+
+    def _service_times(self):
+        """(seek_time_ms(distance), per-request rotation + transfer ms) of the cost model"""
+        model = self.cost_model
+        return model.seek_time_ms, model.rotational_latency_ms + model.transfer_ms
+
+    def _deadline_keys(self, read_expire_ms: float = inf, write_expire_ms: float = inf) -> List[float]:
+        """Deadline of every request: explicit, else its direction's expiry from time zero"""
+        count = len(self.requests)
+        deadlines = self.deadlines or [None] * count
+        writes = self.writes or [False] * count
+        return [
+            deadline if deadline is not None else (write_expire_ms if write else read_expire_ms)
+            for deadline, write in zip(deadlines, writes)
+        ]
+
+    def edf(self):
+        """
+        Earliest Deadline First.
+        Services requests by ascending deadline within each priority class
+        (lower class first); requests without a deadline go last, in arrival
+        order. All requests are present at time zero and the clock advances by
+        the cost model's service time.
+
+        Returns:
+            Tuple of (sequence, total_seek_time, seek_operations, wait/miss metrics)
+        """
+        tracks = self.request_list()
+        count = len(tracks)
+        priorities = self.priorities or [0] * count
+        queue = list(zip(priorities, self._deadline_keys(), range(count)))
+        heapq.heapify(queue)
+
+        seek_ms, overhead_ms = self._service_times()
+        completion_times = [0.0] * count
+        sequence = []
+        now = 0.0
+        head = self.initial_position
+        while queue:
+            _, _, request_id = heapq.heappop(queue)
+            track = tracks[request_id]
+            now += seek_ms(abs(track - head)) + overhead_ms
+            head = track
+            completion_times[request_id] = now
+            sequence.append(track)
+        return self._timed_result(sequence, completion_times)
+
+    def scan_edf(self, direction: str = "right"):
+        """
+        SCAN-EDF.
+        Like EDF, but requests sharing the earliest (priority, deadline) are
+        serviced together in elevator order: first those ahead of the head in
+        the current direction, then the rest on the way back.
 
-    def simulate(self, algorithm: str, direction: str = "right", n_step: Optional[int] = None) -> dict:
+        Returns:
+            Tuple of (sequence, total_seek_time, seek_operations, wait/miss metrics)
+        """
+        tracks = self.request_list()
+        count = len(tracks)
+        priorities = self.priorities or [0] * count
+        queue = list(zip(priorities, self._deadline_keys(), range(count)))
+        heapq.heapify(queue)
+
+        seek_ms, overhead_ms = self._service_times()
+        completion_times = [0.0] * count
+        sequence = []
+        now = 0.0
+        head = self.initial_position
+        going_right = direction.lower() == "right"
+        while queue:
+            priority, deadline, request_id = heapq.heappop(queue)
+            group = [request_id]
+            while queue and queue[0][0] == priority and queue[0][1] == deadline:
+                group.append(heapq.heappop(queue)[2])
+            group.sort(key=tracks.__getitem__)
+            group_tracks = [tracks[i] for i in group]
+            if going_right:
+                split = bisect_left(group_tracks, head)
+                ahead, behind = group[split:], group[split - 1::-1] if split else []
+            else:
+                split = bisect_right(group_tracks, head)
+                ahead, behind = group[split - 1::-1] if split else [], group[split:]
+            if behind:
+                going_right = not going_right
+            for request_id in chain(ahead, behind):
+                track = tracks[request_id]
+                now += seek_ms(abs(track - head)) + overhead_ms
+                head = track
+                completion_times[request_id] = now
+                sequence.append(track)
+        return self._timed_result(sequence, completion_times)
+
+    def _direction_queues(self, deadlines: List[float]) -> List[list]:
+        """
+        Per priority class (ascending), [reads, writes] queues of
+        (PendingTracks in sector order, FIFO heap of (deadline, request id))
+        """
+        tracks = self.request_list()
+        count = len(tracks)
+        priorities = self.priorities or [0] * count
+        writes = self.writes or [False] * count
+        members = {}
+        for request_id in sorted(range(count), key=deadlines.__getitem__):
+            members.setdefault(priorities[request_id], ([], []))[writes[request_id]].append(request_id)
+        levels = []
+        for priority in sorted(members):
+            level = []
+            for ids in members[priority]:
+                pending = PendingTracks(sorted({tracks[i] for i in ids}))
+                for request_id in ids:
+                    pending.add(tracks[request_id], request_id)
+                # ids are in deadline order, so the list is already a valid heap
+                level.append((pending, [(deadlines[i], i) for i in ids]))
+            levels.append(level)
+        return levels
+
+    @staticmethod
+    def _fifo_head(fifo: list, done: List[bool]) -> Optional[tuple]:
+        """Earliest-deadline request still pending, dropping dispatched entries"""
+        while fifo and done[fifo[0][1]]:
+            heapq.heappop(fifo)
+        return fifo[0] if fifo else None
+
+    def deadline(self, read_expire_ms: float = DEADLINE_READ_EXPIRE_MS,
+                 write_expire_ms: float = DEADLINE_WRITE_EXPIRE_MS,
+                 fifo_batch: int = DEADLINE_FIFO_BATCH, writes_starved: int = DEADLINE_WRITES_STARVED):
+        """
+        Deadline scheduler (Linux mq-deadline).
+        Reads and writes are kept in sector order and in deadline-ordered
+        FIFOs. Requests are dispatched in ascending sector order in batches of
+        up to fifo_batch; a new batch prefers reads unless writes have been
+        passed over writes_starved times, and starts at the FIFO head when it
+        has expired (or the sweep has run out). A request's deadline is its
+        explicit one, else read_expire_ms / write_expire_ms. Higher priority
+        classes are drained first.
+
+        Returns:
+            Tuple of (sequence, total_seek_time, seek_operations, wait/miss metrics)
+        """
+        tracks = self.request_list()
+        count = len(tracks)
+        levels = self._direction_queues(self._deadline_keys(read_expire_ms, write_expire_ms))
+
+        seek_ms, overhead_ms = self._service_times()
+        completion_times = [0.0] * count
+        done = [False] * count
+        sequence = []
+        now = 0.0
+        head = self.initial_position
+
+        for level in levels:
+            # Sector of the last dispatch per direction (mq-deadline's next_rq);
+            # None until the direction's first batch, which starts at its FIFO head
+            positions = [None, None]
+            data_dir = None
+            batching = 0
+            starved = 0
+            while len(level[0][0]) or len(level[1][0]):
+                request_id = None
+                if data_dir is not None and batching < fifo_batch and positions[data_dir] is not None:
+                    pending = level[data_dir][0]
+                    track = pending.successor(positions[data_dir])
+                    if track is not None:
+                        request_id = pending.pop(track)
+                if request_id is None:
+                    reads, writes = level[0][0], level[1][0]
+                    if len(reads) and not (len(writes) and starved >= writes_starved):
+                        data_dir = 0
+                        if len(writes):
+                            starved += 1
+                    else:
+                        data_dir = 1
+                        starved = 0
+                    batching = 0
+                    pending, fifo = level[data_dir]
+                    deadline, first = self._fifo_head(fifo, done)
+                    position = positions[data_dir]
+                    track = pending.successor(position) if position is not None else None
+                    if deadline <= now or track is None:
+                        request_id = first
+                        pending.remove(tracks[first], first)
+                    else:
+                        request_id = pending.pop(track)
+
+                track = tracks[request_id]
+                done[request_id] = True
+                batching += 1
+                positions[data_dir] = track
+                now += seek_ms(abs(track - head)) + overhead_ms
+                head = track
+                completion_times[request_id] = now
+                sequence.append(track)
+        return self._timed_result(sequence, completion_times)
+
+    def anticipatory(self, read_expire_ms: float = ANTICIPATORY_READ_EXPIRE_MS,
+                     write_expire_ms: float = ANTICIPATORY_WRITE_EXPIRE_MS,
+                     read_batch_ms: float = ANTICIPATORY_READ_BATCH_MS,
+                     write_batch_ms: float = ANTICIPATORY_WRITE_BATCH_MS,
+                     back_seek_max: Optional[int] = None,
+                     back_seek_penalty: int = ANTICIPATORY_BACK_SEEK_PENALTY):
+        """
+        Anticipatory scheduler (Linux as-iosched request selection).
+        Reads and writes are serviced in alternating batches limited by
+        read_batch_ms / write_batch_ms. Within a batch the next request is the
+        cheaper of the nearest one ahead of the head and the nearest one behind
+        it (within back_seek_max tracks, costing back_seek_penalty times the
+        distance), unless the FIFO head has expired. Every request is queued
+        at time zero, so the scheduler never idles waiting for a follow-up
+        read. Higher priority classes are drained first.
+
+        Returns:
+            Tuple of (sequence, total_seek_time, seek_operations, wait/miss metrics)
+        """
+        tracks = self.request_list()
+        count = len(tracks)
+        levels = self._direction_queues(self._deadline_keys(read_expire_ms, write_expire_ms))
+        if back_seek_max is None:
+            back_seek_max = max(1, self.disk_size // 8)
+        batch_ms = (read_batch_ms, write_batch_ms)
+
+        seek_ms, overhead_ms = self._service_times()
+        completion_times = [0.0] * count
+        done = [False] * count
+        sequence = []
+        now = 0.0
+        head = self.initial_position
+
+        for level in levels:
+            data_dir = 0 if len(level[0][0]) else 1
+            batch_started = now
+            while len(level[0][0]) or len(level[1][0]):
+                if not len(level[data_dir][0]) or now - batch_started >= batch_ms[data_dir]:
+                    if len(level[1 - data_dir][0]):
+                        data_dir = 1 - data_dir
+                    batch_started = now
+                pending, fifo = level[data_dir]
+
+                deadline, first = self._fifo_head(fifo, done)
+                if deadline <= now:
+                    request_id = first
+                    pending.remove(tracks[first], first)
+                else:
+                    forward = pending.successor(head)
+                    backward = pending.predecessor(head)
+                    forward_cost = forward - head if forward is not None else inf
+                    backward_cost = inf
+                    if backward is not None and head - backward <= back_seek_max:
+                        backward_cost = (head - backward) * back_seek_penalty
+                    if forward_cost == inf and backward_cost == inf:
+                        # Only far-behind requests are left: wrap to them
+                        track = backward
+                    else:
+                        track = forward if forward_cost <= backward_cost else backward
+                    request_id = pending.pop(track)
+
+                track = tracks[request_id]
+                done[request_id] = True
+                now += seek_ms(abs(track - head)) + overhead_ms
+                head = track
+                completion_times[request_id] = now
+                sequence.append(track)
+        return self._timed_result(sequence, completion_times)
+
+    def simulate(self, algorithm: str, direction: str = "right", n_step: Optional[int] = None,
+                 engine: Optional[str] = None, latency: bool = False) -> dict:
         """
         Run simulation for a specific algorithm
 
         Args:
-            algorithm: Algorithm name (FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK, N-STEP SCAN, FSCAN)
+            algorithm: Algorithm name or alias, as registered in registry
+                (FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK, N-STEP SCAN, FSCAN)
             direction: Initial direction for directional algorithms
             n_step: Batch size for N-Step SCAN (required when algorithm is N-STEP SCAN)
+            engine: Implementation to use (defaults to the algorithm's "python" engine)
+            latency: Also report the per-request wait distribution under
+                "latency" (see latency.schedule_latency); off by default as it
+                costs about as much as the rest of the metrics together
 
         Returns:
-            Dictionary with simulation results
-        """
-        algorithm_upper = algorithm.upper().strip()
-        # Normalize display name for N-Step SCAN
-        if algorithm_upper == "N-STEP SCAN" or algorithm_upper == "NSTEP SCAN":
-            algorithm_upper = "N-STEP SCAN"
-        if algorithm_upper == "FSCAN":
-            pass  # keep as FSCAN
-
-        if algorithm_upper == "FCFS":
-            sequence, total_seek_time, seek_operations = self.fcfs()
-        elif algorithm_upper == "SSTF":
-            sequence, total_seek_time, seek_operations = self.sstf()
-        elif algorithm_upper == "SCAN":
-            sequence, total_seek_time, seek_operations = self.scan(direction)
-        elif algorithm_upper in ("C-SCAN", "CSCAN"):
-            sequence, total_seek_time, seek_operations = self.c_scan(direction)
-        elif algorithm_upper == "LOOK":
-            sequence, total_seek_time, seek_operations = self.look(direction)
-        elif algorithm_upper in ("C-LOOK", "CLOOK"):
-            sequence, total_seek_time, seek_operations = self.c_look(direction)
-        elif algorithm_upper == "N-STEP SCAN":
-            n = n_step if n_step is not None and n_step >= 1 else 4
-            sequence, total_seek_time, seek_operations = self.n_step_scan(n, direction)
-        elif algorithm_upper == "FSCAN":
-            sequence, total_seek_time, seek_operations = self.fscan(direction)
-        else:
-            raise ValueError(f"Unknown algorithm: {algorithm}")
-        
+            Dictionary with simulation results. SCAN, C-SCAN, N-Step SCAN and
+            FSCAN add "edge_stops": the indexes in the sequence of stops at a
+            disk end that service no request
+        """
+        spec = registry.get(algorithm)
+        sequence, total_seek_time, seek_operations, *extra = spec.engine(engine)(self, direction, n_step)
+        # Engines may return a dict of additional result fields
+        extra = extra[0] if extra else {}
+
+        if self.progress is not None:
+            self.progress(1, 1)
         average_seek_time = total_seek_time / len(sequence) if sequence else 0
+        # Shared by the seek statistics, the cost model and the latency distribution
+        distances = seek_distances(sequence, self.initial_position)
 
-        return {
-            "algorithm": algorithm_upper,
+        result = {
+            "algorithm": spec.name,
             "sequence": sequence,
             "total_seek_time": total_seek_time,
             "average_seek_time": round(average_seek_time, 2),
             "seek_operations": seek_operations,
             "total_requests": len(self.requests),
-            "initial_position": self.initial_position
+            "initial_position": self.initial_position,
+            "seek_statistics": seek_statistics(sequence, self.initial_position, distances),
+            "cost": self.cost_model.service_cost(sequence, self.initial_position, len(self.requests), distances),
         }
+        if latency:
+            result["latency"] = schedule_latency(sequence, self.initial_position, self.disk_size, self.cost_model,
+                                                 distances=distances, stops=extra.get("edge_stops", ())).summary()
+        result.update(extra)
+        return result
+
+
+def _n_step(n_step: Optional[int]) -> int:
+    return n_step if n_step is not None and n_step >= 1 else 4
+
+
+def _with_edge_stops(run):
+    """
+    Engine for a sweep that may stop at a disk end without a request there:
+    run(scheduler, direction, n_step, stops) records the index of every such
+    stop, reported as the "edge_stops" result field
+    """
+    def engine(scheduler, direction, n_step):
+        stops = []
+        return (*run(scheduler, direction, n_step, stops), {"edge_stops": stops})
+    return engine
+
+
+for _spec in (
+    AlgorithmSpec(
+        "FCFS", lambda scheduler, direction, n_step: scheduler.fcfs(),
+        full_name="First Come First Served",
+        description="Services requests in the order they arrive",
+        capabilities=("compare", "online", "vectorized")
+    ),
+    AlgorithmSpec(
+        "SSTF", lambda scheduler, direction, n_step: scheduler.sstf(),
+        full_name="Shortest Seek Time First",
+        description="Always services the request closest to the current head position",
+        capabilities=("compare", "online")
+    ),
+    AlgorithmSpec(
+        "SCAN", _with_edge_stops(lambda scheduler, direction, n_step, stops: scheduler.scan(direction, stops)),
+        full_name="SCAN (Elevator Algorithm)",
+        description="Moves the head in one direction until the end, then reverses",
+        parameters=("direction",), capabilities=("compare", "online", "vectorized")
+    ),
+    AlgorithmSpec(
+        "C-SCAN", _with_edge_stops(lambda scheduler, direction, n_step, stops: scheduler.c_scan(direction, stops)),
+        full_name="Circular SCAN",
+        description="Moves the head in one direction until the end, then jumps to the beginning",
+        aliases=("CSCAN",), parameters=("direction",), capabilities=("compare", "online", "vectorized")
+    ),
+    AlgorithmSpec(
+        "LOOK", lambda scheduler, direction, n_step: scheduler.look(direction),
+        full_name="LOOK Algorithm",
+        description="Similar to SCAN but only goes to the last request in that direction",
+        parameters=("direction",), capabilities=("compare", "online", "vectorized")
+    ),
+    AlgorithmSpec(
+        "C-LOOK", lambda scheduler, direction, n_step: scheduler.c_look(direction),
+        full_name="Circular LOOK",
+        description="Similar to C-SCAN but only goes to the last request",
+        aliases=("CLOOK",), parameters=("direction",), capabilities=("compare", "online", "vectorized")
+    ),
+    AlgorithmSpec(
+        "N-STEP SCAN", _with_edge_stops(
+            lambda scheduler, direction, n_step, stops: scheduler.n_step_scan(_n_step(n_step), direction, stops)
+        ),
+        full_name="N-Step SCAN",
+        description="Splits requests into batches of N; each batch serviced with SCAN",
+        aliases=("NSTEP SCAN",), parameters=("direction", "n_step"), required=("n_step",),
+        capabilities=("compare", "online", "batch_scan")
+    ),
+    AlgorithmSpec(
+        "FSCAN", _with_edge_stops(lambda scheduler, direction, n_step, stops: scheduler.fscan(direction, stops)),
+        full_name="FSCAN",
+        description="Two queues: service one with SCAN while the other collects (simulated as two batches)",
+        parameters=("direction",), capabilities=("compare", "online", "batch_scan")
+    ),
+    AlgorithmSpec(
+        "EDF", lambda scheduler, direction, n_step: scheduler.edf(),
+        full_name="Earliest Deadline First",
+        description="Services requests by deadline within each priority class",
+        capabilities=("deadlines",)
+    ),
+    AlgorithmSpec(
+        "SCAN-EDF", lambda scheduler, direction, n_step: scheduler.scan_edf(direction),
+        full_name="SCAN-EDF",
+        description="EDF, servicing requests with the same deadline in elevator order",
+        aliases=("SCANEDF", "SCAN EDF"), parameters=("direction",), capabilities=("deadlines",)
+    ),
+    AlgorithmSpec(
+        "DEADLINE", lambda scheduler, direction, n_step: scheduler.deadline(),
+        full_name="Deadline (mq-deadline)",
+        description="Sector-ordered batches with read/write FIFO expiry, preferring reads",
+        aliases=("MQ-DEADLINE",), capabilities=("deadlines",)
+    ),
+    AlgorithmSpec(
+        "ANTICIPATORY", lambda scheduler, direction, n_step: scheduler.anticipatory(),
+        full_name="Anticipatory",
+        description="Alternating read/write batches, nearest request with penalized backward seeks, FIFO expiry",
+        aliases=("AS",), capabilities=("deadlines",)
+    ),
+    AlgorithmSpec(
+        "OPTIMAL", lambda scheduler, direction, n_step: scheduler.optimal(),
+        full_name="Optimal (minimum travel)",
+        description="Exact minimum total seek distance: sweeps to the nearer extreme request first",
+        aliases=("OPT",)
+    ),
+    AlgorithmSpec(
+        "OPTIMAL-WAIT", lambda scheduler, direction, n_step: scheduler.optimal_wait(),
+        full_name="Optimal (minimum total wait)",
+        description="Exact minimum total wait for linear seek cost, by interval dynamic programming",
+        aliases=("OPT-WAIT", "MIN-WAIT")
+    ),
+):
+    registry.register(_spec)
+del _spec
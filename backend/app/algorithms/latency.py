@@ -0,0 +1,296 @@
+"""
+Per-request latency of a schedule.
+
+All requests of a static workload are queued at time zero, so the wait of a
+request is the time until the head finishes servicing it: the cost of every
+move up to and including its own (seek curve of the cost model, plus rotation
+and transfer for each request serviced on the way). Seek distance statistics
+say nothing about this; a schedule with even seeks can still leave one request
+waiting for the whole run.
+
+LatencyStats consumes wait times one at a time (or as NumPy arrays) and keeps
+a fixed number of counters however many requests it sees: a log-bucketed
+quantile sketch whose estimates are within `relative_accuracy` of the exact
+value, a power-of-two histogram, the longest wait, and the sums needed for the
+mean and Jain's fairness index.
+"""
+
+from bisect import bisect_right
+from math import ceil, frexp, ldexp, log
+from typing import Optional, Sequence
+
+from .cost_model import CostModel
+from .seek import NUMPY_MIN_SIZE, np
+
+
+# Percentiles reported by LatencyStats.summary()
+PERCENTILES = (("p50", 0.50), ("p90", 0.90), ("p95", 0.95), ("p99", 0.99), ("p999", 0.999))
+
+
+def _tally(keys) -> list:
+    """(key, count) pairs of a NumPy integer array whose values span a small range"""
+    if len(keys) == 0:
+        return []
+    low = int(keys.min())
+    counts = np.bincount(keys - low)
+    present = np.flatnonzero(counts)
+    return list(zip((present + low).tolist(), counts[present].tolist()))
+
+
+class QuantileSketch:
+    """
+    Streaming quantile estimates with bounded relative error
+
+    Positive values are bucketed by binary exponent and, within one octave,
+    by mantissa boundaries growing geometrically by gamma = (1 + a) / (1 - a),
+    so every value of a bucket is within a relative error a of the bucket's
+    representative value. Bucket keys come from frexp and a sorted boundary
+    table rather than a logarithm, so the pure-Python and NumPy paths assign
+    identical buckets. When more than max_buckets are in use, the lowest ones
+    are merged, which keeps the upper quantiles accurate.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        Args:
+            relative_accuracy: Maximum relative error of a quantile estimate
+            max_buckets: Memory bound: buckets kept before the lowest are merged
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be at least 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._per_octave = ceil(log(2) / log(gamma))
+        # Mantissa boundaries in [0.5, 1], the last sub-bucket being the narrowest
+        self._boundaries = [0.5 * gamma ** i for i in range(self._per_octave)] + [1.0]
+        self._buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def _key(self, value: float) -> int:
+        mantissa, exponent = frexp(value)
+        return exponent * self._per_octave + bisect_right(self._boundaries, mantissa) - 1
+
+    def _value(self, key: int) -> float:
+        """Representative value of a bucket: within relative_accuracy of all its values"""
+        exponent, index = divmod(key, self._per_octave)
+        low = ldexp(self._boundaries[index], exponent)
+        high = ldexp(self._boundaries[index + 1], exponent)
+        return 2 * low * high / (low + high)
+
+    def add(self, value: float):
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if value == 0:
+            self.zero_count += 1
+            return
+        key = self._key(value)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def add_many(self, values):
+        """Add a NumPy array of values (same buckets as calling add() for each)"""
+        if len(values) == 0:
+            return
+        low, high = float(values.min()), float(values.max())
+        if low < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        self.count += len(values)
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        mantissas, exponents = np.frexp(positive)
+        indexes = np.searchsorted(np.asarray(self._boundaries), mantissas, side="right") - 1
+        for key, count in _tally(exponents.astype(np.int64) * self._per_octave + indexes):
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        keys = sorted(self._buckets)
+        merged = sum(self._buckets.pop(key) for key in keys[:len(keys) - self.max_buckets + 1])
+        lowest = keys[len(keys) - self.max_buckets]
+        self._buckets[lowest] = self._buckets.get(lowest, 0) + merged
+
+    def quantile(self, fraction: float) -> float:
+        """Nearest-rank estimate of a quantile (0-1), clamped to the observed range"""
+        if not self.count:
+            return 0.0
+        rank = max(0, ceil(self.count * fraction) - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                return min(max(self._value(key), self.min), self.max)
+        return self.max
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def _octave(value: float) -> int:
+    """Smallest k with value <= 2 ** k (value > 0)"""
+    mantissa, exponent = frexp(value)
+    return exponent - 1 if mantissa == 0.5 else exponent
+
+
+class LatencyStats:
+    """One-pass, bounded-memory summary of per-request wait times (ms)"""
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        """
+        Args:
+            relative_accuracy: Maximum relative error of the reported percentiles
+            max_buckets: Memory bound of the quantile sketch
+        """
+        self.sketch = QuantileSketch(relative_accuracy, max_buckets)
+        # Power-of-two histogram: k -> waits in (2 ** (k - 1), 2 ** k]; zero waits under None
+        self.histogram = {}
+        self.total = 0.0
+        self.sum_of_squares = 0.0
+        # Longest wait: (wait, position in service order, track)
+        self.starvation = None
+
+    @property
+    def count(self) -> int:
+        return self.sketch.count
+
+    def add(self, wait: float, track: Optional[int] = None):
+        """Record the wait of the next request in service order"""
+        position = self.sketch.count
+        self.sketch.add(wait)
+        self.total += wait
+        self.sum_of_squares += wait * wait
+        octave = _octave(wait) if wait > 0 else None
+        self.histogram[octave] = self.histogram.get(octave, 0) + 1
+        if self.starvation is None or wait > self.starvation[0]:
+            self.starvation = (wait, position, track)
+
+    def add_many(self, waits, tracks=None):
+        """Record a NumPy array of waits, in service order (tracks: matching array or None)"""
+        count = len(waits)
+        if count == 0:
+            return
+        position = self.sketch.count
+        self.sketch.add_many(waits)
+        self.total += float(waits.sum())
+        self.sum_of_squares += float(np.dot(waits, waits))
+        positive = waits[waits > 0]
+        if len(positive) < count:
+            self.histogram[None] = self.histogram.get(None, 0) + count - len(positive)
+        mantissas, exponents = np.frexp(positive)
+        for octave, octave_count in _tally(np.where(mantissas == 0.5, exponents - 1, exponents).astype(np.int64)):
+            self.histogram[octave] = self.histogram.get(octave, 0) + octave_count
+        longest = int(waits.argmax())
+        wait = float(waits[longest])
+        if self.starvation is None or wait > self.starvation[0]:
+            track = int(tracks[longest]) if tracks is not None else None
+            self.starvation = (wait, position + longest, track)
+
+    def jain_index(self) -> float:
+        """Jain's fairness index of the waits: 1 when all are equal, 1/n when one request takes all"""
+        if not self.count or self.sum_of_squares == 0:
+            return 1.0
+        return self.total * self.total / (self.count * self.sum_of_squares)
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            Dictionary with the wait percentiles, mean and max (ms), a
+            power-of-two histogram ("le" upper bounds in ms), the longest
+            wait with its position in the service order and track, and
+            Jain's fairness index
+        """
+        count = self.count
+        wait_ms = {name: round(self.sketch.quantile(fraction), 3) for name, fraction in PERCENTILES}
+        wait_ms["mean"] = round(self.total / count, 3) if count else 0.0
+        wait_ms["max"] = round(self.sketch.max, 3) if count else 0.0
+
+        histogram = []
+        if self.histogram.get(None):
+            histogram.append({"le": 0.0, "count": self.histogram[None]})
+        octaves = [octave for octave in self.histogram if octave is not None]
+        if octaves:
+            for octave in range(min(octaves), max(octaves) + 1):
+                histogram.append({"le": ldexp(1.0, octave), "count": self.histogram.get(octave, 0)})
+
+        starvation = None
+        if self.starvation is not None:
+            wait, position, track = self.starvation
+            starvation = {"wait_ms": round(wait, 3), "position": position, "track": track}
+
+        return {
+            "count": count,
+            "wait_ms": wait_ms,
+            "histogram": histogram,
+            "max_starvation": starvation,
+            "jain_index": round(self.jain_index(), 4),
+            "relative_accuracy": self.sketch.relative_accuracy,
+        }
+
+
+def service_mask(count: int, stops: Sequence[int]):
+    """NumPy bool array: which of count sequence entries service a request"""
+    services = np.ones(count, dtype=bool)
+    services[np.asarray(stops, dtype=np.int64)] = False
+    return services
+
+
+def schedule_latency(sequence: Sequence[int], initial_position: int, disk_size: int,
+                     cost_model: Optional[CostModel] = None, relative_accuracy: float = 0.01,
+                     distances=None, stops: Sequence[int] = ()) -> LatencyStats:
+    """
+    Wait of every request serviced by a schedule, all requests queued at time zero
+
+    Stops a sweep makes at a disk end without a request there (SCAN, C-SCAN,
+    and at every turnaround of N-Step SCAN and FSCAN) cost seek time but
+    complete nothing; the engines report their indexes as "edge_stops".
+    Every other entry of the sequence services one request.
+
+    Args:
+        sequence: Service order produced by a scheduling algorithm
+        initial_position: Head position before the first access
+        disk_size: Number of tracks
+        cost_model: Service-time model (defaults to DiskScheduler's)
+        relative_accuracy: Maximum relative error of the percentiles
+        distances: seek_distances(sequence, initial_position), when already computed
+        stops: Indexes in sequence of the stops that service no request
+
+    Returns:
+        LatencyStats over the requests' waits, in service order
+    """
+    model = cost_model if cost_model is not None else CostModel(cylinders=disk_size)
+    overhead = model.rotational_latency_ms + model.transfer_ms
+    stats = LatencyStats(relative_accuracy)
+
+    seek_ms = model.seek_times_ms(sequence, initial_position, distances)
+    if np is not None and isinstance(seek_ms, np.ndarray) and len(sequence) >= NUMPY_MIN_SIZE:
+        tracks = np.asarray(sequence, dtype=np.int64)
+        services = service_mask(len(tracks), stops)
+        completed = np.cumsum(services)
+        waits = np.cumsum(seek_ms) + overhead * completed
+        stats.add_many(waits[services], tracks[services])
+        return stats
+
+    skipped = set(stops)
+    now = 0.0
+    completed = 0
+    for index, (track, seek) in enumerate(zip(sequence, seek_ms)):
+        now += seek
+        if index in skipped:
+            continue
+        completed += 1
+        stats.add(now + overhead * completed, track)
+    return stats
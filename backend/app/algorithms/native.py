@@ -0,0 +1,120 @@
+"""
+Optional compiled kernels for the hottest loops.
+
+app.algorithms._native is a CFFI extension built from source by
+`python -m app.algorithms._native_build`. When it is importable, DiskScheduler
+runs the seek total, SSTF and the N-Step SCAN/FSCAN batching in C over
+contiguous int64 buffers; CFFI releases the GIL for the duration of each call,
+so threads running simulations proceed in parallel. Every kernel produces
+exactly the result of the pure-Python code, which is used when the extension
+is missing, when DISK_SCHEDULER_NATIVE=0 is set in the environment, when an
+input is too small to be worth the conversion, or when it holds anything but
+integers (the kernels return None and the caller runs the Python code).
+"""
+
+import os
+from array import array
+from operator import index
+from typing import List, Optional, Sequence, Tuple
+
+from .seek import np
+
+try:
+    from ._native import ffi, lib
+except ImportError:  # not built; everything falls back to pure Python
+    ffi = lib = None
+
+
+# Below this many requests the buffer conversion costs more than it saves
+NATIVE_MIN_SIZE = 64
+
+# Seek totals are accumulated in int64
+_INT64_MAX = 2 ** 63 - 1
+
+
+def available() -> bool:
+    """Whether the compiled kernels are loaded and enabled"""
+    return lib is not None and os.environ.get("DISK_SCHEDULER_NATIVE", "1") != "0"
+
+
+def use_native(count: int, max_track: int) -> bool:
+    """Whether a kernel should run for count requests on tracks below max_track"""
+    # Every move is at most max_track tracks long, plus one disk-end stop per batch
+    return count >= NATIVE_MIN_SIZE and available() and 2 * count * max(max_track, 1) < _INT64_MAX
+
+
+def _buffer(values: Sequence[int]):
+    """
+    values as a contiguous int64 buffer: (keep-alive object, int64_t * pointer),
+    or None when they are not all integers (e.g. float tracks)
+    """
+    if isinstance(values, array) and values.typecode == "q":
+        packed = values
+    elif np is not None and isinstance(values, np.ndarray):
+        # A float array would be silently truncated by the int64 conversion
+        if values.dtype.kind not in "iu":
+            return None
+        packed = np.ascontiguousarray(values, dtype=np.int64)
+    else:
+        try:
+            packed = array("q", values)
+        except (TypeError, OverflowError):
+            return None
+    return packed, ffi.from_buffer("int64_t[]", packed)
+
+
+def _position(value) -> Optional[int]:
+    """A head position as an int, or None when it is not an integer"""
+    try:
+        return index(value)
+    except TypeError:
+        return None
+
+
+def seek_total(sequence: Sequence[int], initial_position: int) -> Optional[int]:
+    """Sum of absolute head movements of a sequence (None: not all integers)"""
+    buffer, position = _buffer(sequence), _position(initial_position)
+    if buffer is None or position is None:
+        return None
+    packed, pointer = buffer
+    return int(lib.seek_total(pointer, len(packed), position))
+
+
+def _result(out: array, filled: int) -> List[int]:
+    if filled < 0:
+        raise MemoryError("native kernel could not allocate its work buffers")
+    del out[filled:]
+    return out.tolist()
+
+
+def sstf(requests: Sequence[int], initial_position: int) -> Optional[List[int]]:
+    """Service order of DiskScheduler.sstf() (None: not all integers)"""
+    buffer, position = _buffer(requests), _position(initial_position)
+    if buffer is None or position is None:
+        return None
+    packed, pointer = buffer
+    out = array("q", bytes(8 * len(packed)))
+    filled = lib.sstf(pointer, len(packed), position, ffi.from_buffer("int64_t[]", out))
+    return _result(out, filled)
+
+
+def batched_scan(requests: Sequence[int], batch_size: int, initial_position: int, going_right: bool,
+                 alternate: bool, last_track: int) -> Optional[Tuple[List[int], int, List[int]]]:
+    """Sequence, seek total and disk-end stop indexes of DiskScheduler._batched_scan() (None: not all integers)"""
+    buffer, position = _buffer(requests), _position(initial_position)
+    if buffer is None or position is None:
+        return None
+    packed, pointer = buffer
+    count = len(packed)
+    batches = -(-count // batch_size)
+    out = array("q", bytes(8 * (count + batches)))
+    stops = array("q", bytes(8 * batches))
+    total = ffi.new("int64_t *")
+    stop_count = ffi.new("int64_t *")
+    filled = lib.batched_scan(pointer, count, batch_size, position, going_right, alternate, last_track,
+                              ffi.from_buffer("int64_t[]", out), total, ffi.from_buffer("int64_t[]", stops),
+                              stop_count)
+    sequence = _result(out, filled)
+    del stops[stop_count[0]:]
+    return sequence, int(total[0]), stops.tolist()
+
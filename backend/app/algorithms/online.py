@@ -0,0 +1,240 @@
+"""
+Event-driven (online) disk scheduling simulation.
+
+DiskScheduler treats every request as present at time zero. OnlineScheduler
+gives each request an arrival time and replays the trace through an event
+loop: the head moves at a fixed speed, arrivals are admitted as simulated
+time passes, and each algorithm decides only among the requests that are
+pending at that moment.
+
+Pending requests are kept in a Fenwick tree over the (compressed) set of
+requested tracks, so admitting a request and finding the nearest pending one
+in either direction are O(log n); arrivals come off a heap, giving
+O(n log n) for a whole trace.
+"""
+
+import heapq
+from collections import deque
+from typing import List, Optional, Sequence
+
+from .cost_model import CostModel
+from .latency import LatencyStats
+from .disk_scheduling import DiskScheduler, SeekOperations, scan_pass
+from .pending import PendingTracks
+from .registry import registry
+from .seek import seek_distances, seek_statistics
+
+
+class OnlineScheduler:
+    """Replays requests with arrival times through an event-driven simulation"""
+
+    def __init__(self, requests: Sequence[int], arrival_times: Sequence[float], initial_position: int,
+                 disk_size: int = 200, time_per_track: float = 1.0, cost_model: Optional[CostModel] = None):
+        """
+        Initialize the online scheduler
+
+        Args:
+            requests: Track of each request
+            arrival_times: Arrival time of each request (same length as requests)
+            initial_position: Initial head position
+            disk_size: Total number of tracks on the disk
+            time_per_track: Time the head needs to move across one track
+            cost_model: When given, simulated time advances by its seek curve plus
+                rotational latency and transfer per request (milliseconds), and
+                time_per_track is ignored
+        """
+        if len(arrival_times) != len(requests):
+            raise ValueError("arrival_times must have one entry per request")
+        if time_per_track < 0:
+            raise ValueError("time_per_track must not be negative")
+        # Reuses DiskScheduler's bounds validation
+        self.requests = DiskScheduler(requests, initial_position, disk_size).request_list()
+        self.arrival_times = [float(t) for t in arrival_times]
+        self.initial_position = initial_position
+        self.disk_size = disk_size
+        self.time_per_track = time_per_track
+        self.cost_model = cost_model
+
+    def simulate(self, algorithm: str, direction: str = "right", n_step: Optional[int] = None,
+                 latency: bool = False) -> dict:
+        """
+        Run the event-driven simulation for one algorithm
+
+        Args:
+            algorithm: Algorithm name (FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK, N-STEP SCAN, FSCAN)
+            direction: Initial direction for directional algorithms
+            n_step: Batch size for N-Step SCAN (defaults to 4)
+            latency: Also summarize the waits since arrival, in completion
+                order, under "latency"
+
+        Returns:
+            Dictionary with the same fields as DiskScheduler.simulate plus
+            per-request completion and wait times
+        """
+        spec = registry.get(algorithm)
+        algorithm_upper = spec.name
+        if not spec.supports("online"):
+            raise ValueError(f"{algorithm_upper} does not support arrival times. "
+                             f"Available: {', '.join(registry.names('online'))}")
+        n = n_step if n_step is not None and n_step >= 1 else 4
+        going_right = direction.lower() == "right"
+
+        count = len(self.requests)
+        arrivals = [(self.arrival_times[i], i) for i in range(count)]
+        heapq.heapify(arrivals)
+        completion_times = [0.0] * count
+        sequence = []
+
+        now = 0.0
+        head = self.initial_position
+        batched = algorithm_upper in ("N-STEP SCAN", "FSCAN")
+        pending = PendingTracks(sorted(set(self.requests))) if not batched else None
+        fifo = deque()
+        batch_plan = deque()  # (track, request_id or None) stops of the batch being serviced
+
+        def admit():
+            while arrivals and arrivals[0][0] <= now:
+                _, request_id = heapq.heappop(arrivals)
+                if algorithm_upper in ("FCFS", "N-STEP SCAN", "FSCAN"):
+                    fifo.append(request_id)
+                else:
+                    pending.add(self.requests[request_id], request_id)
+
+        cost_model = self.cost_model
+        request_overhead = cost_model.rotational_latency_ms + cost_model.transfer_ms if cost_model else 0.0
+
+        def move_to(track: int, services_request: bool = True):
+            nonlocal now, head
+            if cost_model is not None:
+                now += cost_model.seek_time_ms(abs(track - head))
+                if services_request:
+                    now += request_overhead
+            else:
+                now += abs(track - head) * self.time_per_track
+            head = track
+            sequence.append(track)
+
+        def serve(track: int):
+            # Every request pending at the track is completed in arrival order
+            while pending.has(track):
+                request_id = pending.pop(track)
+                move_to(track)
+                completion_times[request_id] = now
+
+        def has_pending() -> bool:
+            return bool(batch_plan or fifo or (pending is not None and len(pending)))
+
+        while arrivals or has_pending():
+            admit()
+            if not has_pending():
+                now = max(now, arrivals[0][0])
+                continue
+
+            if algorithm_upper == "FCFS":
+                request_id = fifo.popleft()
+                move_to(self.requests[request_id])
+                completion_times[request_id] = now
+                continue
+
+            if batched:
+                if not batch_plan:
+                    # Freeze the next batch: FSCAN takes everything queued so far,
+                    # N-Step SCAN the oldest n requests. The backlog FSCAN starts
+                    # with is split into its two queues like DiskScheduler.fscan
+                    # (older half first), so all-at-t=0 runs match the static one.
+                    if algorithm_upper != "FSCAN":
+                        size = min(n, len(fifo))
+                    elif sequence:
+                        size = len(fifo)
+                    else:
+                        size = (len(fifo) + 1) // 2
+                    batch_ids = [fifo.popleft() for _ in range(size)]
+                    batch_plan.extend(self._plan_batch(batch_ids, head, going_right))
+                    if algorithm_upper == "N-STEP SCAN":
+                        going_right = not going_right
+                track, request_id = batch_plan.popleft()
+                move_to(track, request_id is not None)
+                if request_id is not None:
+                    completion_times[request_id] = now
+                continue
+
+            track = self._next_track(algorithm_upper, pending, head, going_right)
+            if track is None:
+                # Nothing ahead: sweep/jump according to the algorithm and retry
+                if algorithm_upper == "SCAN":
+                    move_to(self.disk_size - 1 if going_right else 0, False)
+                    going_right = not going_right
+                elif algorithm_upper == "LOOK":
+                    going_right = not going_right
+                elif algorithm_upper == "C-SCAN":
+                    move_to(self.disk_size - 1 if going_right else 0, False)
+                    move_to(0 if going_right else self.disk_size - 1, False)
+                else:  # C-LOOK jumps straight to the farthest pending request
+                    serve(pending.successor(0) if going_right else pending.predecessor(self.disk_size - 1))
+                continue
+
+            serve(track)
+
+        distances = seek_distances(sequence, self.initial_position)
+        statistics = seek_statistics(sequence, self.initial_position, distances)
+        total_seek_time = statistics["total"]
+        wait_times = [completion_times[i] - self.arrival_times[i] for i in range(count)]
+        average_seek_time = total_seek_time / len(sequence) if sequence else 0
+
+        result = {
+            "algorithm": algorithm_upper,
+            "sequence": sequence,
+            "total_seek_time": total_seek_time,
+            "average_seek_time": round(average_seek_time, 2),
+            "seek_operations": SeekOperations(sequence, self.initial_position),
+            "total_requests": count,
+            "initial_position": self.initial_position,
+            "seek_statistics": statistics,
+            "cost": (cost_model or CostModel(cylinders=self.disk_size)).service_cost(
+                sequence, self.initial_position, count, distances
+            ),
+            "completion_times": completion_times,
+            "wait_times": wait_times,
+            "average_wait_time": round(sum(wait_times) / count, 2) if count else 0,
+            "max_wait_time": max(wait_times, default=0),
+            "makespan": max(completion_times, default=0),
+        }
+        if latency:
+            stats = LatencyStats()
+            for request_id in sorted(range(count), key=completion_times.__getitem__):
+                stats.add(wait_times[request_id], self.requests[request_id])
+            result["latency"] = stats.summary()
+        return result
+
+    @staticmethod
+    def _next_track(algorithm: str, pending: PendingTracks, head: int, going_right: bool) -> Optional[int]:
+        """Next pending track chosen by a per-request algorithm, or None if it must turn/wrap"""
+        if algorithm == "SSTF":
+            left = pending.predecessor(head)
+            right = pending.successor(head)
+            if left is None:
+                return right
+            if right is None:
+                return left
+            left_distance, right_distance = head - left, right - head
+            if left_distance != right_distance:
+                return left if left_distance < right_distance else right
+            # Tie: the request that arrived first wins, as in static SSTF
+            return left if pending.first_id(left) < pending.first_id(right) else right
+        return pending.successor(head) if going_right else pending.predecessor(head)
+
+    def _plan_batch(self, batch_ids: List[int], head: int, going_right: bool):
+        """Static SCAN order for a frozen batch, as (track, request_id) stops"""
+        tracks = sorted(self.requests[i] for i in batch_ids)
+        sequence = [0] * (len(tracks) + 1)
+        filled, _, _ = scan_pass(tracks, head, going_right, self.disk_size - 1, sequence, 0)
+        del sequence[filled:]
+        ids_by_track = {}
+        for request_id in batch_ids:
+            ids_by_track.setdefault(self.requests[request_id], deque()).append(request_id)
+        plan = []
+        for track in sequence:
+            ids = ids_by_track.get(track)
+            # Boundary stops (disk ends) carry no request
+            plan.append((track, ids.popleft() if ids else None))
+        return plan
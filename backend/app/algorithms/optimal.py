@@ -0,0 +1,231 @@
+"""
+Exact optimal schedules for a single head with linear seek cost.
+
+With every request present at time zero and cost proportional to distance,
+the head services whatever it passes for free, so the serviced tracks always
+form an interval around the start position and an optimal schedule is a
+sequence of interval extensions:
+
+- Minimum travel (total seek distance): the only decision is which end to
+  reach first, and going to the nearer extreme request first is optimal, so
+  the bound is computed in O(n) once the requests are sorted.
+- Minimum total wait (sum over requests of the distance travelled until each
+  is serviced): interval dynamic programming over the m distinct tracks,
+  O(m^2) time, and O(m^2) memory for the choice tables that rebuild the
+  order (O(m) when only the bound is needed). Exact solutions are limited to
+  OPTIMAL_WAIT_MAX_TRACKS distinct tracks; wait_lower_bound() gives a bound
+  for any size in O(n).
+
+A constant per-request overhead (rotation, transfer) adds the same amount to
+every order, so it does not change which schedule is optimal.
+"""
+
+from collections import Counter
+from typing import List, Optional, Sequence, Tuple
+
+from .latency import service_mask
+from .seek import NUMPY_MIN_SIZE, np, seek_distances
+
+
+# Largest number of distinct tracks the interval DP solves exactly
+OPTIMAL_WAIT_MAX_TRACKS = 2048
+
+# Above this, candidate costs could overflow int64 and the DP runs on Python ints
+_INT64_SAFE = 2 ** 62
+
+
+def minimum_travel(requests: Sequence[int], initial_position: int) -> Tuple[int, bool]:
+    """
+    Minimum total seek distance that services every request
+
+    Returns:
+        (distance, right_first): the bound, and whether the optimal sweep
+        goes towards higher tracks first (ties go right)
+    """
+    if len(requests) == 0:
+        return 0, True
+    left = initial_position - min(min(requests), initial_position)
+    right = max(max(requests), initial_position) - initial_position
+    if left < right:
+        return 2 * left + right, False
+    return 2 * right + left, True
+
+
+def wait_lower_bound(requests: Sequence[int], initial_position: int) -> int:
+    """Lower bound of the total wait: every request waits at least its distance from the start"""
+    if np is not None and len(requests) >= NUMPY_MIN_SIZE:
+        return int(np.abs(np.asarray(requests, dtype=np.int64) - initial_position).sum())
+    return sum(abs(track - initial_position) for track in requests)
+
+
+def schedule_wait(sequence: Sequence[int], initial_position: int, stops: Sequence[int] = ()) -> int:
+    """
+    Total wait of a schedule in tracks: for every request, the distance the
+    head has travelled when it is serviced (stops: indexes of the disk-end
+    stops that service nothing, as in latency.schedule_latency)
+    """
+    if np is not None and len(sequence) >= NUMPY_MIN_SIZE:
+        travelled = np.cumsum(seek_distances(np.asarray(sequence, dtype=np.int64), initial_position))
+        return int(travelled[service_mask(len(sequence), stops)].sum())
+
+    skipped = set(stops)
+    travelled = 0
+    total = 0
+    for index, distance in enumerate(seek_distances(sequence, initial_position)):
+        travelled += distance
+        if index not in skipped:
+            total += travelled
+    return total
+
+
+def _wait_table(tracks: List[int], weights: List[int], start: int, keep_choices: bool = True):
+    """
+    Interval DP: cost-to-go of every interval containing start, by decreasing length
+
+    Returns:
+        {length: (first_left, go_right_from_left_end, go_right_from_right_end)}
+        where the i-th entry of each choice list describes the interval
+        [first_left + i, first_left + i + length - 1] (empty unless
+        keep_choices), and the optimal total wait from the start
+    """
+    m = len(tracks)
+    prefix = [0] * (m + 1)
+    for index, weight in enumerate(weights):
+        prefix[index + 1] = prefix[index] + weight
+    total = prefix[m]
+    span = tracks[-1] - tracks[0]
+    use_numpy = np is not None and m >= 64 and span * total * m < _INT64_SAFE
+
+    choices = {}
+    if use_numpy:
+        x = np.asarray(tracks, dtype=np.int64)
+        cumulative = np.asarray(prefix, dtype=np.int64)
+        cost_left_end = cost_right_end = np.zeros(1, dtype=np.int64)
+        for length in range(m - 1, 0, -1):
+            first = max(0, start - length + 1)
+            lefts = np.arange(first, min(start, m - length) + 1)
+            rights = lefts + length - 1
+            waiting = total - (cumulative[rights + 1] - cumulative[lefts])
+            # Cost-to-go of the intervals one longer, indexed like next_first + k
+            next_first = max(0, start - length)
+            can_left = lefts > 0
+            can_right = rights < m - 1
+            left_next = cost_left_end[np.where(can_left, lefts - 1 - next_first, 0)]
+            right_next = cost_right_end[np.where(can_right, lefts - next_first, 0)]
+            x_before = x[np.where(can_left, lefts - 1, 0)]
+            x_after = x[np.where(can_right, rights + 1, m - 1)]
+            new_left_end = np.empty(len(lefts), dtype=np.int64)
+            new_right_end = np.empty(len(lefts), dtype=np.int64)
+            right_choices = []
+            for position, result in ((x[lefts], new_left_end), (x[rights], new_right_end)):
+                via_left = (position - x_before) * waiting + left_next
+                via_right = (x_after - position) * waiting + right_next
+                go_right = can_right & (~can_left | (via_right <= via_left))
+                result[:] = np.where(go_right, via_right, via_left)
+                right_choices.append(go_right)
+            if keep_choices:
+                choices[length] = (first, right_choices[0], right_choices[1])
+            cost_left_end, cost_right_end = new_left_end, new_right_end
+        return choices, int(cost_left_end[0])
+
+    cost_left_end = cost_right_end = [0]
+    for length in range(m - 1, 0, -1):
+        first = max(0, start - length + 1)
+        next_first = max(0, start - length)
+        new_left_end, new_right_end, left_choices, right_choices = [], [], [], []
+        for left in range(first, min(start, m - length) + 1):
+            right = left + length - 1
+            waiting = total - (prefix[right + 1] - prefix[left])
+            for position, costs, chosen in ((tracks[left], new_left_end, left_choices),
+                                            (tracks[right], new_right_end, right_choices)):
+                via_left = via_right = None
+                if left > 0:
+                    via_left = (position - tracks[left - 1]) * waiting + cost_left_end[left - 1 - next_first]
+                if right < m - 1:
+                    via_right = (tracks[right + 1] - position) * waiting + cost_right_end[left - next_first]
+                go_right = via_right is not None and (via_left is None or via_right <= via_left)
+                costs.append(via_right if go_right else via_left)
+                chosen.append(go_right)
+        if keep_choices:
+            choices[length] = (first, left_choices, right_choices)
+        cost_left_end, cost_right_end = new_left_end, new_right_end
+    return choices, cost_left_end[0]
+
+
+def _distinct_tracks(requests: Sequence[int], initial_position: int, max_tracks: Optional[int]):
+    """Sorted distinct tracks (start included), their request counts and the index of the start"""
+    counts = Counter(requests.tolist() if hasattr(requests, "tolist") else requests)
+    counts.setdefault(initial_position, 0)
+    tracks = sorted(counts)
+    if max_tracks is not None and len(tracks) > max_tracks:
+        raise ValueError(f"OPTIMAL-WAIT solves at most {max_tracks} distinct tracks (got {len(tracks)})")
+    return tracks, [counts[track] for track in tracks], tracks.index(initial_position)
+
+
+def optimal_wait_order(requests: Sequence[int], initial_position: int,
+                       max_tracks: Optional[int] = OPTIMAL_WAIT_MAX_TRACKS) -> Tuple[List[int], int]:
+    """
+    Service order with the minimum total wait (linear seek cost)
+
+    Args:
+        requests: Track requests, all queued at time zero
+        initial_position: Head position before the first access
+        max_tracks: Largest number of distinct tracks to solve (None: no limit)
+
+    Returns:
+        (sequence, total_wait): the order, with every request of a track
+        serviced on the first visit, and its total wait in tracks
+
+    Raises:
+        ValueError: If the requests span more than max_tracks distinct tracks
+    """
+    if len(requests) == 0:
+        return [], 0
+    tracks, weights, start = _distinct_tracks(requests, initial_position, max_tracks)
+    choices, total_wait = _wait_table(tracks, weights, start)
+
+    sequence = [initial_position] * weights[start]
+    left = right = start
+    at_right_end = False
+    for length in range(1, len(tracks)):
+        first, left_end_choices, right_end_choices = choices[length]
+        go_right = bool((right_end_choices if at_right_end else left_end_choices)[left - first])
+        if go_right:
+            right += 1
+        else:
+            left -= 1
+        index = right if go_right else left
+        at_right_end = go_right
+        sequence.extend([tracks[index]] * weights[index])
+    return sequence, total_wait
+
+
+def optimal_bounds(requests: Sequence[int], initial_position: int,
+                   max_tracks: Optional[int] = OPTIMAL_WAIT_MAX_TRACKS) -> dict:
+    """
+    Lower bounds for comparing heuristics
+
+    Returns:
+        Dictionary with the minimum total seek time, the minimum total wait
+        (in tracks) and whether that wait is "exact" or a "lower_bound"
+        (when the requests span more than max_tracks distinct tracks)
+    """
+    total_seek_time, _ = minimum_travel(requests, initial_position)
+    distinct = len(set(requests.tolist() if hasattr(requests, "tolist") else requests) | {initial_position})
+    if len(requests) == 0:
+        total_wait, wait_bound = 0, "exact"
+    elif max_tracks is None or distinct <= max_tracks:
+        # Only the cost is needed: no choice tables, O(m) memory
+        _, total_wait = _wait_table(*_distinct_tracks(requests, initial_position, None), keep_choices=False)
+        wait_bound = "exact"
+    else:
+        total_wait = wait_lower_bound(requests, initial_position)
+        wait_bound = "lower_bound"
+    return {"total_seek_time": total_seek_time, "total_wait": total_wait, "wait_bound": wait_bound}
+
+
+def gap_percent(value: float, bound: float) -> Optional[float]:
+    """How far value is above a lower bound, in percent of the bound (None when the bound is 0)"""
+    if bound <= 0:
+        return 0.0 if value <= 0 else None
+    return round((value - bound) / bound * 100, 2)
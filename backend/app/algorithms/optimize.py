@@ -0,0 +1,319 @@
+"""
+Parameter search over algorithms, directions and N-Step SCAN batch sizes.
+
+Candidates share work instead of being simulated one by one:
+
+- SCAN, C-SCAN, LOOK and C-LOOK reuse one DiskScheduler, so the requests are
+  sorted once for every direction.
+- N-Step SCAN and FSCAN are evaluated with BatchScanKernel, which never builds
+  a sequence. Each batch is sorted once and summarized by prefix sums/maxima of
+  its gaps; the seek metrics of a SCAN pass over it from any head position and
+  in either direction then follow in O(log n). Sorted batches are memoized, so
+  both directions of an n_step candidate (and FSCAN, whose two queues are the
+  batches of n_step = ceil(n / 2)) reuse them.
+- A candidate whose partial total seek and max seek distance are already
+  dominated by a finished candidate is abandoned before its remaining batches.
+
+The result is the Pareto front of total seek time against max seek distance
+(or fairness).
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import List, Optional, Sequence
+
+from .disk_scheduling import DiskScheduler
+from .registry import registry
+from .seek import fairness_index
+
+
+DIRECTIONS = ("left", "right")
+
+# Second objective traded off against total seek time
+OBJECTIVES = ("max_seek_distance", "fairness")
+
+
+class SortedBatch:
+    """A batch of requests sorted once, with prefix aggregates of its gaps"""
+
+    __slots__ = ("tracks", "gap_sum", "gap_squares", "gap_prefix_max", "gap_suffix_max")
+
+    def __init__(self, tracks: Sequence[int]):
+        self.tracks = tracks = sorted(tracks)
+        gaps = [high - low for low, high in zip(tracks, tracks[1:])]
+        # gap_sum[k] / gap_squares[k] / gap_prefix_max[k] cover gaps[:k]; gap_suffix_max[k] covers gaps[k:]
+        self.gap_sum = [0, *accumulate(gaps)]
+        self.gap_squares = [0, *accumulate(gap * gap for gap in gaps)]
+        self.gap_prefix_max = [0, *accumulate(gaps, max)]
+        self.gap_suffix_max = [*accumulate(reversed(gaps), max)][::-1] + [0]
+
+    def scan(self, position: int, going_right: bool, last_track: int):
+        """
+        Seek metrics of DiskScheduler.scan over this batch
+
+        Args:
+            position: Head position before the batch
+            going_right: Initial direction of the pass
+            last_track: disk_size - 1 (SCAN runs to the disk end before reversing)
+
+        Returns:
+            Tuple of (end_position, moves, total, sum_of_squares, max_distance)
+        """
+        tracks = self.tracks
+        size = len(tracks)
+        split = bisect_left(tracks, position) if going_right else bisect_right(tracks, position)
+        # Gaps walked on either side of the split: gaps[:split - 1] and gaps[split:]
+        low, high = max(split - 1, 0), min(split, size - 1)
+        gap_total = self.gap_sum[low] + self.gap_sum[size - 1] - self.gap_sum[high]
+        gap_squares = self.gap_squares[low] + self.gap_squares[size - 1] - self.gap_squares[high]
+        gap_max = max(self.gap_prefix_max[low], self.gap_suffix_max[high])
+
+        # The remaining moves: into the batch, to the disk end, and back across the split
+        turns = split > 0 if going_right else split < size
+        if going_right:
+            moves = [tracks[split] - position] if split < size else []
+            if split > 0:
+                moves.append(last_track - (tracks[-1] if split < size else position))
+                moves.append(last_track - tracks[split - 1])
+                end_position = tracks[0]
+            else:
+                end_position = tracks[-1]
+        else:
+            moves = [position - tracks[split - 1]] if split > 0 else []
+            if split < size:
+                moves.append(tracks[0] if split > 0 else position)
+                moves.append(tracks[split])
+                end_position = tracks[-1]
+            else:
+                end_position = tracks[0]
+
+        return (
+            end_position,
+            size + turns,
+            gap_total + sum(moves),
+            gap_squares + sum(move * move for move in moves),
+            max(gap_max, *moves),
+        )
+
+
+class BatchScanKernel:
+    """Seek metrics of N-Step SCAN and FSCAN schedules without building sequences"""
+
+    def __init__(self, requests: Sequence[int], initial_position: int, disk_size: int):
+        """
+        Args:
+            requests: Track requests (already validated against disk_size)
+            initial_position: Initial head position
+            disk_size: Total number of tracks on the disk
+        """
+        self.requests = requests
+        self.initial_position = initial_position
+        self.disk_size = disk_size
+        self._batches = {}
+        self.hits = 0
+        self.misses = 0
+
+    def batch(self, start: int, end: int) -> SortedBatch:
+        """Sorted batch requests[start:end], memoized"""
+        key = (start, end)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = SortedBatch(self.requests[start:end])
+            self.misses += 1
+        else:
+            self.hits += 1
+        return batch
+
+    def clear(self):
+        """Drop memoized batches (counters are kept)"""
+        self._batches.clear()
+
+    def evaluate(self, n: int, going_right: bool, alternate: bool, prune=None) -> Optional[dict]:
+        """
+        Seek statistics of servicing the requests in batches of n with SCAN
+
+        Args:
+            n: Batch size
+            going_right: Direction of the first batch
+            alternate: Reverse the direction after every batch (N-Step SCAN)
+                instead of keeping it (FSCAN)
+            prune: Optional callable(total, max_distance) -> bool, checked after
+                every batch; evaluation stops when it returns True
+
+        Returns:
+            seek_statistics-style dict, or None when pruned
+        """
+        count = len(self.requests)
+        last_track = self.disk_size - 1
+        position = self.initial_position
+        moves = total = squares = max_distance = 0
+        for start in range(0, count, n):
+            position, batch_moves, batch_total, batch_squares, batch_max = self.batch(
+                start, min(start + n, count)
+            ).scan(position, going_right, last_track)
+            moves += batch_moves
+            total += batch_total
+            squares += batch_squares
+            max_distance = max(max_distance, batch_max)
+            if prune is not None and prune(total, max_distance):
+                return None
+            if alternate:
+                going_right = not going_right
+
+        if moves == 0:
+            return {"count": 0, "total": 0, "mean": 0.0, "std": 0.0, "max": 0}
+        variance = (moves * squares - total * total) / (moves * moves)
+        return {
+            "count": moves,
+            "total": total,
+            "mean": total / moves,
+            "std": max(variance, 0) ** 0.5,
+            "max": max_distance,
+        }
+
+
+def default_n_steps(count: int) -> List[int]:
+    """Candidate N-Step SCAN batch sizes: 1-16, then powers of two, then the whole input"""
+    candidates = set(range(1, 17))
+    power = 32
+    while power < count:
+        candidates.add(power)
+        power *= 2
+    candidates.add(count)
+    return sorted(n for n in candidates if 1 <= n <= count)
+
+
+def _candidate(algorithm: str, direction: Optional[str], n_step: Optional[int], statistics: dict) -> dict:
+    return {
+        "algorithm": algorithm,
+        "direction": direction,
+        "n_step": n_step,
+        "total_seek_time": statistics["total"],
+        "average_seek_time": round(statistics["total"] / statistics["count"], 2) if statistics["count"] else 0,
+        "max_seek_distance": statistics["max"],
+        "seek_std": statistics["std"],
+        "fairness_index": fairness_index(statistics),
+    }
+
+
+def _objectives(candidate: dict, objective: str):
+    """Objective vector to minimize"""
+    if objective == "fairness":
+        return candidate["total_seek_time"], -candidate["fairness_index"]
+    return candidate["total_seek_time"], candidate["max_seek_distance"]
+
+
+def _dominates(a, b) -> bool:
+    return a[0] <= b[0] and a[1] <= b[1] and (a[0] < b[0] or a[1] < b[1])
+
+
+def pareto_front(candidates: List[dict], objective: str = "max_seek_distance") -> List[dict]:
+    """Candidates not dominated by any other, ordered by total seek time"""
+    vectors = [_objectives(candidate, objective) for candidate in candidates]
+    front = [
+        candidate for candidate, vector in zip(candidates, vectors)
+        if not any(_dominates(other, vector) for other in vectors)
+    ]
+    return sorted(front, key=lambda candidate: _objectives(candidate, objective))
+
+
+def optimize(requests: Sequence[int], initial_position: int, disk_size: int = 200,
+             algorithms: Optional[Sequence[str]] = None, directions: Sequence[str] = DIRECTIONS,
+             n_steps: Optional[Sequence[int]] = None, objective: str = "max_seek_distance") -> dict:
+    """
+    Search algorithms, initial directions and N-Step SCAN batch sizes for a workload
+
+    Args:
+        requests: Track requests
+        initial_position: Initial head position
+        disk_size: Total number of tracks on the disk
+        algorithms: Algorithms to consider (default: all)
+        directions: Initial directions to consider for directional algorithms
+        n_steps: N-Step SCAN batch sizes to try (default: default_n_steps);
+            values above the request count behave like n = request count
+        objective: Second objective next to total seek time, "max_seek_distance"
+            (minimized) or "fairness" (maximized)
+
+    Returns:
+        Dictionary with the best candidate (lowest total seek time), the Pareto
+        front, every fully evaluated candidate and search counters
+
+    Raises:
+        ValueError: On unknown algorithms, directions, objectives or invalid n_steps
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Available: {', '.join(OBJECTIVES)}")
+    specs = [registry.get(a) for a in (algorithms or registry.names("compare"))]
+    algorithms = [spec.name for spec in specs]
+    directions = [str(d).lower() for d in directions]
+    if not directions or any(d not in DIRECTIONS for d in directions):
+        raise ValueError("directions must be a non-empty list of 'left'/'right'")
+
+    # Validates the bounds once for every candidate
+    scheduler = DiskScheduler(requests, initial_position, disk_size)
+    requests = scheduler.request_list()
+    count = len(requests)
+    if n_steps is None:
+        n_steps = default_n_steps(count)
+    if any(not isinstance(n, int) or n < 1 for n in n_steps):
+        raise ValueError("n_steps must be positive integers")
+    # Every n >= count is a single batch: evaluate it once
+    n_steps = sorted({min(n, max(count, 1)) for n in n_steps})
+
+    candidates = []
+    pruned = 0
+
+    for spec in specs:
+        if spec.supports("batch_scan"):
+            # Evaluated below by the batch kernel
+            continue
+        for direction in (directions if spec.uses_direction else [None]):
+            result = scheduler.simulate(spec.name, direction or "right")
+            candidates.append(_candidate(spec.name, direction, None, result["seek_statistics"]))
+
+    def prune(total: int, max_distance: int) -> bool:
+        # Partial metrics only grow, so a finished candidate that already beats
+        # them will also dominate the complete schedule
+        partial = (total, max_distance)
+        return any(_dominates(finished, partial) for finished in finished_vectors)
+
+    finished_vectors = [_objectives(c, objective) for c in candidates] if objective == "max_seek_distance" else None
+    kernel = BatchScanKernel(requests, initial_position, disk_size)
+    fscan_n = (count + 1) // 2
+
+    batched = []
+    if "N-STEP SCAN" in algorithms:
+        batched.extend(("N-STEP SCAN", n) for n in n_steps)
+    if "FSCAN" in algorithms and count:
+        batched.append(("FSCAN", fscan_n))
+    # FSCAN shares its batches with N-Step SCAN of the same size
+    batched.sort(key=lambda entry: (entry[1], entry[0]))
+
+    for index, (algorithm, n) in enumerate(batched):
+        for direction in directions:
+            statistics = kernel.evaluate(n, direction == "right", alternate=algorithm == "N-STEP SCAN",
+                                         prune=prune if finished_vectors is not None else None)
+            if statistics is None:
+                pruned += 1
+                continue
+            candidate = _candidate(algorithm, direction, n if algorithm == "N-STEP SCAN" else None, statistics)
+            candidates.append(candidate)
+            if finished_vectors is not None:
+                finished_vectors.append(_objectives(candidate, objective))
+        if index + 1 == len(batched) or batched[index + 1][1] != n:
+            kernel.clear()
+
+    front = pareto_front(candidates, objective)
+    return {
+        "objective": objective,
+        "best": front[0] if front else None,
+        "pareto_front": front,
+        "candidates": sorted(candidates, key=lambda candidate: _objectives(candidate, objective)),
+        "search": {
+            "evaluated": len(candidates),
+            "pruned": pruned,
+            "n_steps": n_steps,
+            "batch_cache_hits": kernel.hits,
+            "batch_cache_misses": kernel.misses,
+        },
+    }
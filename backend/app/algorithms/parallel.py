@@ -0,0 +1,307 @@
+"""
+Parallel execution of DiskScheduler simulations on a reusable process pool.
+
+The request list is written once into a shared memory block; each task only
+receives the block name and its own parameters, so large inputs are not
+pickled once per algorithm.
+
+sweep() runs a parameter grid over one request list the same way, returning
+flat summary rows instead of full results so that large grids stay cheap to
+send back from the workers.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import List, Optional, Sequence, Tuple
+
+from .cost_model import CostModel
+from .disk_scheduling import DiskScheduler, pack_requests
+
+
+_executor = None
+_executor_workers = None
+_executor_lock = Lock()
+
+
+def get_executor(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating it on first use
+
+    Args:
+        max_workers: Pool size (defaults to the number of CPUs). Asking for a
+            different size replaces the existing pool, as does a pool broken
+            by a worker that died.
+    """
+    global _executor, _executor_workers
+    workers = max_workers or os.cpu_count() or 1
+    with _executor_lock:
+        broken = _executor is not None and getattr(_executor, "_broken", False)
+        if _executor is None or _executor_workers != workers or broken:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers)
+            _executor_workers = workers
+        return _executor
+
+
+def shutdown_executor():
+    """Shut down the shared process pool (it is recreated on next use)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+        _executor = None
+        _executor_workers = None
+
+
+def _attach_requests(shm_name: str, length: int, offset: int = 0) -> List[int]:
+    """Copy length requests, starting at request offset, out of a shared memory block"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        itemsize = array('q').itemsize
+        view = shm.buf[offset * itemsize:(offset + length) * itemsize].cast('q')
+        try:
+            return view.tolist()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _share_requests(packed: array) -> shared_memory.SharedMemory:
+    """Write packed requests into a new shared memory block (caller unlinks it)"""
+    shm = shared_memory.SharedMemory(create=True, size=max(len(packed) * packed.itemsize, 1))
+    try:
+        shm.buf[:len(packed) * packed.itemsize] = memoryview(packed).cast('B')
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return shm
+
+
+def _simulate_shared(shm_name: str, length: int, initial_position: int, disk_size: int,
+                     algorithm: str, direction: str, n_step: Optional[int],
+                     cost_model: Optional[dict] = None, qos: Optional[dict] = None, latency: bool = False) -> dict:
+    """Worker entry point: attach to the shared request block and run one simulation"""
+    requests = _attach_requests(shm_name, length)
+    model = CostModel.from_dict(cost_model, cylinders=disk_size) if cost_model is not None else None
+    scheduler = DiskScheduler(requests, initial_position, disk_size, cost_model=model, **(qos or {}))
+    return scheduler.simulate(algorithm=algorithm, direction=direction, n_step=n_step, latency=latency)
+
+
+def simulate_many(requests: Sequence[int], initial_position: int, disk_size: int,
+                  runs: List[Tuple[str, str, Optional[int]]],
+                  max_workers: Optional[int] = None,
+                  cost_model: Optional[CostModel] = None,
+                  qos: Optional[dict] = None,
+                  latency: bool = False) -> list:
+    """
+    Run several simulations of the same request list in parallel
+
+    Args:
+        requests: Track requests shared by every run
+        initial_position: Initial head position
+        disk_size: Total number of tracks on the disk
+        runs: (algorithm, direction, n_step) for each simulation
+        max_workers: Pool size (defaults to the number of CPUs)
+        cost_model: Service-time model (defaults to DiskScheduler's)
+        qos: Per-request deadlines/priorities/writes keyword arguments of
+            DiskScheduler (sent to every task)
+        latency: Include the per-request wait distribution in every result
+
+    Returns:
+        One entry per run, in order: the simulate() result dict, or the
+        exception raised by that run
+    """
+    packed = pack_requests(requests)
+    shm = _share_requests(packed)
+    try:
+        executor = get_executor(max_workers)
+        futures = [
+            executor.submit(_simulate_shared, shm.name, len(packed), initial_position,
+                            disk_size, algorithm, direction, n_step,
+                            cost_model.to_dict() if cost_model is not None else None, qos, latency)
+            for algorithm, direction, n_step in runs
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _simulate_disk_shared(shm_name: str, offset: int, length: int, initial_position: int, disk_size: int,
+                          algorithm: str, direction: str, n_step: Optional[int],
+                          cost_model: Optional[dict] = None) -> dict:
+    """Worker entry point: run one disk's slice of the shared request block"""
+    requests = _attach_requests(shm_name, length, offset)
+    model = CostModel.from_dict(cost_model, cylinders=disk_size) if cost_model is not None else None
+    scheduler = DiskScheduler(requests, initial_position, disk_size, cost_model=model)
+    return scheduler.simulate(algorithm=algorithm, direction=direction, n_step=n_step)
+
+
+def simulate_disks(workloads: List[Tuple[Sequence[int], int]], disk_size: int, algorithm: str,
+                   direction: str = "right", n_step: Optional[int] = None,
+                   max_workers: Optional[int] = None,
+                   cost_model: Optional[CostModel] = None) -> list:
+    """
+    Run one algorithm over several request lists (e.g. the disks of an array) in parallel
+
+    All lists are packed back to back into a single shared memory block and
+    each task reads its own slice.
+
+    Args:
+        workloads: (requests, initial_position) per disk
+        disk_size: Total number of tracks of each disk
+        algorithm: Algorithm run on every workload
+        direction: Initial direction for directional algorithms
+        n_step: Batch size for N-Step SCAN
+        max_workers: Pool size (defaults to the number of CPUs); 1 runs in-process
+        cost_model: Service-time model (defaults to DiskScheduler's)
+
+    Returns:
+        The simulate() result of every workload, in order
+
+    Raises:
+        ValueError: If any workload is invalid
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(workloads) <= 1:
+        return [
+            DiskScheduler(requests, initial_position, disk_size, cost_model=cost_model)
+            .simulate(algorithm=algorithm, direction=direction, n_step=n_step)
+            for requests, initial_position in workloads
+        ]
+
+    packed = array('q')
+    slices = []
+    for requests, _ in workloads:
+        slices.append((len(packed), len(requests)))
+        packed.extend(pack_requests(requests))
+    shm = _share_requests(packed)
+    try:
+        executor = get_executor(workers)
+        futures = [
+            executor.submit(_simulate_disk_shared, shm.name, offset, length, initial_position, disk_size,
+                            algorithm, direction, n_step,
+                            cost_model.to_dict() if cost_model is not None else None)
+            for (offset, length), (_, initial_position) in zip(slices, workloads)
+        ]
+        return [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Columns of a sweep() row
+SWEEP_COLUMNS = (
+    "initial_position", "disk_size", "algorithm", "direction", "n_step",
+    "total_seek_time", "average_seek_time", "max_seek_distance", "seek_std",
+    "total_service_time_ms", "iops", "p99_wait_ms", "jain_index", "error",
+)
+
+# (initial_position, disk_size, algorithm, direction, n_step)
+SweepPoint = Tuple[int, int, str, Optional[str], Optional[int]]
+
+
+def _sweep_row(point: SweepPoint, error: Optional[str] = None) -> dict:
+    """Empty sweep row for a point, optionally carrying an error message"""
+    initial_position, disk_size, algorithm, direction, n_step = point
+    row = dict.fromkeys(SWEEP_COLUMNS)
+    row.update(initial_position=initial_position, disk_size=disk_size, algorithm=algorithm,
+               direction=direction, n_step=n_step, error=error)
+    return row
+
+
+def _sweep_points(requests: Sequence[int], points: List[SweepPoint]) -> List[dict]:
+    """Run sweep points in order, reusing one DiskScheduler per (initial_position, disk_size)"""
+    schedulers = {}
+    rows = []
+    for point in points:
+        initial_position, disk_size, algorithm, direction, n_step = point
+        row = _sweep_row(point)
+        try:
+            key = (initial_position, disk_size)
+            if key not in schedulers:
+                schedulers.clear()
+                schedulers[key] = DiskScheduler(requests, initial_position, disk_size)
+            result = schedulers[key].simulate(algorithm, direction or "right", n_step, latency=True)
+            row.update(
+                total_seek_time=result["total_seek_time"],
+                average_seek_time=result["average_seek_time"],
+                max_seek_distance=result["seek_statistics"]["max"],
+                seek_std=result["seek_statistics"]["std"],
+                total_service_time_ms=result["cost"]["total_ms"],
+                iops=result["cost"]["iops"],
+                p99_wait_ms=result["latency"]["wait_ms"]["p99"],
+                jain_index=result["latency"]["jain_index"],
+            )
+        except Exception as e:
+            # One failing point (invalid parameters or an engine error) must not abort the grid
+            row["error"] = str(e)
+        rows.append(row)
+    return rows
+
+
+def _sweep_shared(shm_name: str, length: int, points: List[SweepPoint]) -> List[dict]:
+    """Worker entry point: attach to the shared request block and run a chunk of sweep points"""
+    return _sweep_points(_attach_requests(shm_name, length), points)
+
+
+def sweep(requests: Sequence[int], points: List[SweepPoint], max_workers: Optional[int] = None,
+          chunks_per_worker: int = 4) -> List[dict]:
+    """
+    Run a parameter grid over one request list on the process pool
+
+    Points are grouped by (initial_position, disk_size) so each worker
+    validates the requests once per group, then split into roughly
+    chunks_per_worker chunks per worker.
+
+    Args:
+        requests: Track requests shared by every point
+        points: (initial_position, disk_size, algorithm, direction, n_step) per run
+        max_workers: Pool size (defaults to the number of CPUs); 1 runs in-process
+        chunks_per_worker: Load-balancing granularity
+
+    Returns:
+        One row per point (keys SWEEP_COLUMNS), in the order of points; points
+        that failed (including every point of a chunk whose worker died) carry
+        an error message instead of metrics
+    """
+    order = sorted(range(len(points)), key=lambda i: (points[i][0], points[i][1]))
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(points) <= 1:
+        rows = _sweep_points(requests, [points[i] for i in order])
+    else:
+        chunk_size = max(1, -(-len(order) // (workers * chunks_per_worker)))
+        packed = pack_requests(requests)
+        shm = _share_requests(packed)
+        try:
+            executor = get_executor(workers)
+            chunks = [[points[i] for i in order[start:start + chunk_size]]
+                      for start in range(0, len(order), chunk_size)]
+            futures = [executor.submit(_sweep_shared, shm.name, len(packed), chunk) for chunk in chunks]
+            rows = []
+            for chunk, future in zip(chunks, futures):
+                try:
+                    rows.extend(future.result())
+                except Exception as e:
+                    # e.g. BrokenProcessPool: the chunk's points are reported, not lost
+                    rows.extend(_sweep_row(point, str(e) or type(e).__name__) for point in chunk)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    ordered = [None] * len(points)
+    for index, row in zip(order, rows):
+        ordered[index] = row
+    return ordered
@@ -0,0 +1,140 @@
+"""
+Pending-request index shared by the event-driven and deadline schedulers.
+
+Pending requests are kept in a Fenwick tree over the (compressed) set of
+requested tracks, so adding or removing a request and finding the nearest
+pending one in either direction are O(log n).
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import List, Optional
+
+
+class PendingTracks:
+    """
+    Pending requests indexed by track
+
+    Each requested track owns a FIFO of request ids; a Fenwick tree counts
+    which tracks currently have pending requests, so successor/predecessor
+    queries run in O(log m) for m distinct tracks. Removing a request from
+    the middle of a FIFO only marks its id; marked ids are dropped when they
+    reach the front, so every operation is O(1) amortized besides the tree.
+    """
+
+    def __init__(self, tracks: List[int]):
+        """
+        Args:
+            tracks: Every track that can ever be pending, sorted and distinct
+        """
+        self.tracks = tracks
+        self.size = len(tracks)
+        self.tree = [0] * (self.size + 1)
+        self.queues = {}
+        # Live (unremoved) requests per slot, and ids removed but still queued
+        self.counts = [0] * self.size
+        self.removed = set()
+        self.occupied = 0
+        self.pending = 0
+        self._top_bit = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    def __len__(self) -> int:
+        return self.pending
+
+    def _update(self, slot: int, delta: int):
+        slot += 1
+        while slot <= self.size:
+            self.tree[slot] += delta
+            slot += slot & -slot
+
+    def _count_before(self, slot: int) -> int:
+        """Number of occupied slots with index < slot"""
+        total = 0
+        while slot > 0:
+            total += self.tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def _kth(self, k: int) -> int:
+        """Slot index of the k-th occupied slot (1-based k)"""
+        position = 0
+        bit = self._top_bit
+        while bit:
+            candidate = position + bit
+            if candidate <= self.size and self.tree[candidate] < k:
+                position = candidate
+                k -= self.tree[candidate]
+            bit >>= 1
+        return position
+
+    def add(self, track: int, request_id: int):
+        """Mark a request as pending"""
+        slot = bisect_left(self.tracks, track)
+        queue = self.queues.get(slot)
+        if queue is None:
+            queue = self.queues[slot] = deque()
+        if not self.counts[slot]:
+            self._update(slot, 1)
+            self.occupied += 1
+        queue.append(request_id)
+        self.counts[slot] += 1
+        self.pending += 1
+
+    def _front(self, slot: int) -> deque:
+        """Queue of a slot with removed ids dropped from its front"""
+        queue = self.queues[slot]
+        while queue[0] in self.removed:
+            self.removed.discard(queue.popleft())
+        return queue
+
+    def _release(self, slot: int):
+        """Account for one request of a slot leaving the pending set"""
+        self.counts[slot] -= 1
+        self.pending -= 1
+        if not self.counts[slot]:
+            self._update(slot, -1)
+            self.occupied -= 1
+            # Only removed ids are left: drop them now rather than on the next add
+            queue = self.queues[slot]
+            while queue:
+                self.removed.discard(queue.popleft())
+
+    def has(self, track: int) -> bool:
+        """Whether any request is pending at a track"""
+        slot = bisect_left(self.tracks, track)
+        return slot < self.size and self.tracks[slot] == track and self.counts[slot] > 0
+
+    def first_id(self, track: int) -> int:
+        """Earliest pending request id at a track"""
+        return self._front(bisect_left(self.tracks, track))[0]
+
+    def remove(self, track: int, request_id: int):
+        """Remove a specific pending request"""
+        slot = bisect_left(self.tracks, track)
+        queue = self.queues[slot]
+        if queue[0] == request_id:
+            queue.popleft()
+        else:
+            self.removed.add(request_id)
+        self._release(slot)
+
+    def pop(self, track: int) -> int:
+        """Remove and return the earliest pending request at a track"""
+        slot = bisect_left(self.tracks, track)
+        request_id = self._front(slot).popleft()
+        self._release(slot)
+        return request_id
+
+    def successor(self, position: int) -> Optional[int]:
+        """Smallest pending track >= position, or None"""
+        before = self._count_before(bisect_left(self.tracks, position))
+        if before == self.occupied:
+            return None
+        return self.tracks[self._kth(before + 1)]
+
+    def predecessor(self, position: int) -> Optional[int]:
+        """Largest pending track <= position, or None"""
+        upto = self._count_before(bisect_right(self.tracks, position))
+        if upto == 0:
+            return None
+        return self.tracks[self._kth(upto)]
@@ -0,0 +1,223 @@
+"""
+Multi-disk (striped/mirrored) arrays.
+
+DiskArray maps logical block addresses onto the tracks of N identical disks
+with a RAID-0, RAID-1 or RAID-10 layout and runs a scheduling algorithm on
+every disk independently, as the heads of an array move in parallel. The
+array finishes when its slowest disk does, so the summary reports the
+makespan and how unevenly the work was spread, next to per-disk results.
+"""
+
+from array import array
+from typing import List, Optional, Sequence, Union
+
+from .cost_model import CostModel
+from .disk_scheduling import pack_requests
+from .parallel import simulate_disks
+from .seek import NUMPY_MIN_SIZE, np
+
+
+LAYOUTS = ("RAID0", "RAID1", "RAID10")
+OPERATIONS = ("read", "write")
+
+
+def normalize_layout(layout: str) -> str:
+    """'raid-10', 'RAID 1+0' -> 'RAID10'"""
+    name = str(layout).upper().replace("-", "").replace(" ", "").replace("+", "")
+    if name not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{layout}'. Available: {', '.join(LAYOUTS)}")
+    return name
+
+
+def _imbalance(values: Sequence[float]) -> float:
+    """Max over mean: 1.0 when every disk does the same amount of work"""
+    mean = sum(values) / len(values) if values else 0
+    return round(max(values) / mean, 4) if mean > 0 else 1.0
+
+
+class DiskArray:
+    """N identical disks behind a striping/mirroring layout"""
+
+    def __init__(self, disks: int, disk_size: int = 200, stripe_size: int = 1, layout: str = "RAID0",
+                 cost_model: Optional[CostModel] = None):
+        """
+        Args:
+            disks: Number of disks in the array
+            disk_size: Tracks per disk
+            stripe_size: Consecutive logical tracks stored on one disk before
+                moving to the next (the stripe unit)
+            layout: RAID0 (striping), RAID1 (every disk mirrors the others) or
+                RAID10 (striping over mirrored pairs)
+            cost_model: Service-time model of each disk (defaults to
+                DiskScheduler's)
+
+        Raises:
+            ValueError: If the geometry does not fit the layout
+        """
+        self.layout = normalize_layout(layout)
+        self.disks = int(disks)
+        self.disk_size = int(disk_size)
+        self.stripe_size = int(stripe_size)
+        self.cost_model = cost_model
+
+        if self.disk_size < 1:
+            raise ValueError("disk_size must be at least 1")
+        if not 1 <= self.stripe_size <= self.disk_size:
+            raise ValueError(f"stripe_size must be between 1 and disk_size ({self.disk_size})")
+        if self.layout == "RAID0":
+            if self.disks < 1:
+                raise ValueError("RAID0 needs at least 1 disk")
+            self.copies = 1
+        elif self.layout == "RAID1":
+            if self.disks < 2:
+                raise ValueError("RAID1 needs at least 2 disks")
+            self.copies = self.disks
+        else:
+            if self.disks < 4 or self.disks % 2:
+                raise ValueError("RAID10 needs an even number of disks, at least 4")
+            self.copies = 2
+        # Stripe groups: sets of disks holding the same data
+        self.groups = self.disks // self.copies
+        # Trailing tracks that do not fill a whole stripe unit are left unused
+        self.capacity = self.groups * (self.disk_size // self.stripe_size) * self.stripe_size
+
+    def locate(self, block: int) -> tuple:
+        """
+        Physical location of a logical block
+
+        Returns:
+            (group, track): the stripe group whose disks hold the block, and
+            the track on those disks
+        """
+        stripe, offset = divmod(block, self.stripe_size)
+        row, group = divmod(stripe, self.groups)
+        return group, row * self.stripe_size + offset
+
+    def map_requests(self, requests: Sequence[int], operation: str = "read") -> List[array]:
+        """
+        Split logical requests into per-disk track requests
+
+        A write goes to every mirror of its group. Reads are spread over the
+        mirrors of their group round-robin, in request order, so every copy
+        serves an equal share.
+
+        Args:
+            requests: Logical block addresses, in arrival order
+            operation: "read" or "write"
+
+        Returns:
+            One array('q') of tracks per disk, each in arrival order
+
+        Raises:
+            ValueError: If an address is outside the array or the operation is unknown
+        """
+        operation = str(operation).lower()
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}'. Available: {', '.join(OPERATIONS)}")
+        count = len(requests)
+        if count == 0:
+            return [array("q") for _ in range(self.disks)]
+        packed = pack_requests(requests)
+        low, high = min(packed), max(packed)
+        if low < 0 or high >= self.capacity:
+            bad = low if low < 0 else high
+            raise ValueError(f"Block {bad} is out of range [0, {self.capacity - 1}] for this array")
+
+        write = operation == "write"
+        if np is not None and count >= NUMPY_MIN_SIZE:
+            return self._map_numpy(np.frombuffer(packed, dtype=np.int64), write)
+
+        per_disk = [array("q") for _ in range(self.disks)]
+        copies = self.copies
+        # Reads taken by each group so far, to rotate over its mirrors
+        reads = [0] * self.groups
+        for block in packed:
+            group, track = self.locate(block)
+            base = group * copies
+            if write:
+                for disk in range(base, base + copies):
+                    per_disk[disk].append(track)
+            else:
+                per_disk[base + reads[group] % copies].append(track)
+                reads[group] += 1
+        return per_disk
+
+    def _map_numpy(self, blocks, write: bool) -> List[array]:
+        stripe, offset = np.divmod(blocks, self.stripe_size)
+        row, group = np.divmod(stripe, self.groups)
+        tracks = row * self.stripe_size + offset
+        if write:
+            # Every mirror of a group gets the group's requests
+            order = np.argsort(group, kind="stable")
+            bounds = np.searchsorted(group[order], np.arange(self.groups + 1))
+            shares = [pack_requests(tracks[order[bounds[g]:bounds[g + 1]]]) for g in range(self.groups)]
+            return [shares[disk // self.copies] for disk in range(self.disks)]
+        # Rank of every read among its group's reads, to rotate over the mirrors
+        order = np.argsort(group, kind="stable")
+        bounds = np.searchsorted(group[order], np.arange(self.groups))
+        rank = np.empty(len(blocks), dtype=np.int64)
+        rank[order] = np.arange(len(blocks)) - bounds[group[order]]
+        disk = group * self.copies + rank % self.copies
+        order = np.argsort(disk, kind="stable")
+        bounds = np.searchsorted(disk[order], np.arange(self.disks + 1))
+        return [pack_requests(tracks[order[bounds[d]:bounds[d + 1]]]) for d in range(self.disks)]
+
+    def simulate(self, requests: Sequence[int], initial_position: Union[int, Sequence[int]], algorithm: str,
+                 direction: str = "right", n_step: Optional[int] = None, operation: str = "read",
+                 max_workers: Optional[int] = None) -> dict:
+        """
+        Run one algorithm on every disk of the array
+
+        Args:
+            requests: Logical block addresses, in arrival order
+            initial_position: Head position shared by all disks, or one per disk
+            algorithm: Scheduling algorithm used by every disk
+            direction: Initial direction for directional algorithms
+            n_step: Batch size for N-Step SCAN
+            operation: "read" or "write"
+            max_workers: Process pool size (defaults to the number of CPUs);
+                1 runs the disks in-process, one after another
+
+        Returns:
+            Array summary (makespan, totals, imbalance factors) with the
+            simulate() result of every disk under "disks"
+        """
+        if isinstance(initial_position, (list, tuple)):
+            if len(initial_position) != self.disks:
+                raise ValueError(f"initial_position must be one number or a list of {self.disks} positions")
+            positions = list(initial_position)
+        else:
+            positions = [initial_position] * self.disks
+
+        per_disk = self.map_requests(requests, operation)
+        results = simulate_disks(list(zip(per_disk, positions)), self.disk_size, algorithm, direction, n_step,
+                                 max_workers=max_workers, cost_model=self.cost_model)
+
+        disks = []
+        for disk, result in enumerate(results):
+            group = disk // self.copies
+            disks.append({"disk": disk, "group": group, "mirror": disk - group * self.copies, **result})
+        service_times = [result["cost"]["total_ms"] for result in results]
+        seek_times = [result["total_seek_time"] for result in results]
+        request_counts = [result["total_requests"] for result in results]
+        makespan_ms = max(service_times)
+
+        return {
+            "layout": self.layout,
+            "disks": disks,
+            "disk_count": self.disks,
+            "disk_size": self.disk_size,
+            "stripe_size": self.stripe_size,
+            "capacity": self.capacity,
+            "algorithm": results[0]["algorithm"],
+            "operation": str(operation).lower(),
+            "total_requests": len(requests),
+            "makespan_ms": makespan_ms,
+            "makespan_seek_time": max(seek_times),
+            "total_seek_time": sum(seek_times),
+            "total_service_time_ms": round(sum(service_times), 3),
+            "iops": round(len(requests) / (makespan_ms / 1000), 2) if makespan_ms > 0 else 0,
+            "load_imbalance": _imbalance(service_times),
+            "seek_imbalance": _imbalance(seek_times),
+            "request_imbalance": _imbalance(request_counts),
+        }
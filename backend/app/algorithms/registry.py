@@ -0,0 +1,170 @@
+"""
+Registry of the scheduling algorithms known to the simulator.
+
+Each algorithm is described once by an AlgorithmSpec: its result label,
+accepted spellings, the parameters it reads, what it supports, and one or
+more engines that run it. DiskScheduler.simulate dispatches through the
+registry, and the API, CLI and optimizer list and validate algorithms from
+it, so a new algorithm (or a faster engine for an existing one) only has to
+be registered:
+
+    registry.register(AlgorithmSpec("MY-SCAN", run=my_scan, parameters=("direction",)))
+    registry.register_engine("SSTF", "native", native_sstf)
+
+An engine is a callable (scheduler, direction, n_step) returning
+(sequence, total_seek_time, seek_operations), like the DiskScheduler methods,
+optionally followed by a dict of extra result fields.
+"""
+
+from threading import Lock
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+
+# Parameters an algorithm may read from a simulate request
+PARAMETERS = ("direction", "n_step")
+
+# Capabilities:
+#   compare     - included in /api/compare/ and default CLI/optimizer runs
+#   online      - supported by the event-driven OnlineScheduler
+#   vectorized  - has a NumPy fast path for large inputs
+#   batch_scan  - a batched SCAN that optimize.BatchScanKernel evaluates exactly
+#   deadlines   - honours per-request deadlines/priorities and reports wait
+#                 percentiles and deadline misses; compared only when a
+#                 payload carries deadlines, priorities or writes
+CAPABILITIES = ("compare", "online", "vectorized", "batch_scan", "deadlines")
+
+Engine = Callable[..., tuple]
+
+
+class AlgorithmSpec:
+    """Description of one scheduling algorithm"""
+
+    def __init__(self, name: str, run: Engine, full_name: Optional[str] = None, description: str = "",
+                 aliases: Sequence[str] = (), parameters: Sequence[str] = (), required: Sequence[str] = (),
+                 capabilities: Sequence[str] = ()):
+        """
+        Args:
+            name: Canonical upper-case name, used as the result label
+            run: Default ("python") engine
+            full_name: Human-readable name (defaults to name)
+            description: One-line description for /api/algorithms/
+            aliases: Other accepted spellings (matched case-insensitively)
+            parameters: Request parameters the algorithm reads (see PARAMETERS)
+            required: Parameters an API request must supply explicitly
+            capabilities: Supported features (see CAPABILITIES)
+        """
+        unknown = [p for p in tuple(parameters) + tuple(required) if p not in PARAMETERS]
+        if unknown:
+            raise ValueError(f"Unknown parameter(s) {', '.join(unknown)}. Available: {', '.join(PARAMETERS)}")
+        unknown = [c for c in capabilities if c not in CAPABILITIES]
+        if unknown:
+            raise ValueError(f"Unknown capabilities {', '.join(unknown)}. Available: {', '.join(CAPABILITIES)}")
+        self.name = name.upper().strip()
+        self.full_name = full_name or self.name
+        self.description = description
+        self.aliases = tuple(alias.upper().strip() for alias in aliases)
+        self.parameters = tuple(parameters)
+        self.required = tuple(required)
+        self.capabilities = frozenset(capabilities)
+        self.engines: Dict[str, Engine] = {"python": run}
+
+    @property
+    def uses_direction(self) -> bool:
+        return "direction" in self.parameters
+
+    def supports(self, capability: str) -> bool:
+        return capability in self.capabilities
+
+    def engine(self, name: Optional[str] = None) -> Engine:
+        """
+        The engine registered under name (None picks the default)
+
+        Raises:
+            ValueError: If the algorithm has no such engine
+        """
+        engine = self.engines.get(name or "python")
+        if engine is None:
+            raise ValueError(f"Algorithm {self.name} has no '{name}' engine. Available: {', '.join(self.engines)}")
+        return engine
+
+    def describe(self) -> dict:
+        """JSON-friendly description, as listed by /api/algorithms/"""
+        return {
+            "name": self.name,
+            "full_name": self.full_name,
+            "description": self.description,
+            "aliases": list(self.aliases),
+            "parameters": list(self.parameters),
+            "requires_direction": self.uses_direction,
+            "requires_n_step": "n_step" in self.required,
+            "capabilities": sorted(self.capabilities),
+            "engines": list(self.engines),
+        }
+
+
+class AlgorithmRegistry:
+    """Algorithms by canonical name, in registration order, with alias lookup"""
+
+    def __init__(self):
+        self._lock = Lock()
+        self._specs: Dict[str, AlgorithmSpec] = {}
+        self._lookup: Dict[str, str] = {}
+
+    def register(self, spec: AlgorithmSpec, replace: bool = False) -> AlgorithmSpec:
+        """
+        Add an algorithm
+
+        Raises:
+            ValueError: If its name or an alias is already taken (unless replace)
+        """
+        with self._lock:
+            spellings = (spec.name,) + spec.aliases
+            if not replace:
+                taken = [s for s in spellings if s in self._lookup]
+                if taken:
+                    raise ValueError(f"Algorithm name(s) already registered: {', '.join(taken)}")
+            old = self._specs.get(spec.name)
+            if old is not None:
+                for spelling in (old.name,) + old.aliases:
+                    self._lookup.pop(spelling, None)
+            self._specs[spec.name] = spec
+            for spelling in spellings:
+                self._lookup[spelling] = spec.name
+        return spec
+
+    def register_engine(self, algorithm: str, engine: str, run: Engine):
+        """Add an alternative implementation of a registered algorithm"""
+        self.get(algorithm).engines[engine] = run
+
+    def resolve(self, algorithm: str) -> Optional[str]:
+        """Canonical name of an algorithm spelling, or None if unknown"""
+        return self._lookup.get(str(algorithm).upper().strip())
+
+    def get(self, algorithm: str) -> AlgorithmSpec:
+        """
+        Spec of an algorithm by name or alias
+
+        Raises:
+            ValueError: If the algorithm is unknown
+        """
+        name = self.resolve(algorithm)
+        if name is None:
+            raise ValueError(f"Unknown algorithm '{algorithm}'. Available: {', '.join(self.names())}")
+        return self._specs[name]
+
+    def names(self, capability: Optional[str] = None) -> Tuple[str, ...]:
+        """Canonical names in registration order, optionally only those with a capability"""
+        return tuple(spec.name for spec in self if capability is None or spec.supports(capability))
+
+    def __iter__(self) -> Iterator[AlgorithmSpec]:
+        return iter(list(self._specs.values()))
+
+    def __contains__(self, algorithm: str) -> bool:
+        return self.resolve(algorithm) is not None
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+# Process-wide registry; the built-in algorithms are registered by disk_scheduling
+registry = AlgorithmRegistry()
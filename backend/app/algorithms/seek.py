@@ -0,0 +1,92 @@
+"""
+Seek distance accounting shared by the scheduling algorithms.
+
+Uses NumPy for large sequences when it is installed and falls back to pure
+Python otherwise; both paths produce the same values.
+"""
+
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; everything falls back to pure Python
+    np = None
+
+
+# Below this many moves the NumPy conversion costs more than it saves
+NUMPY_MIN_SIZE = 1024
+
+
+def seek_distances(sequence, initial_position: int):
+    """
+    Compute the absolute distance of every head movement in a sequence
+
+    Args:
+        sequence: Sequence of track accesses
+        initial_position: Head position before the first access
+
+    Returns:
+        NumPy int64 array when NumPy is available and the sequence is large,
+        otherwise a list of ints
+    """
+    if np is not None and len(sequence) >= NUMPY_MIN_SIZE:
+        positions = np.empty(len(sequence) + 1, dtype=np.int64)
+        positions[0] = initial_position
+        positions[1:] = sequence
+        return np.abs(np.diff(positions))
+    return [abs(to - from_pos) for from_pos, to in zip(chain((initial_position,), sequence), sequence)]
+
+
+def seek_statistics(sequence, initial_position: int, distances=None) -> dict:
+    """
+    Summarize the seek distances of a sequence in a single pass
+
+    Args:
+        sequence: Sequence of track accesses
+        initial_position: Head position before the first access
+        distances: seek_distances(sequence, initial_position), when already computed
+
+    Returns:
+        Dictionary with count, total, mean, std (population) and max distance
+    """
+    if distances is None:
+        distances = seek_distances(sequence, initial_position)
+    count = len(distances)
+    if count == 0:
+        return {"count": 0, "total": 0, "mean": 0.0, "std": 0.0, "max": 0}
+
+    if np is not None and isinstance(distances, np.ndarray):
+        total = int(distances.sum())
+        as_float = distances.astype(np.float64)
+        return {
+            "count": count,
+            "total": total,
+            "mean": total / count,
+            "std": float(as_float.std()),
+            "max": int(distances.max()),
+        }
+
+    total = sum(distances)
+    sum_of_squares = sum(d * d for d in distances)
+    # Integer arithmetic keeps the variance exact for integer distances
+    variance = (count * sum_of_squares - total * total) / (count * count)
+    return {
+        "count": count,
+        "total": total,
+        "mean": total / count,
+        "std": max(variance, 0) ** 0.5,
+        "max": max(distances),
+    }
+
+
+def fairness_index(statistics: dict) -> float:
+    """
+    Fairness of a schedule from its seek statistics: 1 - coefficient of
+    variation of the seek distances, clamped to 0-1 (1 = every seek equal)
+    """
+    if not statistics["count"]:
+        return 0.0
+    mean = statistics["mean"]
+    if mean == 0:
+        return 1.0
+    return round(max(0, 1 - (statistics["std"] / mean)), 2)
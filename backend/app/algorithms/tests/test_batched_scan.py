@@ -0,0 +1,71 @@
+import os
+import random
+import unittest
+from array import array
+from unittest import mock
+
+from app.algorithms import DiskScheduler
+
+
+def python_only():
+    return mock.patch.dict(os.environ, {"DISK_SCHEDULER_NATIVE": "0"})
+
+
+def baseline(requests, initial_position, disk_size, n, direction, alternate):
+    """The original batching: a fresh DiskScheduler and SCAN per batch"""
+    sequence, total = [], 0
+    position, going_right = initial_position, direction == "right"
+    for start in range(0, len(requests), n):
+        batch_sequence, seek_time, _ = DiskScheduler(requests[start:start + n], position, disk_size).scan(
+            "right" if going_right else "left")
+        sequence.extend(batch_sequence)
+        total += seek_time
+        if batch_sequence:
+            position = batch_sequence[-1]
+        if alternate:
+            going_right = not going_right
+    return sequence, total
+
+
+class BatchedScanTest(unittest.TestCase):
+    def test_matches_baseline(self):
+        rng = random.Random(15)
+        for _ in range(300):
+            disk_size = rng.choice([2, 20, 200, 10 ** 6])
+            requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 60))]
+            initial_position = rng.randrange(disk_size)
+            direction = rng.choice(["left", "right"])
+            n = rng.randint(1, 12)
+            fscan_n = max((len(requests) + 1) // 2, 1)
+            for algorithm, batch_size, alternate in (("N-STEP SCAN", n, True), ("FSCAN", fscan_n, False)):
+                with self.subTest(algorithm=algorithm, requests=requests, initial_position=initial_position,
+                                  direction=direction, n=n):
+                    expected = baseline(requests, initial_position, disk_size, batch_size, direction, alternate)
+                    with python_only():
+                        result = DiskScheduler(requests, initial_position, disk_size).simulate(algorithm, direction, n)
+                    self.assertEqual((result["sequence"], result["total_seek_time"]), expected)
+
+    def test_edge_stops_index_disk_end_visits(self):
+        with python_only():
+            result = DiskScheduler([10, 5, 30, 20], 15, 100).simulate("N-STEP SCAN", "right", 2)
+        self.assertEqual(result["sequence"], [99, 10, 5, 0, 20, 30])
+        self.assertEqual(result["edge_stops"], [0, 3])
+        self.assertEqual(result["total_requests"], 4)
+
+    def test_buffer_input_and_progress(self):
+        requests = array("q", [98, 183, 37, 122, 14, 124, 65, 67])
+        reports = []
+        scheduler = DiskScheduler(requests, 53, 200)
+        scheduler.progress = lambda done, total: reports.append((done, total))
+        with python_only():
+            result = scheduler.simulate("N-STEP SCAN", "right", 3)
+        self.assertEqual(result["sequence"], baseline(list(requests), 53, 200, 3, "right", True)[0])
+        self.assertEqual(reports[:3], [(1, 3), (2, 3), (3, 3)])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            DiskScheduler([1, 2], 0, 10).n_step_scan(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
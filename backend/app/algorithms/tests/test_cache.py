@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+
+from app.algorithms import cache
+from app.algorithms.cache import ResultCache, fingerprint
+from app.algorithms.seek import np
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+class FingerprintTest(unittest.TestCase):
+    def key(self, algorithm="SSTF", direction="right", n_step=None, requests=REQUESTS, **kwargs):
+        return fingerprint(requests, 53, 200, algorithm, direction, n_step, **kwargs)
+
+    def test_parameters_the_algorithm_ignores_are_dropped(self):
+        self.assertEqual(self.key("FCFS", "left", 9), self.key("FCFS", "right", None))
+        self.assertEqual(self.key("LOOK", "right", 9), self.key("LOOK", "RIGHT", None))
+        self.assertNotEqual(self.key("LOOK", "left"), self.key("LOOK", "right"))
+
+    def test_n_step_is_resolved(self):
+        self.assertEqual(self.key("N-STEP SCAN", n_step=None), self.key("N-STEP SCAN", n_step=4))
+        self.assertEqual(self.key("N-STEP SCAN", n_step=0), self.key("N-STEP SCAN", n_step=4))
+        self.assertNotEqual(self.key("N-STEP SCAN", n_step=3), self.key("N-STEP SCAN", n_step=4))
+
+    def test_aliases_share_a_key(self):
+        self.assertEqual(self.key("cscan"), self.key("C-SCAN"))
+
+    def test_inputs_are_part_of_the_key(self):
+        self.assertNotEqual(self.key(requests=REQUESTS[::-1]), self.key())
+        self.assertNotEqual(fingerprint(REQUESTS, 54, 200, "SSTF"), self.key())
+        self.assertNotEqual(fingerprint(REQUESTS, 53, 201, "SSTF"), self.key())
+        self.assertNotEqual(self.key(cost_model={"rpm": 5400}), self.key())
+        self.assertNotEqual(self.key(latency=True), self.key())
+
+    def test_qos_only_counts_for_deadline_schedulers(self):
+        qos = {"deadlines": [1.0] * len(REQUESTS)}
+        self.assertEqual(self.key("SSTF", qos=qos), self.key("SSTF"))
+        self.assertNotEqual(self.key("EDF", qos=qos), self.key("EDF"))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_buffers_hash_like_lists(self):
+        self.assertEqual(self.key(requests=np.asarray(REQUESTS)), self.key())
+
+
+class ResultCacheTest(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        results = ResultCache(max_entries=2)
+        results.set("a", {"value": 1})
+        results.set("b", {"value": 2})
+        self.assertEqual(results.get("a"), {"value": 1})
+        results.set("c", {"value": 3})
+        self.assertIsNone(results.get("b"))
+        self.assertEqual(results.get("a"), {"value": 1})
+        self.assertEqual(results.get("c"), {"value": 3})
+        self.assertEqual(results.stats()["evictions"], 1)
+
+    def test_entries_expire(self):
+        results = ResultCache(ttl=10)
+        with mock.patch.object(cache.time, "monotonic", return_value=100.0):
+            results.set("a", {"value": 1})
+        with mock.patch.object(cache.time, "monotonic", return_value=105.0):
+            self.assertIsNotNone(results.get("a"))
+        with mock.patch.object(cache.time, "monotonic", return_value=111.0):
+            self.assertIsNone(results.get("a"))
+
+    def test_callers_get_copies(self):
+        results = ResultCache()
+        value = {"value": 1}
+        results.set("a", value)
+        value["value"] = 2
+        results.get("a")["value"] = 3
+        self.assertEqual(results.get("a"), {"value": 1})
+
+    def test_stats(self):
+        results = ResultCache()
+        results.set("a", {})
+        results.get("a")
+        results.get("b")
+        stats = results.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"], stats["hit_rate"]), (1, 1, 1, 0.5))
+        results.clear()
+        self.assertEqual(results.stats()["hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from app.algorithms.__main__ import main, sweep_grid
+from app.algorithms.registry import registry
+
+
+def run_cli(*argv):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        code = main(list(argv))
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class CLITestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.trace = self.write("trace.csv", "lba,time\n98,0\n183,1\n37,2\n122,3\n14,4\n124,5\n65,6\n67,7\n")
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+
+class ReplayTest(CLITestCase):
+    def test_arrival_times_default_to_online_algorithms(self):
+        code, stdout, stderr = run_cli(self.trace, "--time-column", "time", "--arrival-times",
+                                       "--initial-position", "53")
+        self.assertEqual(code, 0, stderr)
+        results = json.loads(stdout)["results"]
+        self.assertEqual([result["algorithm"] for result in results], list(registry.names("online")))
+        self.assertTrue(all("makespan" in result for result in results))
+
+    def test_default_algorithms_leave_out_deadline_schedulers(self):
+        code, stdout, stderr = run_cli(self.trace, "--initial-position", "53")
+        self.assertEqual(code, 0, stderr)
+        algorithms = [result["algorithm"] for result in json.loads(stdout)["results"]]
+        self.assertEqual(algorithms, list(registry.names("compare")))
+        self.assertNotIn("EDF", algorithms)
+
+
+
+class SweepTest(CLITestCase):
+    def test_grid_skips_parameters_an_algorithm_ignores(self):
+        points = sweep_grid(["fcfs", "SCAN", "N-STEP SCAN"], [0, 50], [200], ["left", "right"], [2, 4])
+        self.assertEqual(points[:7], [
+            (0, 200, "FCFS", None, None),
+            (0, 200, "SCAN", "left", None), (0, 200, "SCAN", "right", None),
+            (0, 200, "N-STEP SCAN", "left", 2), (0, 200, "N-STEP SCAN", "left", 4),
+            (0, 200, "N-STEP SCAN", "right", 2), (0, 200, "N-STEP SCAN", "right", 4),
+        ])
+        self.assertEqual(len(points), 14)
+
+    def test_csv_output(self):
+        output = os.path.join(self.directory, "sweep.csv")
+        code, _, stderr = run_cli("sweep", self.trace, "--algorithms", "SSTF,LOOK", "--initial-positions", "53",
+                                  "--disk-sizes", "200", "--workers", "1", "--output", output)
+        self.assertEqual(code, 0, stderr)
+        with open(output) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([(row["algorithm"], row["direction"]) for row in rows],
+                         [("SSTF", ""), ("LOOK", "left"), ("LOOK", "right")])
+        self.assertEqual(rows[0]["total_seek_time"], "236")
+
+    def test_columnar_json_output(self):
+        output = os.path.join(self.directory, "sweep.json")
+        code, _, stderr = run_cli("sweep", self.trace, "--algorithms", "FCFS", "--initial-positions", "0,53",
+                                  "--workers", "1", "--output", output)
+        self.assertEqual(code, 0, stderr)
+        with open(output) as f:
+            document = json.load(f)
+        self.assertEqual(document["rows"], 2)
+        self.assertEqual(document["data"]["initial_position"], [0, 53])
+        self.assertEqual(document["data"]["disk_size"], [184, 184])
+
+    def test_unknown_algorithm(self):
+        code, _, stderr = run_cli("sweep", self.trace, "--algorithms", "NOPE")
+        self.assertEqual(code, 2)
+        self.assertIn("error:", stderr)
+
+if __name__ == "__main__":
+    unittest.main()
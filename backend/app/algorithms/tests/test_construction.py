@@ -0,0 +1,72 @@
+import unittest
+from array import array
+
+from app.algorithms import DiskScheduler
+from app.algorithms.disk_scheduling import pack_requests
+from app.algorithms.seek import np
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+def buffers():
+    """The request containers DiskScheduler accepts without copying"""
+    inputs = [list(REQUESTS), array("l", REQUESTS), array("q", REQUESTS), memoryview(array("q", REQUESTS))]
+    if np is not None:
+        inputs.append(np.array(REQUESTS, dtype=np.int32))
+    return inputs
+
+
+class ConstructionTest(unittest.TestCase):
+    def test_requests_are_not_copied_by_default(self):
+        requests = list(REQUESTS)
+        self.assertIs(DiskScheduler(requests, 53).requests, requests)
+
+    def test_copy_isolates_the_caller(self):
+        for requests in buffers():
+            if isinstance(requests, memoryview):
+                continue
+            with self.subTest(type=type(requests).__name__):
+                scheduler = DiskScheduler(requests, 53, copy=True)
+                self.assertIsNot(scheduler.requests, requests)
+                self.assertIs(type(scheduler.requests), type(requests))
+                requests[0] = 0
+                self.assertEqual(scheduler.simulate("FCFS")["sequence"][0], 98)
+
+    def test_buffer_inputs_match_lists(self):
+        expected = DiskScheduler(REQUESTS, 53).simulate("SSTF")
+        for requests in buffers():
+            with self.subTest(type=type(requests).__name__):
+                result = DiskScheduler(requests, 53).simulate("SSTF")
+                self.assertEqual(result["sequence"], expected["sequence"])
+                self.assertEqual(result["total_seek_time"], 236)
+                self.assertTrue(all(type(track) is int for track in result["sequence"]))
+
+    def test_out_of_bounds_reports_the_first_offender(self):
+        for requests in (REQUESTS + [200, -1], array("q", REQUESTS + [200, -1])):
+            with self.subTest(type=type(requests).__name__):
+                with self.assertRaisesRegex(ValueError, r"Request 200 is out of bounds \(0-199\)"):
+                    DiskScheduler(requests, 53)
+        with self.assertRaisesRegex(ValueError, "Request -1"):
+            DiskScheduler([5, -1], 0, 10)
+
+    def test_empty_requests(self):
+        self.assertEqual(DiskScheduler([], 53).simulate("SCAN")["total_seek_time"], 0)
+        self.assertEqual(DiskScheduler(array("q"), 53).simulate("LOOK")["sequence"], [])
+
+    def test_per_request_fields_are_validated(self):
+        with self.assertRaisesRegex(ValueError, "one entry per request"):
+            DiskScheduler([1, 2], 0, deadlines=[10])
+        with self.assertRaisesRegex(ValueError, "invalid value"):
+            DiskScheduler([1, 2], 0, priorities=[0, "high"])
+
+    def test_pack_requests(self):
+        packed = array("q", REQUESTS)
+        self.assertIs(pack_requests(packed), packed)
+        for requests in buffers():
+            with self.subTest(type=type(requests).__name__):
+                self.assertEqual(pack_requests(requests), packed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.cost_model import CostModel
+from app.algorithms.seek import np, seek_distances
+
+
+class SeekCurveTest(unittest.TestCase):
+    def setUp(self):
+        self.model = CostModel(cylinders=200)
+
+    def test_endpoints(self):
+        self.assertEqual(self.model.seek_time_ms(0), 0.0)
+        self.assertAlmostEqual(self.model.seek_time_ms(1), 1.0)
+        self.assertAlmostEqual(self.model.seek_time_ms(199), 15.0)
+
+    def test_phases_meet_at_the_handover(self):
+        handover = self.model.short_seek_tracks
+        self.assertEqual(handover, 66)
+        self.assertAlmostEqual(self.model.seek_time_ms(handover), 0.5 + 0.5 * handover ** 0.5)
+        self.assertAlmostEqual(self.model.seek_time_ms(handover + 1) - self.model.seek_time_ms(handover),
+                               self.model.seek_time_ms(handover + 2) - self.model.seek_time_ms(handover + 1))
+
+    def test_monotonic(self):
+        times = [self.model.seek_time_ms(d) for d in range(200)]
+        self.assertEqual(times, sorted(times))
+
+    def test_array_and_list_paths_agree(self):
+        if np is None:
+            self.skipTest("NumPy is not installed")
+        sequence = [(i * 7919) % 5000 for i in range(2000)]
+        model = CostModel(cylinders=5000)
+        distances = seek_distances(sequence, 0)
+        times = model.seek_times_ms(sequence, 0, np.asarray(distances))
+        expected = [model.seek_time_ms(int(d)) for d in distances]
+        self.assertEqual(len(times), len(expected))
+        for got, want in zip(times, expected):
+            self.assertAlmostEqual(float(got), want)
+
+
+class ServiceCostTest(unittest.TestCase):
+    def test_rotation_and_transfer(self):
+        model = CostModel(rpm=15000, transfer_rate_mb_s=100, request_size_kb=1024)
+        self.assertAlmostEqual(model.rotational_latency_ms, 2.0)
+        self.assertAlmostEqual(model.transfer_ms, 10.0)
+
+    def test_service_cost(self):
+        cost = CostModel().service_cost([65, 67, 37], 53, 3)
+        self.assertEqual(cost, {
+            "total_ms": 19.256, "seek_ms": 6.678, "rotational_latency_ms": 12.5,
+            "transfer_ms": 0.078, "average_ms": 6.419, "iops": 155.8,
+        })
+
+    def test_no_requests(self):
+        cost = CostModel().service_cost([], 53, 0)
+        self.assertEqual((cost["total_ms"], cost["average_ms"], cost["iops"]), (0, 0, 0))
+
+    def test_scheduler_reports_the_model(self):
+        model = CostModel(cylinders=200, rpm=15000)
+        result = DiskScheduler([98, 183, 37], 53, 200, cost_model=model).simulate("FCFS")
+        self.assertEqual(result["cost"], model.service_cost([98, 183, 37], 53, 3))
+
+
+class ConfigurationTest(unittest.TestCase):
+    def test_round_trip(self):
+        model = CostModel.from_dict({"rpm": 10000, "settle_ms": 0.2}, cylinders=5000)
+        self.assertEqual(model.cylinders, 5000)
+        self.assertEqual(CostModel.from_dict(model.to_dict()).to_dict(), model.to_dict())
+
+    def test_invalid_configuration(self):
+        for config in ({"bogus": 1}, {"cylinders": 0}, {"rpm": 0}, {"settle_ms": 2.0},
+                       {"track_to_track_ms": -1}, {"request_size_kb": -1}):
+            with self.subTest(config=config):
+                with self.assertRaises(ValueError):
+                    CostModel.from_dict(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.cost_model import CostModel
+from app.algorithms.pending import PendingTracks
+
+
+def unit_time_scheduler(requests, initial_position, **qos):
+    """Every request takes exactly 1 ms whatever the seek, so completion times are 1, 2, 3, ..."""
+    model = CostModel(cylinders=100, settle_ms=0, track_to_track_ms=0, full_stroke_ms=0, rpm=30000,
+                      request_size_kb=0)
+    return DiskScheduler(requests, initial_position, 100, cost_model=model, **qos)
+
+
+class EDFTest(unittest.TestCase):
+    def test_deadline_order_and_misses(self):
+        # id1 (d1) at 1 ms, then id0 and id2 tie on d2: arrival order, so id2 finishes at 3 ms
+        sequence, _, _, extra = unit_time_scheduler([50, 10, 90, 30], 0, deadlines=[2, 1, 2, None]).edf()
+        self.assertEqual(sequence, [10, 50, 90, 30])
+        self.assertEqual(extra["deadline_misses"], 1)
+        self.assertEqual(extra["wait_times_ms"]["max"], 4.0)
+
+    def test_priority_class_first(self):
+        scheduler = unit_time_scheduler([50, 10, 90, 30], 0, deadlines=[2, 1, 2, None], priorities=[1, 0, 0, 0])
+        sequence, _, _, extra = scheduler.edf()
+        self.assertEqual(sequence, [10, 90, 30, 50])
+        self.assertEqual(extra["deadline_misses"], 1)
+
+
+class ScanEDFTest(unittest.TestCase):
+    def test_equal_deadlines_in_elevator_order(self):
+        # d3 group {50, 10, 90} from 40 going right: 50, 90, then back to 10;
+        # d4 group {30, 70} continues left from 10: nothing ahead, so 30, 70 (70 done at 5 ms)
+        scheduler = unit_time_scheduler([50, 10, 90, 30, 70], 40, deadlines=[3, 3, 3, 4, 4])
+        sequence, total_seek_time, _, extra = scheduler.scan_edf("right")
+        self.assertEqual(sequence, [50, 90, 10, 30, 70])
+        self.assertEqual(total_seek_time, 10 + 40 + 80 + 20 + 40)
+        self.assertEqual(extra["deadline_misses"], 1)
+
+
+class DeadlineTest(unittest.TestCase):
+    def test_expired_fifo_head_interrupts_sector_order(self):
+        # Batches of 2: [10, 20], [30, 40], then 5 (deadline 3) has expired and
+        # is dispatched before 50, finishing at 5 ms
+        scheduler = unit_time_scheduler([10, 20, 30, 40, 50, 5], 0, deadlines=[1, 6, 6, 6, 6, 3])
+        sequence, _, _, extra = scheduler.deadline(fifo_batch=2)
+        self.assertEqual(sequence, [10, 20, 30, 40, 5, 50])
+        self.assertEqual(extra["deadline_misses"], 1)
+
+    def test_starved_writes_get_a_batch(self):
+        scheduler = unit_time_scheduler([30, 10, 20], 0, writes=[True, False, False])
+        sequence, _, _, extra = scheduler.deadline(fifo_batch=1, writes_starved=1)
+        self.assertEqual(sequence, [10, 30, 20])
+        self.assertEqual(extra["deadline_misses"], 0)
+
+
+class AnticipatoryTest(unittest.TestCase):
+    def test_short_back_seek_is_taken_when_cheaper(self):
+        # back_seek_max is 100 // 8 = 12 tracks, at twice the cost: 46 (2 * 4) beats 60 (10),
+        # then 20 is too far behind and is only reached after 60
+        sequence, _, _, extra = unit_time_scheduler([46, 60, 20], 50).anticipatory()
+        self.assertEqual(sequence, [46, 60, 20])
+        self.assertEqual(extra["deadline_misses"], 0)
+
+    def test_forward_wins_ties(self):
+        sequence, _, _, _ = unit_time_scheduler([45, 60, 20], 50).anticipatory()
+        self.assertEqual(sequence, [60, 45, 20])
+
+    def test_expired_request_jumps_the_queue(self):
+        sequence, _, _, extra = unit_time_scheduler([46, 60, 20], 50, deadlines=[None, None, 0.5]).anticipatory()
+        self.assertEqual(sequence, [46, 20, 60])
+        self.assertEqual(extra["deadline_misses"], 1)
+
+
+class PendingTracksTest(unittest.TestCase):
+    def test_matches_a_list_model(self):
+        rng = random.Random(3)
+        tracks = sorted(rng.sample(range(1000), 40))
+        pending = PendingTracks(tracks)
+        model = {}
+        next_id = 0
+        for _ in range(3000):
+            operation = rng.random()
+            live = [track for track in tracks if model.get(track)]
+            if operation < 0.45 or not live:
+                track = rng.choice(tracks)
+                pending.add(track, next_id)
+                model.setdefault(track, []).append(next_id)
+                next_id += 1
+            elif operation < 0.7:
+                track = rng.choice(live)
+                request_id = rng.choice(model[track])
+                pending.remove(track, request_id)
+                model[track].remove(request_id)
+            else:
+                track = rng.choice(live)
+                self.assertEqual(pending.first_id(track), model[track][0])
+                self.assertEqual(pending.pop(track), model[track].pop(0))
+            live = [track for track in tracks if model.get(track)]
+            self.assertEqual(len(pending), sum(len(ids) for ids in model.values()))
+            position = rng.randrange(1000)
+            self.assertEqual(pending.successor(position), min((t for t in live if t >= position), default=None))
+            self.assertEqual(pending.predecessor(position), max((t for t in live if t <= position), default=None))
+            self.assertTrue(all(pending.has(track) == bool(model.get(track)) for track in tracks))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.seek import NUMPY_MIN_SIZE, np
+
+
+def baseline(algorithm, requests, initial_position, disk_size, direction):
+    """The original SCAN-family orders, each splitting its own sorted copy"""
+    ordered = sorted(requests)
+    if direction == "right":
+        ahead = [r for r in ordered if r >= initial_position]
+        behind = [r for r in ordered if r < initial_position][::-1]
+        edge, far_edge = disk_size - 1, 0
+    else:
+        ahead = [r for r in ordered if r <= initial_position][::-1]
+        behind = [r for r in ordered if r > initial_position]
+        edge, far_edge = 0, disk_size - 1
+    if algorithm == "LOOK":
+        return ahead + behind
+    if algorithm == "C-LOOK":
+        return ahead + behind[::-1]
+    if not behind:
+        return ahead
+    if algorithm == "SCAN":
+        return ahead + [edge] + behind
+    return ahead + [edge, far_edge] + behind[::-1]
+
+
+class ElevatorTest(unittest.TestCase):
+    algorithms = ("SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+    def test_textbook_case(self):
+        scheduler = DiskScheduler([98, 183, 37, 122, 14, 124, 65, 67], 53, 200)
+        self.assertEqual(scheduler.simulate("SCAN", "left")["sequence"], [37, 14, 0, 65, 67, 98, 122, 124, 183])
+        self.assertEqual(scheduler.simulate("C-LOOK", "right")["sequence"], [65, 67, 98, 122, 124, 183, 14, 37])
+
+    def test_matches_baseline(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            disk_size = rng.choice([2, 20, 200, 10 ** 6])
+            requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 40))]
+            # Often start on a requested track, where the split side matters
+            initial_position = rng.choice(requests) if requests and rng.random() < 0.5 else rng.randrange(disk_size)
+            for algorithm in self.algorithms:
+                for direction in ("left", "right"):
+                    with self.subTest(algorithm=algorithm, direction=direction, requests=requests,
+                                      initial_position=initial_position):
+                        result = DiskScheduler(requests, initial_position, disk_size).simulate(algorithm, direction)
+                        self.assertEqual(result["sequence"],
+                                         baseline(algorithm, requests, initial_position, disk_size, direction))
+
+    def test_shared_sort_survives_every_algorithm(self):
+        rng = random.Random(8)
+        requests = [rng.randrange(500) for _ in range(200)]
+        shared = DiskScheduler(requests, 250, 500)
+        for _ in range(2):
+            for algorithm in self.algorithms:
+                for direction in ("left", "right"):
+                    expected = DiskScheduler(requests, 250, 500).simulate(algorithm, direction)
+                    self.assertEqual(shared.simulate(algorithm, direction)["sequence"], expected["sequence"])
+        self.assertEqual(shared.sorted_requests(), sorted(requests))
+        self.assertEqual(shared.requests, requests)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_input_sorts_the_same(self):
+        rng = random.Random(5)
+        requests = [rng.randrange(10000) for _ in range(NUMPY_MIN_SIZE * 2)]
+        for algorithm in self.algorithms:
+            result = DiskScheduler(np.asarray(requests), 5000, 10000).simulate(algorithm)
+            expected = DiskScheduler(requests, 5000, 10000).simulate(algorithm)
+            self.assertEqual(result["sequence"], expected["sequence"])
+            self.assertEqual(result["total_seek_time"], expected["total_seek_time"])
+
+
+if __name__ == "__main__":
+    unittest.main()
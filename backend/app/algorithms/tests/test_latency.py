@@ -0,0 +1,44 @@
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.cost_model import CostModel
+from app.algorithms.optimal import schedule_wait
+
+
+class EdgeStopTest(unittest.TestCase):
+    def test_n_step_turnaround_stops_service_nothing(self):
+        # Batch [60, 40] from 50 going right: 60, stop at 99, 40; batch [99, 10]
+        # going left: 10, stop at 0, then the request at 99
+        result = DiskScheduler([60, 40, 99, 10], 50, 100).simulate("N-STEP SCAN", "right", 2)
+        self.assertEqual(result["sequence"], [60, 99, 40, 10, 0, 99])
+        self.assertEqual(result["edge_stops"], [1, 4])
+        # Travelled when each request is serviced: 10, 108, 138, 247
+        self.assertEqual(schedule_wait(result["sequence"], 50, result["edge_stops"]), 503)
+
+    def test_c_scan_reports_both_stops(self):
+        result = DiskScheduler([10, 80, 0], 50, 100).simulate("C-SCAN", "right")
+        self.assertEqual(result["sequence"], [80, 99, 0, 0, 10])
+        self.assertEqual(result["edge_stops"], [1, 2])
+
+    def test_latency_counts_every_request_once(self):
+        model = CostModel(cylinders=100, settle_ms=0, track_to_track_ms=0, full_stroke_ms=0, rpm=30000,
+                          request_size_kb=0)
+        requests = [99, 0, 99, 50, 0, 20, 99, 70]
+        for algorithm in ("SCAN", "C-SCAN", "N-STEP SCAN", "FSCAN", "LOOK"):
+            for direction in ("left", "right"):
+                with self.subTest(algorithm=algorithm, direction=direction):
+                    result = DiskScheduler(requests, 40, 100, cost_model=model).simulate(
+                        algorithm, direction, 3, latency=True
+                    )
+                    latency = result["latency"]
+                    self.assertEqual(latency["count"], len(requests))
+                    # 1 ms per serviced request: waits are exactly 1..n
+                    self.assertEqual(latency["wait_ms"]["max"], len(requests))
+                    self.assertEqual(latency["wait_ms"]["mean"], (len(requests) + 1) / 2)
+
+    def test_latency_is_opt_in(self):
+        self.assertNotIn("latency", DiskScheduler([10, 20], 0, 100).simulate("SCAN"))
+
+
+if __name__ == "__main__":
+    unittest.main()
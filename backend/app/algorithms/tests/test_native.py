@@ -0,0 +1,74 @@
+import os
+import random
+import unittest
+from unittest import mock
+
+from app.algorithms import DiskScheduler, native
+from app.algorithms.seek import np
+
+
+def python_only():
+    return mock.patch.dict(os.environ, {"DISK_SCHEDULER_NATIVE": "0"})
+
+
+@unittest.skipUnless(native.available(), "native kernels are not built (python -m app.algorithms._native_build)")
+class NativeKernelTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(25)
+
+    def workload(self):
+        disk_size = self.rng.choice([2, 16, 1000, 10 ** 6])
+        count = self.rng.choice([native.NATIVE_MIN_SIZE, 100, 1000, 5000])
+        requests = [self.rng.randrange(disk_size) for _ in range(count)]
+        return requests, self.rng.randrange(disk_size), disk_size
+
+    def test_sstf_matches_python(self):
+        for _ in range(40):
+            requests, initial_position, disk_size = self.workload()
+            with self.subTest(count=len(requests), disk_size=disk_size):
+                result = DiskScheduler(requests, initial_position, disk_size).simulate("SSTF")
+                with python_only():
+                    expected = DiskScheduler(requests, initial_position, disk_size).simulate("SSTF")
+                self.assertEqual(result["sequence"], expected["sequence"])
+                self.assertEqual(result["total_seek_time"], expected["total_seek_time"])
+
+    def test_batched_scan_matches_python(self):
+        for _ in range(40):
+            requests, initial_position, disk_size = self.workload()
+            algorithm = self.rng.choice(["N-STEP SCAN", "FSCAN"])
+            direction = self.rng.choice(["left", "right"])
+            n_step = self.rng.randint(1, 64)
+            with self.subTest(algorithm=algorithm, direction=direction, n_step=n_step, disk_size=disk_size):
+                result = DiskScheduler(requests, initial_position, disk_size).simulate(algorithm, direction, n_step)
+                with python_only():
+                    expected = DiskScheduler(requests, initial_position, disk_size).simulate(
+                        algorithm, direction, n_step
+                    )
+                for field in ("sequence", "total_seek_time", "edge_stops"):
+                    self.assertEqual(result[field], expected[field])
+
+    def test_float_tracks_fall_back_to_python(self):
+        requests = [self.rng.randrange(1000) + 0.5 for _ in range(200)]
+        self.assertIsNone(native.sstf(requests, 10))
+        if np is not None:
+            self.assertIsNone(native.sstf(np.asarray(requests), 10))
+        for algorithm in ("FCFS", "SSTF", "N-STEP SCAN", "FSCAN"):
+            with self.subTest(algorithm=algorithm):
+                result = DiskScheduler(requests, 10, 1000).simulate(algorithm, "right", 8)
+                with python_only():
+                    expected = DiskScheduler(requests, 10, 1000).simulate(algorithm, "right", 8)
+                self.assertEqual(result["sequence"], expected["sequence"])
+                self.assertEqual(result["total_seek_time"], expected["total_seek_time"])
+
+    def test_progress_is_reported(self):
+        for algorithm in ("SSTF", "N-STEP SCAN"):
+            with self.subTest(algorithm=algorithm):
+                calls = []
+                DiskScheduler(list(range(500)), 0, 1000, progress=lambda done, total: calls.append((done, total))) \
+                    .simulate(algorithm, "right", 10)
+                self.assertEqual(calls[0][0], 0)
+                self.assertEqual(calls[-1][0], calls[-1][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.online import OnlineScheduler
+from app.algorithms.registry import registry
+
+
+class StaticParityTest(unittest.TestCase):
+    def test_all_arrivals_at_zero_match_disk_scheduler(self):
+        rng = random.Random(9)
+        for _ in range(300):
+            disk_size = rng.choice([2, 10, 200, 5000])
+            requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 60))]
+            initial_position = rng.randrange(disk_size)
+            direction = rng.choice(["left", "right"])
+            n_step = rng.randint(1, 10)
+            online = OnlineScheduler(requests, [0] * len(requests), initial_position, disk_size)
+            static = DiskScheduler(requests, initial_position, disk_size)
+            for algorithm in registry.names("online"):
+                with self.subTest(algorithm=algorithm, requests=requests, initial_position=initial_position,
+                                  direction=direction, n_step=n_step):
+                    expected = static.simulate(algorithm, direction, n_step)
+                    result = online.simulate(algorithm, direction, n_step)
+                    self.assertEqual(result["sequence"], expected["sequence"])
+                    self.assertEqual(result["total_seek_time"], expected["total_seek_time"])
+
+
+class ArrivalTest(unittest.TestCase):
+    def test_requests_are_invisible_until_they_arrive(self):
+        # 50 arrives at t=5, after SSTF has committed to 10
+        result = OnlineScheduler([10, 90, 50], [0, 0, 5], 0, 100).simulate("SSTF")
+        self.assertEqual(result["sequence"], [10, 50, 90])
+        self.assertEqual(result["completion_times"], [10.0, 90.0, 50.0])
+        self.assertEqual(result["wait_times"], [10.0, 90.0, 45.0])
+        self.assertEqual(result["makespan"], 90.0)
+
+    def test_idle_head_waits_for_the_next_arrival(self):
+        result = OnlineScheduler([10, 90], [0, 100], 0, 100).simulate("FCFS")
+        self.assertEqual(result["completion_times"], [10.0, 180.0])
+        self.assertEqual(result["max_wait_time"], 80.0)
+
+    def test_fscan_freezes_later_arrivals_into_the_next_queue(self):
+        # The t=0 backlog is split into [10, 20] and [30]; 80 joins the second queue
+        result = OnlineScheduler([10, 20, 30, 80], [0, 0, 0, 15], 50, 100).simulate("FSCAN")
+        self.assertEqual(result["sequence"], [99, 20, 10, 30, 80])
+
+    def test_time_per_track_scales_the_clock(self):
+        result = OnlineScheduler([10, 30], [0, 0], 0, 100, time_per_track=0.5).simulate("FCFS")
+        self.assertEqual(result["completion_times"], [5.0, 15.0])
+
+    def test_deadline_schedulers_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "does not support arrival times"):
+            OnlineScheduler([10], [0], 0, 100).simulate("EDF")
+
+    def test_arrival_times_must_match_requests(self):
+        with self.assertRaises(ValueError):
+            OnlineScheduler([10, 20], [0], 0, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import unittest
+from itertools import permutations
+from unittest import mock
+
+from app.algorithms import optimal
+from app.algorithms.optimal import minimum_travel, optimal_bounds, optimal_wait_order, schedule_wait, wait_lower_bound
+
+
+def brute_force_wait(requests, initial_position):
+    """Minimum total wait over every service order of the requests"""
+    best = None
+    for order in permutations(requests):
+        position, travelled, total = initial_position, 0, 0
+        for track in order:
+            travelled += abs(track - position)
+            position = track
+            total += travelled
+        best = total if best is None else min(best, total)
+    return best
+
+
+class OptimalWaitTest(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(24)
+        for _ in range(150):
+            requests = [rng.randrange(rng.choice([5, 30, 200])) for _ in range(rng.randint(1, 8))]
+            initial_position = rng.randrange(200)
+            with self.subTest(requests=requests, initial_position=initial_position):
+                sequence, total_wait = optimal_wait_order(requests, initial_position)
+                self.assertEqual(total_wait, brute_force_wait(requests, initial_position))
+                self.assertEqual(sorted(sequence), sorted(requests))
+                self.assertEqual(schedule_wait(sequence, initial_position), total_wait)
+
+    def test_requests_at_the_start_wait_nothing(self):
+        self.assertEqual(optimal_wait_order([50, 50], 50), ([50, 50], 0))
+
+    def test_track_limit(self):
+        with self.assertRaises(ValueError):
+            optimal_wait_order(list(range(10)), 0, max_tracks=5)
+
+    def test_bounds_without_choice_tables(self):
+        rng = random.Random(6)
+        for count in (1, 10, 100, 300):
+            requests = [rng.randrange(1000) for _ in range(count)]
+            bounds = optimal_bounds(requests, 500)
+            self.assertEqual(bounds["total_wait"], optimal_wait_order(requests, 500)[1])
+            self.assertEqual(bounds["wait_bound"], "exact")
+
+    def test_bounds_above_the_track_limit(self):
+        requests = list(range(0, 1000, 10))
+        bounds = optimal_bounds(requests, 500, max_tracks=50)
+        self.assertEqual(bounds["wait_bound"], "lower_bound")
+        self.assertEqual(bounds["total_wait"], wait_lower_bound(requests, 500))
+        self.assertLessEqual(bounds["total_wait"], optimal_wait_order(requests, 500)[1])
+
+    @unittest.skipIf(optimal.np is None, "NumPy is not installed")
+    def test_numpy_table_matches_python(self):
+        rng = random.Random(5)
+        requests = [rng.randrange(100000) for _ in range(300)]
+        numpy_result = optimal_wait_order(requests, 50000)
+        with mock.patch.object(optimal, "np", None):
+            self.assertEqual(optimal_wait_order(requests, 50000), numpy_result)
+
+
+class MinimumTravelTest(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(8)
+        for _ in range(100):
+            requests = [rng.randrange(100) for _ in range(rng.randint(1, 7))]
+            initial_position = rng.randrange(100)
+            best = min(
+                sum(abs(b - a) for a, b in zip((initial_position,) + order, order))
+                for order in permutations(requests)
+            )
+            self.assertEqual(minimum_travel(requests, initial_position)[0], best)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import random
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.optimize import BatchScanKernel, default_n_steps, optimize, pareto_front
+
+
+def key(candidate: dict) -> tuple:
+    return (candidate["algorithm"], candidate["direction"], candidate["n_step"],
+            candidate["total_seek_time"], candidate["max_seek_distance"])
+
+
+def exhaustive(requests, initial_position, disk_size, n_steps):
+    """Every candidate simulated one by one through DiskScheduler"""
+    scheduler = DiskScheduler(requests, initial_position, disk_size)
+    runs = [("FCFS", None, None), ("SSTF", None, None)]
+    for direction in ("left", "right"):
+        runs.extend((algorithm, direction, None) for algorithm in ("SCAN", "C-SCAN", "LOOK", "C-LOOK", "FSCAN"))
+        runs.extend(("N-STEP SCAN", direction, n) for n in n_steps)
+    candidates = []
+    for algorithm, direction, n_step in runs:
+        statistics = scheduler.simulate(algorithm, direction or "right", n_step or 4)["seek_statistics"]
+        candidates.append({"algorithm": algorithm, "direction": direction, "n_step": n_step,
+                           "total_seek_time": statistics["total"], "max_seek_distance": statistics["max"],
+                           "fairness_index": 0})
+    return candidates
+
+
+class OptimizeTest(unittest.TestCase):
+    def test_pareto_front_matches_exhaustive_search(self):
+        rng = random.Random(14)
+        for _ in range(40):
+            disk_size = rng.choice([50, 200, 5000])
+            requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 40))]
+            initial_position = rng.randrange(disk_size)
+            n_steps = [1, 2, 3, 5, 8, 64]
+            result = optimize(requests, initial_position, disk_size, n_steps=n_steps)
+            expected = pareto_front(exhaustive(requests, initial_position, disk_size,
+                                               sorted({min(n, len(requests)) for n in n_steps})))
+            with self.subTest(requests=requests, initial_position=initial_position):
+                self.assertEqual({key(c) for c in result["pareto_front"]}, {key(c) for c in expected})
+                self.assertEqual(result["best"]["total_seek_time"], expected[0]["total_seek_time"])
+
+    def test_evaluated_candidates_match_simulate(self):
+        requests = [98, 183, 37, 122, 14, 124, 65, 67]
+        result = optimize(requests, 53, objective="fairness")
+        self.assertEqual(result["search"]["pruned"], 0)
+        scheduler = DiskScheduler(requests, 53, 200)
+        for candidate in result["candidates"]:
+            with self.subTest(candidate=candidate):
+                simulated = scheduler.simulate(candidate["algorithm"], candidate["direction"] or "right",
+                                               candidate["n_step"] or 4)
+                self.assertEqual(candidate["total_seek_time"], simulated["total_seek_time"])
+                self.assertEqual(candidate["max_seek_distance"], simulated["seek_statistics"]["max"])
+
+    def test_dominated_candidates_are_pruned(self):
+        rng = random.Random(0)
+        requests = [rng.randrange(10000) for _ in range(2000)]
+        result = optimize(requests, 5000, 10000)
+        self.assertGreater(result["search"]["pruned"], 0)
+        self.assertGreater(result["search"]["batch_cache_hits"], 0)
+
+    def test_invalid_search(self):
+        for kwargs in ({"objective": "latency"}, {"directions": ["up"]}, {"directions": []},
+                       {"n_steps": [0]}, {"algorithms": ["NOPE"]}):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    optimize([1, 2, 3], 0, **kwargs)
+
+
+class BatchScanKernelTest(unittest.TestCase):
+    def test_matches_n_step_scan(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            disk_size = rng.choice([2, 100, 1000])
+            requests = [rng.randrange(disk_size) for _ in range(rng.randint(1, 50))]
+            initial_position = rng.randrange(disk_size)
+            n = rng.randint(1, 12)
+            direction = rng.choice(["left", "right"])
+            expected = DiskScheduler(requests, initial_position, disk_size).simulate("N-STEP SCAN", direction, n)
+            statistics = BatchScanKernel(requests, initial_position, disk_size).evaluate(
+                n, direction == "right", alternate=True)
+            with self.subTest(requests=requests, initial_position=initial_position, n=n, direction=direction):
+                self.assertEqual(statistics["total"], expected["total_seek_time"])
+                self.assertEqual(statistics["max"], expected["seek_statistics"]["max"])
+                self.assertEqual(statistics["count"], expected["seek_statistics"]["count"])
+
+    def test_default_n_steps(self):
+        self.assertEqual(default_n_steps(5), [1, 2, 3, 4, 5])
+        self.assertEqual(default_n_steps(100)[-4:], [16, 32, 64, 100])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import random
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+
+from app.algorithms import DiskScheduler, parallel
+from app.algorithms.cost_model import CostModel
+from app.algorithms.parallel import SWEEP_COLUMNS, shutdown_executor, simulate_disks, simulate_many, sweep
+
+
+def summary(result: dict) -> tuple:
+    return result["sequence"], result["total_seek_time"], result["seek_statistics"], result["cost"]
+
+
+class ProcessPoolTestCase(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def setUp(self):
+        rng = random.Random(6)
+        self.requests = [rng.randrange(1000) for _ in range(500)]
+
+    def shared_blocks(self):
+        """Record the shared memory blocks created while the test runs"""
+        names = []
+        share = parallel._share_requests
+
+        def record(packed):
+            shm = share(packed)
+            names.append(shm.name)
+            return shm
+
+        patcher = mock.patch.object(parallel, "_share_requests", record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return names
+
+    def assertUnlinked(self, names):
+        self.assertTrue(names)
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name=name)
+
+
+class SimulateManyTest(ProcessPoolTestCase):
+    def test_matches_serial_runs(self):
+        names = self.shared_blocks()
+        runs = [("FCFS", "right", None), ("SSTF", "right", None), ("SCAN", "left", None),
+                ("N-STEP SCAN", "right", 7), ("FSCAN", "left", None)]
+        model = CostModel(cylinders=1000, rpm=5400)
+        results = simulate_many(self.requests, 400, 1000, runs, max_workers=2, cost_model=model, latency=True)
+        for (algorithm, direction, n_step), result in zip(runs, results):
+            expected = DiskScheduler(self.requests, 400, 1000, cost_model=model).simulate(
+                algorithm, direction, n_step, latency=True)
+            self.assertEqual(summary(result), summary(expected))
+            self.assertEqual(result["latency"], expected["latency"])
+        self.assertUnlinked(names)
+
+    def test_failed_runs_are_returned_in_place(self):
+        results = simulate_many(self.requests, 400, 1000, [("SSTF", "right", None), ("NOPE", "right", None)],
+                                max_workers=2)
+        self.assertEqual(results[0]["algorithm"], "SSTF")
+        self.assertIsInstance(results[1], ValueError)
+
+    def test_qos_is_sent_to_every_run(self):
+        deadlines = [float(i) for i in range(len(self.requests))]
+        results = simulate_many(self.requests, 400, 1000, [("EDF", "right", None)], max_workers=2,
+                                qos={"deadlines": deadlines})
+        expected = DiskScheduler(self.requests, 400, 1000, deadlines=deadlines).simulate("EDF")
+        self.assertEqual(results[0]["deadline_misses"], expected["deadline_misses"])
+
+
+class SimulateDisksTest(ProcessPoolTestCase):
+    def test_matches_serial_runs(self):
+        names = self.shared_blocks()
+        workloads = [(self.requests[:200], 0), (self.requests[200:], 999), ([], 10)]
+        results = simulate_disks(workloads, 1000, "LOOK", max_workers=2)
+        for (requests, initial_position), result in zip(workloads, results):
+            expected = DiskScheduler(requests, initial_position, 1000).simulate("LOOK")
+            self.assertEqual(summary(result), summary(expected))
+        self.assertUnlinked(names)
+
+    def test_invalid_workload_raises(self):
+        with self.assertRaises(ValueError):
+            simulate_disks([(self.requests, 0), ([5000], 0)], 1000, "LOOK", max_workers=2)
+
+
+
+class SweepTest(ProcessPoolTestCase):
+    def points(self):
+        points = [(position, 1000, algorithm, direction, 4)
+                  for position in (0, 500, 999)
+                  for algorithm in ("SSTF", "LOOK", "N-STEP SCAN")
+                  for direction in ("left", "right")]
+        return points[::-1]  # not grouped by position: rows must still come back in this order
+
+    def test_matches_in_process_run(self):
+        names = self.shared_blocks()
+        points = self.points()
+        rows = sweep(self.requests, points, max_workers=2, chunks_per_worker=2)
+        self.assertEqual(rows, sweep(self.requests, points, max_workers=1))
+        self.assertEqual([tuple(row[c] for c in SWEEP_COLUMNS[:5]) for row in rows], points)
+        for row, point in zip(rows, points):
+            result = DiskScheduler(self.requests, point[0], 1000).simulate(point[2], point[3], point[4])
+            self.assertEqual(row["total_seek_time"], result["total_seek_time"])
+            self.assertIsNone(row["error"])
+        self.assertUnlinked(names)
+
+    def test_failed_points_are_reported_in_place(self):
+        points = [(0, 1000, "SSTF", None, None), (0, 1000, "NOPE", None, None), (0, 100, "SSTF", None, None)]
+        rows = sweep(self.requests, points, max_workers=2)
+        self.assertIsNone(rows[0]["error"])
+        self.assertIsNotNone(rows[1]["error"])
+        self.assertIsNotNone(rows[2]["error"])
+        self.assertIsNone(rows[2]["total_seek_time"])
+        self.assertEqual(rows[1]["algorithm"], "NOPE")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.parallel import shutdown_executor
+from app.algorithms.raid import DiskArray, normalize_layout
+from app.algorithms.seek import NUMPY_MIN_SIZE, np
+
+
+class LayoutTest(unittest.TestCase):
+    def test_normalize_layout(self):
+        for name in ("raid0", "RAID-1", "raid 1+0"):
+            with self.subTest(name=name):
+                self.assertIn(normalize_layout(name), ("RAID0", "RAID1", "RAID10"))
+        with self.assertRaisesRegex(ValueError, "Unknown layout"):
+            normalize_layout("RAID5")
+
+    def test_geometry(self):
+        self.assertEqual(DiskArray(4, 100, 8, "RAID0").capacity, 4 * 96)
+        self.assertEqual(DiskArray(3, 100, 1, "RAID1").capacity, 100)
+        self.assertEqual(DiskArray(4, 100, 10, "RAID10").capacity, 200)
+        for disks, stripe_size, layout in ((0, 1, "RAID0"), (1, 1, "RAID1"), (6 - 1, 1, "RAID10"),
+                                           (2, 1, "RAID10"), (2, 0, "RAID0"), (2, 101, "RAID0")):
+            with self.subTest(disks=disks, stripe_size=stripe_size, layout=layout):
+                with self.assertRaises(ValueError):
+                    DiskArray(disks, 100, stripe_size, layout)
+
+    def test_locate(self):
+        array = DiskArray(3, 100, 4, "RAID0")
+        self.assertEqual([array.locate(block) for block in (0, 3, 4, 11, 12, 13)],
+                         [(0, 0), (0, 3), (1, 0), (2, 3), (0, 4), (0, 5)])
+
+
+class MappingTest(unittest.TestCase):
+    def test_raid0_stripes(self):
+        per_disk = DiskArray(2, 100, 2, "RAID0").map_requests([0, 1, 2, 3, 4, 5])
+        self.assertEqual([list(disk) for disk in per_disk], [[0, 1, 2, 3], [0, 1]])
+
+    def test_raid1_reads_round_robin_and_writes_mirror(self):
+        array = DiskArray(2, 100, 1, "RAID1")
+        self.assertEqual([list(disk) for disk in array.map_requests([5, 6, 7])], [[5, 7], [6]])
+        self.assertEqual([list(disk) for disk in array.map_requests([5, 6, 7], "write")], [[5, 6, 7], [5, 6, 7]])
+
+    def test_raid10(self):
+        array = DiskArray(4, 100, 1, "RAID10")
+        reads = [list(disk) for disk in array.map_requests([0, 1, 2, 3])]
+        # Each group alternates its own mirrors, whatever the other groups read
+        self.assertEqual(reads, [[0], [1], [0], [1]])
+        writes = [list(disk) for disk in array.map_requests([0, 1, 2], "write")]
+        self.assertEqual(writes, [[0, 1], [0, 1], [0], [0]])
+
+    def test_numpy_mapping_matches_python(self):
+        if np is None:
+            self.skipTest("NumPy is not installed")
+        rng = random.Random(20)
+        for layout, disks in (("RAID0", 3), ("RAID1", 2), ("RAID10", 4)):
+            array = DiskArray(disks, 1000, 7, layout)
+            requests = [rng.randrange(array.capacity) for _ in range(NUMPY_MIN_SIZE + 5)]
+            for operation in ("read", "write"):
+                with self.subTest(layout=layout, operation=operation):
+                    expected = [[] for _ in range(disks)]
+                    copies = array.copies
+                    reads = [0] * array.groups
+                    for block in requests:
+                        group, track = array.locate(block)
+                        targets = range(copies) if operation == "write" else [reads[group] % copies]
+                        reads[group] += 1
+                        for mirror in targets:
+                            expected[group * copies + mirror].append(track)
+                    self.assertEqual([list(d) for d in array.map_requests(requests, operation)], expected)
+
+    def test_invalid_requests(self):
+        array = DiskArray(2, 100, 1, "RAID0")
+        with self.assertRaisesRegex(ValueError, "Block 200 is out of range"):
+            array.map_requests([1, 200])
+        with self.assertRaisesRegex(ValueError, "Unknown operation"):
+            array.map_requests([1], "trim")
+
+
+class SimulateTest(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def test_disks_match_single_disk_runs(self):
+        rng = random.Random(2)
+        array = DiskArray(4, 200, 4, "RAID10")
+        requests = [rng.randrange(array.capacity) for _ in range(300)]
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                result = array.simulate(requests, [0, 50, 100, 150], "LOOK", max_workers=max_workers)
+                per_disk = array.map_requests(requests)
+                for disk in result["disks"]:
+                    expected = DiskScheduler(per_disk[disk["disk"]], [0, 50, 100, 150][disk["disk"]], 200
+                                             ).simulate("LOOK")
+                    self.assertEqual(disk["total_seek_time"], expected["total_seek_time"])
+                    self.assertEqual(disk["group"], disk["disk"] // 2)
+                self.assertEqual(result["total_seek_time"], sum(d["total_seek_time"] for d in result["disks"]))
+                self.assertEqual(result["makespan_ms"], max(d["cost"]["total_ms"] for d in result["disks"]))
+
+    def test_even_load_has_no_imbalance(self):
+        result = DiskArray(2, 100, 1, "RAID1").simulate([10, 10], 0, "FCFS", max_workers=1)
+        self.assertEqual((result["load_imbalance"], result["request_imbalance"]), (1.0, 1.0))
+        result = DiskArray(2, 100, 1, "RAID0").simulate([0, 2, 4, 1], 0, "FCFS", max_workers=1)
+        self.assertEqual(result["request_imbalance"], 1.5)
+
+    def test_initial_positions_must_match_disks(self):
+        with self.assertRaisesRegex(ValueError, "list of 2 positions"):
+            DiskArray(2, 100).simulate([1], [0, 0, 0], "FCFS")
+
+
+if __name__ == "__main__":
+    unittest.main()
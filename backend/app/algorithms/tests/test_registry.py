@@ -0,0 +1,92 @@
+import unittest
+from unittest import mock
+
+from app.algorithms import DiskScheduler
+from app.algorithms.registry import AlgorithmRegistry, AlgorithmSpec, registry
+
+
+def reverse(scheduler, direction, n_step):
+    sequence = sorted(scheduler.request_list(), reverse=True)
+    total_seek_time, seek_operations = scheduler.calculate_seek_time(sequence)
+    return sequence, total_seek_time, seek_operations
+
+
+def scratch_registry():
+    """Let a test register algorithms on the global registry and drop them afterwards"""
+    return mock.patch.multiple(registry, _specs=dict(registry._specs), _lookup=dict(registry._lookup))
+
+
+class AlgorithmSpecTest(unittest.TestCase):
+    def test_normalizes_names(self):
+        spec = AlgorithmSpec(" rev ", reverse, aliases=("reverse", "Backwards"), parameters=("direction",))
+        self.assertEqual((spec.name, spec.full_name, spec.aliases), ("REV", "REV", ("REVERSE", "BACKWARDS")))
+        self.assertTrue(spec.uses_direction)
+
+    def test_rejects_unknown_parameters_and_capabilities(self):
+        with self.assertRaisesRegex(ValueError, "Unknown parameter"):
+            AlgorithmSpec("REV", reverse, parameters=("speed",))
+        with self.assertRaisesRegex(ValueError, "Unknown capabilities"):
+            AlgorithmSpec("REV", reverse, capabilities=("gpu",))
+
+    def test_engines(self):
+        spec = AlgorithmSpec("REV", reverse)
+        self.assertIs(spec.engine(), reverse)
+        with self.assertRaisesRegex(ValueError, "no 'native' engine"):
+            spec.engine("native")
+
+
+class AlgorithmRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = AlgorithmRegistry()
+        self.registry.register(AlgorithmSpec("REV", reverse, aliases=("REVERSE",), capabilities=("compare",)))
+        self.registry.register(AlgorithmSpec("SLOW", reverse))
+
+    def test_lookup(self):
+        self.assertEqual(self.registry.get(" reverse ").name, "REV")
+        self.assertIn("rev", self.registry)
+        self.assertNotIn("nope", self.registry)
+        self.assertEqual(self.registry.names(), ("REV", "SLOW"))
+        self.assertEqual(self.registry.names("compare"), ("REV",))
+        with self.assertRaisesRegex(ValueError, "Unknown algorithm 'nope'. Available: REV, SLOW"):
+            self.registry.get("nope")
+
+    def test_names_and_aliases_are_unique(self):
+        with self.assertRaisesRegex(ValueError, "already registered: REVERSE"):
+            self.registry.register(AlgorithmSpec("OTHER", reverse, aliases=("reverse",)))
+
+    def test_replace_drops_old_aliases(self):
+        self.registry.register(AlgorithmSpec("REV", reverse, aliases=("BACKWARDS",)), replace=True)
+        self.assertNotIn("REVERSE", self.registry)
+        self.assertEqual(self.registry.get("backwards").name, "REV")
+        self.assertEqual(len(self.registry), 2)
+
+    def test_register_engine(self):
+        self.registry.register_engine("reverse", "fast", reverse)
+        self.assertEqual(self.registry.get("REV").describe()["engines"], ["python", "fast"])
+
+
+class BuiltinRegistryTest(unittest.TestCase):
+    def test_builtin_algorithms(self):
+        self.assertEqual(registry.names("compare")[:2], ("FCFS", "SSTF"))
+        self.assertEqual(registry.get("nstep scan").name, "N-STEP SCAN")
+        self.assertTrue(registry.get("N-STEP SCAN").describe()["requires_n_step"])
+        self.assertFalse(set(registry.names("deadlines")) & set(registry.names("compare")))
+
+    def test_registered_algorithm_runs_through_simulate(self):
+        with scratch_registry():
+            registry.register(AlgorithmSpec("REV", reverse, aliases=("REVERSE",)))
+            registry.register_engine("REV", "alternate", lambda scheduler, direction, n_step: (
+                *reverse(scheduler, direction, n_step), {"engine_used": "alternate"}))
+            scheduler = DiskScheduler([98, 183, 37], 53, 200)
+            result = scheduler.simulate("reverse")
+            self.assertEqual((result["algorithm"], result["sequence"]), ("REV", [183, 98, 37]))
+            self.assertEqual(scheduler.simulate("REV", engine="alternate")["engine_used"], "alternate")
+        self.assertNotIn("REV", registry)
+
+    def test_unknown_algorithm(self):
+        with self.assertRaisesRegex(ValueError, "Unknown algorithm"):
+            DiskScheduler([1], 0).simulate("NOPE")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import random
+import statistics
+import unittest
+from unittest import mock
+
+from app.algorithms import DiskScheduler, disk_scheduling, seek
+from app.algorithms.seek import NUMPY_MIN_SIZE, fairness_index, seek_distances, seek_statistics
+
+
+class SeekStatisticsTest(unittest.TestCase):
+    def test_textbook_sequence(self):
+        sequence = [98, 183, 37, 122, 14, 124, 65, 67]
+        self.assertEqual(seek_distances(sequence, 53), [45, 85, 146, 85, 108, 110, 59, 2])
+        result = seek_statistics(sequence, 53)
+        self.assertEqual((result["count"], result["total"], result["max"]), (8, 640, 146))
+        self.assertEqual(result["mean"], 80.0)
+        self.assertAlmostEqual(result["std"], statistics.pstdev([45, 85, 146, 85, 108, 110, 59, 2]))
+
+    def test_empty_sequence(self):
+        self.assertEqual(seek_statistics([], 10), {"count": 0, "total": 0, "mean": 0.0, "std": 0.0, "max": 0})
+        self.assertEqual(fairness_index(seek_statistics([], 10)), 0.0)
+
+    def test_fairness_index(self):
+        self.assertEqual(fairness_index(seek_statistics([10, 20, 30], 0)), 1.0)
+        self.assertEqual(fairness_index(seek_statistics([5, 5], 5)), 1.0)
+        # Distances 0, 100, 100, 100: mean 75, std 43.3
+        self.assertEqual(fairness_index(seek_statistics([0, 100, 0, 100], 0)), 0.42)
+        # std above the mean clamps to 0
+        self.assertEqual(fairness_index(seek_statistics([0] * 20 + [1000], 0)), 0.0)
+
+    @unittest.skipIf(seek.np is None, "NumPy is not installed")
+    def test_numpy_path_matches_python(self):
+        rng = random.Random(2)
+        for count in (NUMPY_MIN_SIZE - 1, NUMPY_MIN_SIZE, 5000):
+            sequence = [rng.randrange(10 ** 6) for _ in range(count)]
+            result = seek_statistics(sequence, 500)
+            distances = seek_distances(sequence, 500)
+            with mock.patch.object(seek, "np", None):
+                expected = seek_statistics(sequence, 500)
+                self.assertEqual(list(distances), seek_distances(sequence, 500))
+            for key in ("count", "total", "max"):
+                self.assertEqual(result[key], expected[key])
+                self.assertIs(type(result[key]), int)
+            self.assertAlmostEqual(result["mean"], expected["mean"])
+            self.assertAlmostEqual(result["std"], expected["std"], places=6)
+
+    @unittest.skipIf(seek.np is None, "NumPy is not installed")
+    def test_simulate_reports_the_same_statistics_without_numpy(self):
+        rng = random.Random(4)
+        requests = [rng.randrange(5000) for _ in range(3000)]
+        with mock.patch.dict(os.environ, {"DISK_SCHEDULER_NATIVE": "0"}):
+            for algorithm in ("FCFS", "SSTF", "SCAN", "C-LOOK"):
+                with self.subTest(algorithm=algorithm):
+                    result = DiskScheduler(requests, 2500, 5000).simulate(algorithm)
+                    with mock.patch.object(seek, "np", None), mock.patch.object(disk_scheduling, "np", None):
+                        expected = DiskScheduler(requests, 2500, 5000).simulate(algorithm)
+                    self.assertEqual(result["sequence"], expected["sequence"])
+                    self.assertEqual(result["total_seek_time"], expected["total_seek_time"])
+                    self.assertEqual(result["seek_statistics"]["max"], expected["seek_statistics"]["max"])
+                    self.assertAlmostEqual(result["seek_statistics"]["std"], expected["seek_statistics"]["std"],
+                                           places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from app.algorithms import DiskScheduler
+from app.algorithms.disk_scheduling import SeekOperations
+
+
+class SeekOperationsTest(unittest.TestCase):
+    def setUp(self):
+        self.sequence = [65, 67, 37, 14]
+        self.operations = SeekOperations(self.sequence, 53)
+        self.pairs = [(53, 65), (65, 67), (67, 37), (37, 14)]
+
+    def test_behaves_like_a_list_of_pairs(self):
+        self.assertEqual(len(self.operations), 4)
+        self.assertEqual(list(self.operations), self.pairs)
+        self.assertEqual(self.operations[0], (53, 65))
+        self.assertEqual(self.operations[-1], (37, 14))
+        self.assertEqual(self.operations[1:3], self.pairs[1:3])
+        self.assertEqual(self.operations[::-2], self.pairs[::-2])
+        with self.assertRaises(IndexError):
+            self.operations[4]
+
+    def test_equality(self):
+        self.assertEqual(self.operations, self.pairs)
+        self.assertEqual(self.operations, [list(pair) for pair in self.pairs])
+        self.assertEqual(self.operations, SeekOperations(list(self.sequence), 53))
+        self.assertNotEqual(self.operations, SeekOperations(self.sequence, 0))
+        self.assertNotEqual(self.operations, self.pairs[:-1])
+
+    def test_tolist(self):
+        self.assertEqual(self.operations.tolist(), [list(pair) for pair in self.pairs])
+        self.assertEqual(SeekOperations([], 10).tolist(), [])
+
+    def test_is_a_view_of_the_sequence(self):
+        result = DiskScheduler([98, 183, 37], 53, 200).simulate("FCFS")
+        self.assertIs(result["seek_operations"].sequence, result["sequence"])
+        self.assertEqual(result["seek_operations"], [(53, 98), (98, 183), (183, 37)])
+
+
+if __name__ == "__main__":
+    unittest.main()
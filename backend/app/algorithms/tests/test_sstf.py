@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from app.algorithms import DiskScheduler
+
+
+def baseline_sstf(requests, initial_position):
+    """The original O(n^2) SSTF: nearest remaining request, earliest in arrival order on ties"""
+    remaining = list(requests)
+    position = initial_position
+    sequence = []
+    while remaining:
+        closest = min(remaining, key=lambda track: abs(track - position))
+        sequence.append(closest)
+        remaining.remove(closest)
+        position = closest
+    return sequence
+
+
+class SSTFTest(unittest.TestCase):
+    def test_textbook_example(self):
+        sequence, total, _ = DiskScheduler([98, 183, 37, 122, 14, 124, 65, 67], 53, 200).sstf()
+        self.assertEqual(sequence, [65, 67, 37, 14, 98, 122, 124, 183])
+        self.assertEqual(total, 236)
+
+    def test_tie_goes_to_earlier_request(self):
+        self.assertEqual(DiskScheduler([60, 40], 50, 100).sstf()[0], [60, 40])
+        self.assertEqual(DiskScheduler([40, 60], 50, 100).sstf()[0], [40, 60])
+
+    def test_duplicates_are_serviced_together(self):
+        self.assertEqual(DiskScheduler([10, 30, 10, 30], 20, 100).sstf()[0], [10, 10, 30, 30])
+
+    def test_matches_baseline_on_random_inputs(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            disk_size = rng.choice([1, 5, 20, 200])
+            requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 150))]
+            initial_position = rng.randrange(disk_size)
+            with self.subTest(requests=requests, initial_position=initial_position):
+                sequence, total, _ = DiskScheduler(requests, initial_position, disk_size).sstf()
+                expected = baseline_sstf(requests, initial_position)
+                self.assertEqual(sequence, expected)
+                self.assertEqual(total, sum(abs(b - a) for a, b in zip([initial_position] + expected, expected)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import io
+import os
+import struct
+import tempfile
+import unittest
+
+from app.algorithms.trace import detect_format, load_trace, parse_blkparse, parse_csv, read_binary
+
+
+BLKPARSE = """\
+  8,0    3        1     0.000000000   697  Q   R 223490 + 8 [kjournald]
+  8,0    3        2     0.000001000   697  G   R 223490 + 8 [kjournald]
+  8,0    3        3     0.000200000   697  Q  WS 1000 + 16 [kjournald]
+  8,0    3        4     0.000300000   697  D   R 223490 + 8 [kjournald]
+CPU3 (8,0):
+ Reads Queued:           1,        4KiB
+"""
+
+
+class TraceTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name: str, content) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "wb" if isinstance(content, bytes) else "w") as f:
+            f.write(content)
+        return path
+
+
+class CSVTest(TraceTestCase):
+    def test_named_columns(self):
+        lbas, times = parse_csv(["time,LBA\n", "0.5,98\n", "# comment\n", "\n", "1.5,183\n"], time_column="time")
+        self.assertEqual((list(lbas), list(times)), ([98, 183], [0.5, 1.5]))
+
+    def test_column_index_skips_a_header(self):
+        lbas, times = parse_csv(["a;b", "1;98", "2;183"], column=1, delimiter=";")
+        self.assertEqual(list(lbas), [98, 183])
+        self.assertIsNone(times)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "no column 'lba'"):
+            parse_csv(["sector\n", "1\n"])
+        with self.assertRaisesRegex(ValueError, "row 3"):
+            parse_csv(["lba\n", "1\n", "x\n"])
+
+
+class BlkparseTest(unittest.TestCase):
+    def test_replays_one_action(self):
+        lbas, times = parse_blkparse(BLKPARSE.splitlines())
+        self.assertEqual((list(lbas), list(times)), ([223490, 1000], [0.0, 0.0002]))
+        lbas, _ = parse_blkparse(BLKPARSE.splitlines(), action="D")
+        self.assertEqual(list(lbas), [223490])
+
+
+class BinaryTest(TraceTestCase):
+    def test_read_binary(self):
+        self.assertEqual(list(read_binary(struct.pack("<3q", 1, 2, 3 << 40))), [1, 2, 3 << 40])
+        self.assertEqual(list(read_binary(struct.pack("<2i", 7, -1), "bin32")), [7, -1])
+        with self.assertRaisesRegex(ValueError, "multiple of 8"):
+            read_binary(b"\0" * 12)
+
+    def test_memory_mapped_files(self):
+        trace = load_trace(self.write("trace.i32", struct.pack("<4i", 98, 183, 37, 122)))
+        self.assertEqual((trace.format, list(trace.requests)), ("bin32", [98, 183, 37, 122]))
+        self.assertEqual(trace.requests.typecode, "q")
+        self.assertEqual(len(load_trace(self.write("empty.bin", b""))), 0)
+
+    def test_file_object(self):
+        trace = load_trace(io.BytesIO(struct.pack("<2q", 5, 6)), format="bin64")
+        self.assertEqual(list(trace.requests), [5, 6])
+
+
+class LoadTraceTest(TraceTestCase):
+    def test_sectors_per_track(self):
+        path = self.write("trace.csv", "lba\n0\n63\n64\n6400\n")
+        self.assertEqual(list(load_trace(path, sectors_per_track=64).requests), [0, 0, 1, 100])
+        with self.assertRaises(ValueError):
+            load_trace(path, sectors_per_track=0)
+
+    def test_summary(self):
+        trace = load_trace(self.write("trace.blktrace", BLKPARSE))
+        self.assertEqual(trace.summary(), {
+            "source": trace.source, "format": "blkparse", "count": 2,
+            "min_track": 1000, "max_track": 223490, "has_arrival_times": True,
+        })
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format("a/trace.CSV"), "csv")
+        self.assertEqual(detect_format("trace.txt"), "blkparse")
+        self.assertEqual(detect_format("trace.bin"), "bin64")
+        with self.assertRaisesRegex(ValueError, "Cannot infer"):
+            detect_format("trace.parquet")
+
+    def test_format_is_required_without_a_name(self):
+        with self.assertRaisesRegex(ValueError, "format is required"):
+            load_trace(io.StringIO("lba\n1\n"))
+        with self.assertRaisesRegex(ValueError, "Unknown trace format"):
+            load_trace(io.StringIO("lba\n1\n"), format="parquet")
+
+
+if __name__ == "__main__":
+    unittest.main()
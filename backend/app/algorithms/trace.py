@@ -0,0 +1,241 @@
+"""
+Trace file ingestion for replaying production I/O traces.
+
+Supported formats:
+    csv       Text with one request per row; the LBA column is chosen by name
+              or index, an optional time column provides arrival times
+    blkparse  Default blkparse text output ("8,0 3 1 0.000000000 697 Q R 223490 + 8 [proc]");
+              events of one action (Q by default) are replayed
+    bin32     Packed little-endian int32 LBAs
+    bin64     Packed little-endian int64 LBAs
+
+Binary traces are memory-mapped and copied into an ``array`` in one block
+move; text traces are parsed line by line. Requests are returned as compact
+``array('q')`` buffers rather than Python lists so multi-million entry
+traces stay small in memory.
+"""
+
+import csv
+import mmap
+import os
+import sys
+from array import array
+from typing import IO, Iterable, Optional, Union
+
+from .seek import np
+
+
+FORMATS = ("csv", "blkparse", "bin32", "bin64")
+
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".blkparse": "blkparse",
+    ".blktrace": "blkparse",
+    ".txt": "blkparse",
+    ".bin": "bin64",
+    ".i64": "bin64",
+    ".i32": "bin32",
+}
+
+_BINARY_TYPECODES = {"bin32": "i", "bin64": "q"}
+
+
+class Trace:
+    """Requests (and optional arrival times) loaded from a trace"""
+
+    __slots__ = ("requests", "arrival_times", "source", "format")
+
+    def __init__(self, requests: array, arrival_times: Optional[array] = None,
+                 source: Optional[str] = None, format: Optional[str] = None):
+        self.requests = requests
+        self.arrival_times = arrival_times
+        self.source = source
+        self.format = format
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def summary(self) -> dict:
+        """Short description used in API responses instead of echoing every request"""
+        return {
+            "source": self.source,
+            "format": self.format,
+            "count": len(self.requests),
+            "min_track": min(self.requests) if len(self.requests) else None,
+            "max_track": max(self.requests) if len(self.requests) else None,
+            "has_arrival_times": self.arrival_times is not None,
+        }
+
+
+def detect_format(path: str) -> str:
+    """Guess the trace format from a file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"Cannot infer trace format from '{path}'. Specify one of: {', '.join(FORMATS)}")
+    return _EXTENSIONS[extension]
+
+
+def _to_tracks(lbas: array, sectors_per_track: int) -> array:
+    """Map LBAs to tracks (integer division), vectorized when NumPy is available"""
+    if sectors_per_track == 1:
+        return lbas if lbas.typecode == "q" else array("q", lbas)
+    if sectors_per_track < 1:
+        raise ValueError("sectors_per_track must be at least 1")
+    if np is not None:
+        tracks = np.frombuffer(lbas, dtype=lbas.typecode).astype(np.int64) // sectors_per_track
+        result = array("q")
+        result.frombytes(tracks.tobytes())
+        return result
+    return array("q", (lba // sectors_per_track for lba in lbas))
+
+
+def read_binary(buffer, format: str = "bin64") -> array:
+    """
+    Decode packed little-endian LBAs from a bytes-like object
+
+    Args:
+        buffer: bytes, bytearray, memoryview or mmap
+        format: "bin32" or "bin64"
+    """
+    typecode = _BINARY_TYPECODES[format]
+    lbas = array(typecode)
+    if len(buffer) % lbas.itemsize:
+        raise ValueError(f"{format} trace size is not a multiple of {lbas.itemsize} bytes")
+    lbas.frombytes(buffer)
+    if sys.byteorder == "big":
+        lbas.byteswap()
+    return lbas
+
+
+def _load_binary_file(path: str, format: str) -> array:
+    if os.path.getsize(path) == 0:
+        return array(_BINARY_TYPECODES[format])
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return read_binary(mapped, format)
+
+
+def parse_csv(lines: Iterable[str], column: Union[str, int] = "lba", time_column: Union[str, int, None] = None,
+              delimiter: str = ","):
+    """
+    Parse CSV trace rows
+
+    Args:
+        lines: Iterable of text lines
+        column: Header name or zero-based index of the LBA column
+        time_column: Header name or index of an arrival time column (optional)
+        delimiter: Field delimiter
+
+    Returns:
+        Tuple of (lbas array('q'), arrival_times array('d') or None)
+    """
+    rows = csv.reader(lines, delimiter=delimiter)
+    lbas = array("q")
+    times = array("d") if time_column is not None else None
+    named = isinstance(column, str) or isinstance(time_column, str)
+    column_index, time_index = (None, None) if named else (column, time_column)
+    first_row = True
+    for row_number, row in enumerate(rows, start=1):
+        if not row or row[0].lstrip().startswith("#"):
+            continue
+        if column_index is None:
+            # Header row names the columns
+            header = [name.strip().lower() for name in row]
+            column_index = _column_index(header, column)
+            if time_column is not None:
+                time_index = _column_index(header, time_column)
+            first_row = False
+            continue
+        try:
+            lbas.append(int(row[column_index]))
+            if times is not None:
+                times.append(float(row[time_index]))
+        except (IndexError, ValueError):
+            if first_row:
+                first_row = False
+                continue  # header row of a file addressed by column index
+            raise ValueError(f"Invalid CSV trace row {row_number}: {row}")
+        first_row = False
+    return lbas, times
+
+
+def _column_index(header, column: Union[str, int]) -> int:
+    if isinstance(column, int):
+        return column
+    try:
+        return header.index(column.strip().lower())
+    except ValueError:
+        raise ValueError(f"CSV trace header has no column '{column}'")
+
+
+def parse_blkparse(lines: Iterable[str], action: str = "Q"):
+    """
+    Parse default-format blkparse output
+
+    Args:
+        lines: Iterable of text lines
+        action: Event action to replay (Q = queued, D = issued, C = completed)
+
+    Returns:
+        Tuple of (sector array('q'), timestamp array('d'))
+    """
+    lbas = array("q")
+    times = array("d")
+    for line in lines:
+        fields = line.split()
+        # dev cpu seq time pid action rwbs sector + blocks [process]
+        if len(fields) < 8 or fields[5] != action or not fields[7].isdigit():
+            continue
+        lbas.append(int(fields[7]))
+        times.append(float(fields[3]))
+    return lbas, times
+
+
+def _text_lines(source: Union[str, IO]):
+    """Iterate decoded lines of a path or (binary or text) file object"""
+    if isinstance(source, str):
+        with open(source, "r", newline="") as f:
+            yield from f
+        return
+    for line in source:
+        yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+
+def load_trace(source: Union[str, IO], format: Optional[str] = None, sectors_per_track: int = 1,
+               column: Union[str, int] = "lba", time_column: Union[str, int, None] = None,
+               delimiter: str = ",", action: str = "Q") -> Trace:
+    """
+    Load a trace from a file path or file object
+
+    Args:
+        source: Path, or a file object (binary formats need a binary file object)
+        format: One of FORMATS; inferred from the file extension for paths
+        sectors_per_track: LBAs per track used to map addresses to tracks
+        column: CSV LBA column (name or index)
+        time_column: CSV arrival time column (name or index), optional
+        delimiter: CSV delimiter
+        action: blkparse event action to replay
+
+    Returns:
+        Trace with requests as array('q') tracks
+    """
+    name = source if isinstance(source, str) else getattr(source, "name", None)
+    if format is None:
+        if name is None:
+            raise ValueError(f"format is required. Available: {', '.join(FORMATS)}")
+        format = detect_format(name)
+    format = format.lower()
+    if format not in FORMATS:
+        raise ValueError(f"Unknown trace format '{format}'. Available: {', '.join(FORMATS)}")
+
+    times = None
+    if format in _BINARY_TYPECODES:
+        if isinstance(source, str):
+            lbas = _load_binary_file(source, format)
+        else:
+            lbas = read_binary(source.read(), format)
+    elif format == "csv":
+        lbas, times = parse_csv(_text_lines(source), column=column, time_column=time_column, delimiter=delimiter)
+    else:
+        lbas, times = parse_blkparse(_text_lines(source), action=action)
+
+    return Trace(_to_tracks(lbas, sectors_per_track), times, source=name, format=format)
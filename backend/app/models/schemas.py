@@ -9,6 +9,8 @@ class SimulationRequest(BaseModel):
     algorithm: str = Field(..., description="Algorithm name: FCFS, SSTF, SCAN, C-SCAN, LOOK, C-LOOK")
     disk_size: int = Field(default=200, ge=1, description="Total disk size (number of tracks)")
     direction: Optional[str] = Field(default="right", description="Initial direction for SCAN/C-SCAN/LOOK/C-LOOK")
+    arrival_times: Optional[List[float]] = Field(default=None, description="Arrival time of each request; enables the event-driven simulation")
+    time_per_track: Optional[float] = Field(default=1.0, ge=0, description="Head travel time per track in the event-driven simulation")
 
 
 class AlgorithmResult(BaseModel):
@@ -17,7 +19,7 @@ class AlgorithmResult(BaseModel):
     sequence: List[int] = Field(..., description="Order of track accesses")
     total_seek_time: int = Field(..., description="Total seek time (distance traveled)")
     average_seek_time: float = Field(..., description="Average seek time")
-    seek_operations: List[tuple] = Field(..., description="List of (from, to) seek operations")
+    seek_operations: Optional[List[tuple]] = Field(default=None, description="List of (from, to) seek operations; omitted in compact responses")
 
 
 class SimulationResponse(BaseModel):
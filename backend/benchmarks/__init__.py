@@ -0,0 +1 @@
+# Benchmarks for the disk scheduling algorithms
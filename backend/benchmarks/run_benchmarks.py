@@ -0,0 +1,217 @@
+"""
+Benchmark harness for the DiskScheduler algorithms.
+
+Runs every algorithm over generated workloads of increasing size, records
+wall time, peak memory and total seek, and writes the results as JSON.
+The regression gate fails (exit status 1) when an algorithm's runtime grows
+faster than allowed with input size, e.g. if SSTF turns quadratic again, or
+when it is slower than a saved baseline by more than the given tolerance.
+
+Usage (from backend/):
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 10,1000,100000,10000000 --distributions uniform,zipf
+    python -m benchmarks.run_benchmarks --check --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from app.algorithms import native
+from app.algorithms.disk_scheduling import DiskScheduler, np
+from app.algorithms.registry import registry
+
+from .workloads import DISTRIBUTIONS
+
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+
+# Direction and N-Step SCAN batch size used for every run
+DIRECTION = "right"
+N_STEP = 4
+
+
+def _run_once(engine, requests: List[int], initial_position: int, disk_size: int):
+    scheduler = DiskScheduler(requests, initial_position, disk_size)
+    return engine(scheduler, DIRECTION, N_STEP)
+
+
+def measure(engine, requests: List[int], initial_position: int, disk_size: int, repeat: int) -> dict:
+    """Best-of-repeat wall time, plus peak traced memory from a separate run"""
+    best = math.inf
+    total_seek = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _, total_seek, *_ = _run_once(engine, requests, initial_position, disk_size)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        _run_once(engine, requests, initial_position, disk_size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_time_s": best, "peak_memory_bytes": peak, "total_seek_time": total_seek}
+
+
+def run(sizes, distributions, algorithms, disk_size: int, repeat: int, seed: int, time_budget: float,
+        engine: Optional[str] = None) -> List[dict]:
+    """
+    Run the benchmark matrix
+
+    algorithms are registry specs; each runs with the given engine (its
+    default engine when None).
+
+    Larger sizes are skipped for an algorithm/distribution once one run
+    exceeds time_budget seconds, so a pathological algorithm cannot stall
+    the whole suite.
+    """
+    results = []
+    for distribution in distributions:
+        generator = DISTRIBUTIONS[distribution]
+        over_budget = set()
+        for size in sizes:
+            requests = generator(size, disk_size, seed=seed)
+            initial_position = disk_size // 2
+            for spec in algorithms:
+                label = spec.name
+                if label in over_budget:
+                    continue
+                record = {"algorithm": label, "distribution": distribution, "size": size, "disk_size": disk_size}
+                record.update(measure(spec.engine(engine), requests, initial_position, disk_size, repeat))
+                results.append(record)
+                print(f"{distribution:>10} {label:>12} n={size:<9} {record['wall_time_s']:.6f}s "
+                      f"peak={record['peak_memory_bytes'] / 1e6:.1f}MB", file=sys.stderr)
+                if record["wall_time_s"] > time_budget:
+                    over_budget.add(label)
+    return results
+
+
+def scaling_exponents(results: List[dict], min_size: int) -> Dict[str, float]:
+    """
+    Empirical exponent k in time ~ n^k per algorithm/distribution, from the
+    smallest and largest measured sizes at or above min_size
+    """
+    grouped = {}
+    for record in results:
+        if record["size"] >= min_size and record["wall_time_s"] > 0:
+            grouped.setdefault((record["algorithm"], record["distribution"]), []).append(record)
+    exponents = {}
+    for (algorithm, distribution), records in grouped.items():
+        records.sort(key=lambda r: r["size"])
+        low, high = records[0], records[-1]
+        if high["size"] == low["size"]:
+            continue
+        exponent = math.log(high["wall_time_s"] / low["wall_time_s"]) / math.log(high["size"] / low["size"])
+        exponents[f"{algorithm}/{distribution}"] = round(exponent, 3)
+    return exponents
+
+
+def check(results: List[dict], exponents: Dict[str, float], max_exponent: float,
+          baseline: Optional[List[dict]], tolerance: float) -> List[str]:
+    """Return a list of regression messages (empty when the gate passes)"""
+    failures = [
+        f"{key}: runtime scales as n^{exponent} (limit n^{max_exponent})"
+        for key, exponent in sorted(exponents.items())
+        if exponent > max_exponent
+    ]
+    if baseline:
+        previous = {(r["algorithm"], r["distribution"], r["size"]): r for r in baseline}
+        for record in results:
+            old = previous.get((record["algorithm"], record["distribution"], record["size"]))
+            # Tiny inputs are dominated by timer noise
+            if old is None or old["wall_time_s"] < 1e-3:
+                continue
+            if record["wall_time_s"] > old["wall_time_s"] * tolerance:
+                failures.append(
+                    f"{record['algorithm']}/{record['distribution']} n={record['size']}: "
+                    f"{record['wall_time_s']:.4f}s vs baseline {old['wall_time_s']:.4f}s"
+                )
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the disk scheduling algorithms")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated request counts")
+    parser.add_argument("--distributions", default=",".join(DISTRIBUTIONS),
+                        help=f"comma-separated workloads ({', '.join(DISTRIBUTIONS)})")
+    parser.add_argument("--algorithms", default=",".join(registry.names("compare")),
+                        help="comma-separated algorithm names")
+    parser.add_argument("--engine", help="algorithm engine to benchmark (default: each algorithm's default)")
+    parser.add_argument("--disk-size", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-budget", type=float, default=30.0,
+                        help="skip larger sizes for a case once a run exceeds this many seconds")
+    parser.add_argument("--output", default="benchmarks/results.json")
+    parser.add_argument("--check", action="store_true", help="enable the regression gate")
+    parser.add_argument("--max-exponent", type=float, default=1.35,
+                        help="largest allowed runtime scaling exponent")
+    parser.add_argument("--gate-min-size", type=int, default=1000,
+                        help="ignore sizes below this when fitting the exponent")
+    parser.add_argument("--baseline", help="previous results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.5,
+                        help="allowed slowdown factor versus the baseline")
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    distributions = [d.strip() for d in args.distributions.split(",")]
+    unknown = [d for d in distributions if d not in DISTRIBUTIONS]
+    if unknown:
+        parser.error(f"unknown distribution(s): {', '.join(unknown)}")
+    try:
+        algorithms = [registry.get(name) for name in args.algorithms.split(",")]
+        for spec in algorithms:
+            spec.engine(args.engine)
+    except ValueError as e:
+        parser.error(str(e))
+
+    results = run(sizes, distributions, algorithms, args.disk_size, args.repeat, args.seed, args.time_budget,
+                  engine=args.engine)
+    exponents = scaling_exponents(results, args.gate_min_size)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "native": native.available(),
+        },
+        "parameters": {
+            "sizes": sizes,
+            "distributions": distributions,
+            "disk_size": args.disk_size,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+        "scaling_exponents": exponents,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {len(results)} results to {args.output}", file=sys.stderr)
+
+    if args.check:
+        failures = check(results, exponents, args.max_exponent, baseline, args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            return 1
+        print("regression gate passed", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from app.algorithms.registry import registry
+from benchmarks import run_benchmarks
+from benchmarks.workloads import DISTRIBUTIONS
+
+
+def record(algorithm, size, wall_time_s, distribution="uniform"):
+    return {"algorithm": algorithm, "distribution": distribution, "size": size, "wall_time_s": wall_time_s}
+
+
+class WorkloadTest(unittest.TestCase):
+    def test_deterministic_and_in_range(self):
+        for name, generator in DISTRIBUTIONS.items():
+            with self.subTest(distribution=name):
+                requests = generator(500, 1000, seed=3)
+                self.assertEqual(len(requests), 500)
+                self.assertEqual(requests, generator(500, 1000, seed=3))
+                self.assertTrue(all(0 <= r < 1000 for r in requests))
+
+
+class ScalingExponentTest(unittest.TestCase):
+    def test_linear_and_quadratic(self):
+        results = [record("FCFS", 1000, 0.01), record("FCFS", 100000, 1.0),
+                   record("SSTF", 1000, 0.01), record("SSTF", 10000, 1.0)]
+        self.assertEqual(run_benchmarks.scaling_exponents(results, 1000),
+                         {"FCFS/uniform": 1.0, "SSTF/uniform": 2.0})
+
+    def test_sizes_below_the_minimum_are_ignored(self):
+        results = [record("FCFS", 10, 1e-6), record("FCFS", 1000, 0.01), record("FCFS", 10000, 0.1)]
+        self.assertEqual(run_benchmarks.scaling_exponents(results, 1000), {"FCFS/uniform": 1.0})
+
+    def test_single_size_has_no_exponent(self):
+        self.assertEqual(run_benchmarks.scaling_exponents([record("FCFS", 1000, 0.01)], 1000), {})
+
+
+class RegressionGateTest(unittest.TestCase):
+    def test_superlinear_scaling_fails(self):
+        failures = run_benchmarks.check([], {"SSTF/uniform": 2.0, "FCFS/uniform": 1.0}, 1.35, None, 1.5)
+        self.assertEqual(len(failures), 1)
+        self.assertIn("SSTF/uniform", failures[0])
+
+    def test_baseline_slowdown(self):
+        baseline = [record("FCFS", 1000, 0.01), record("SSTF", 1000, 0.01), record("LOOK", 10, 1e-5)]
+        results = [record("FCFS", 1000, 0.014), record("SSTF", 1000, 0.02), record("LOOK", 10, 1e-3)]
+        failures = run_benchmarks.check(results, {}, 1.35, baseline, 1.5)
+        self.assertEqual(len(failures), 1)
+        self.assertIn("SSTF/uniform n=1000", failures[0])
+
+
+class HarnessTest(unittest.TestCase):
+    def test_run_records_every_case(self):
+        algorithms = [registry.get("FCFS"), registry.get("SSTF")]
+        with redirect_stderr(io.StringIO()):
+            results = run_benchmarks.run([10, 100], ["uniform"], algorithms, 1000, 1, 0, 30.0)
+        self.assertEqual([(r["algorithm"], r["size"]) for r in results],
+                         [("FCFS", 10), ("SSTF", 10), ("FCFS", 100), ("SSTF", 100)])
+        self.assertTrue(all(r["peak_memory_bytes"] > 0 and r["total_seek_time"] > 0 for r in results))
+
+    def test_time_budget_skips_larger_sizes(self):
+        with redirect_stderr(io.StringIO()):
+            results = run_benchmarks.run([10, 100], ["uniform"], [registry.get("FCFS")], 1000, 1, 0, -1.0)
+        self.assertEqual([r["size"] for r in results], [10])
+
+    def test_main_writes_report_and_gates(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            argv = ["--sizes", "10,100", "--distributions", "uniform", "--algorithms", "FCFS",
+                    "--disk-size", "1000", "--repeat", "1", "--output", output]
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(run_benchmarks.main(argv), 0)
+                with open(output) as f:
+                    report = json.load(f)
+                self.assertEqual(len(report["results"]), 2)
+                self.assertEqual(report["parameters"]["sizes"], [10, 100])
+                # An impossible exponent limit trips the gate
+                self.assertEqual(run_benchmarks.main(argv + ["--check", "--gate-min-size", "10",
+                                                             "--max-exponent", "-100"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
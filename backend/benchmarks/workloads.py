@@ -0,0 +1,55 @@
+"""
+Synthetic request workloads for benchmarking the scheduling algorithms.
+
+Every generator is deterministic for a given seed so results are comparable
+between runs and machines.
+"""
+
+import random
+from itertools import accumulate
+from typing import List
+
+
+def uniform(n: int, disk_size: int, seed: int = 0) -> List[int]:
+    """Requests spread evenly over the whole disk"""
+    rng = random.Random(seed)
+    return [rng.randrange(disk_size) for _ in range(n)]
+
+
+def zipf(n: int, disk_size: int, seed: int = 0, exponent: float = 1.1, hot_tracks: int = 1024) -> List[int]:
+    """Hot-spot workload: a few tracks receive most requests (Zipf-distributed ranks)"""
+    rng = random.Random(seed)
+    hot_tracks = min(hot_tracks, disk_size)
+    tracks = rng.sample(range(disk_size), hot_tracks)
+    cumulative = list(accumulate(1.0 / (rank ** exponent) for rank in range(1, hot_tracks + 1)))
+    return rng.choices(tracks, cum_weights=cumulative, k=n)
+
+
+def sequential(n: int, disk_size: int, seed: int = 0, run_length: int = 64) -> List[int]:
+    """Runs of consecutive tracks starting at random positions (streaming reads)"""
+    rng = random.Random(seed)
+    requests = []
+    while len(requests) < n:
+        start = rng.randrange(disk_size)
+        length = min(rng.randint(1, 2 * run_length), n - len(requests))
+        requests.extend((start + offset) % disk_size for offset in range(length))
+    return requests
+
+
+def bimodal(n: int, disk_size: int, seed: int = 0) -> List[int]:
+    """Two clusters around a quarter and three quarters of the disk"""
+    rng = random.Random(seed)
+    spread = disk_size / 16
+    requests = []
+    for _ in range(n):
+        center = disk_size / 4 if rng.random() < 0.5 else 3 * disk_size / 4
+        requests.append(min(disk_size - 1, max(0, int(rng.gauss(center, spread)))))
+    return requests
+
+
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "zipf": zipf,
+    "sequential": sequential,
+    "bimodal": bimodal,
+}
@@ -36,6 +36,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.TimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -129,6 +130,52 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Disk scheduler engine settings
+DISK_SCHEDULER = {
+    # Worker processes used to run /api/compare/ in parallel (None = number of CPUs)
+    'COMPARE_POOL_SIZE': None,
+    # Inputs with fewer requests than this are compared serially (None disables the pool)
+    'COMPARE_PARALLEL_THRESHOLD': 50000,
+    # /api/compare/ computes the exact minimum total wait (an O(m^2) DP over m distinct
+    # tracks) up to this many tracks, and a cheap lower bound beyond; "optimal_wait": true
+    # in the payload raises the limit to 2048
+    'COMPARE_OPTIMAL_WAIT_TRACKS': 256,
+    # Maximum number of workloads accepted by /api/batch/ in one request
+    'BATCH_MAX_ITEMS': 1000,
+    # Memoization of simulate/compare results keyed on a hash of the canonical input.
+    # BACKEND: 'local' (in-process LRU), 'django' (Django cache ALIAS) or None to disable
+    'RESULT_CACHE': {
+        'BACKEND': 'local',
+        'MAX_ENTRIES': 256,
+        'TTL': 300,
+        'ALIAS': 'default',
+    },
+    # Add a Server-Timing header with per-phase durations to every response
+    'SERVER_TIMING': True,
+    # Executor lanes of the async views (/api/async/...). Workloads with at least
+    # LARGE_REQUEST_THRESHOLD requests use the large lane; a lane rejects new jobs
+    # (429) once WORKERS + QUEUE are outstanding, and callers get 503 after TIMEOUT seconds
+    'ASYNC': {
+        'LARGE_REQUEST_THRESHOLD': 100000,
+        'SMALL_WORKERS': 4,
+        'SMALL_QUEUE': 64,
+        'LARGE_WORKERS': 1,
+        'LARGE_QUEUE': 2,
+        'TIMEOUT': 60,
+    },
+    # Background jobs (/api/jobs/): status and results are stored as JSON files in
+    # DIRECTORY and deleted TTL seconds after the job finishes; at most MAX_PENDING
+    # jobs may be queued or running (429 beyond that). Unfinished jobs are refreshed
+    # every HEARTBEAT seconds so other worker processes can tell they are alive
+    'JOBS': {
+        'DIRECTORY': BASE_DIR / 'job_store',
+        'WORKERS': 2,
+        'MAX_PENDING': 100,
+        'TTL': 86400,
+        'HEARTBEAT': 5,
+    },
+}
+
 # CORS settings
 # Allow common React development ports
 CORS_ALLOWED_ORIGINS = [